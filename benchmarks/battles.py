@@ -0,0 +1,117 @@
+"""
+Benchmarks battle detection per live timing tick.
+
+Replays the F1 states of a recorded archive through a BattleDetector, or a
+synthetic 20 car session without one, and reports the cost of each tick.
+
+    $ python benchmarks/battles.py archives/bahrain-race
+    $ python benchmarks/battles.py --ticks 5000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from mvf1.archive import ArchiveReader
+from mvf1.archive import apply_record
+from mvf1.battles import BattleDetector
+
+
+def archive_states(path: str) -> list:
+    """
+    Returns the successive F1 states of an archive.
+    """
+    states = {}
+    ticks = []
+
+    for record in ArchiveReader(path).records():
+        apply_record(states, record)
+
+        if record["series"] == "f1":
+            ticks.append(states["f1"])
+
+    return ticks
+
+
+def synthetic_states(ticks: int, drivers: int = 20, seed: int = 1) -> list:
+    """
+    Returns states of a session where the gaps of the cars random walk.
+    """
+    generator = random.Random(seed)
+    gaps = [number * 1.2 for number in range(drivers)]
+    states = []
+
+    for tick in range(ticks):
+        gaps = [0.0] + [max(gap + generator.gauss(0, 0.05), 0.0)
+                        for gap in gaps[1:]]
+        order = sorted(range(drivers), key=lambda number: gaps[number])
+        lines = {}
+
+        for position, number in enumerate(order, start=1):
+            ahead = gaps[order[position - 2]] if position > 1 else 0.0
+            lines[str(number + 1)] = {
+                "Position": str(position),
+                "GapToLeader": f"+{gaps[number]:.3f}",
+                "IntervalToPositionAhead": {
+                    "Value": f"+{gaps[number] - ahead:.3f}"
+                },
+                "InPit": False,
+            }
+
+        states.append({"TimingData": {"Lines": lines}})
+
+    return states
+
+
+def run(states: list, threshold: float = 1.0) -> dict:
+    """
+    Times BattleDetector.ingest for every state.
+
+    Returns
+    -------
+    dict
+        Ticks, battle events, and mean, median and 99th percentile cost of
+        a tick in microseconds.
+    """
+    detector = BattleDetector(threshold=threshold)
+    costs = []
+    events = 0
+
+    for state in states:
+        start = time.perf_counter_ns()
+        events += len(detector.ingest(state, at=0.0))
+        costs.append((time.perf_counter_ns() - start) / 1000)
+
+    costs.sort()
+
+    return {"ticks": len(costs),
+            "events": events,
+            "mean_us": statistics.fmean(costs) if costs else None,
+            "median_us": statistics.median(costs) if costs else None,
+            "p99_us": costs[int(len(costs) * 0.99)] if costs else None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("archive", nargs="?",
+                        help="Archive recorded with mvf1-cli record.")
+    parser.add_argument("--ticks", type=int, default=2000,
+                        help="Ticks of the synthetic session.")
+    parser.add_argument("--threshold", type=float, default=1.0)
+    args = parser.parse_args()
+
+    if args.archive:
+        states = archive_states(args.archive)
+    else:
+        states = synthetic_states(args.ticks)
+
+    result = run(states, args.threshold)
+
+    print(f"{result['ticks']} ticks, {result['events']} battle events")
+    print(f"per tick: mean {result['mean_us']:.1f} us, "
+          f"median {result['median_us']:.1f} us, "
+          f"p99 {result['p99_us']:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
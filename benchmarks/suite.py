@@ -0,0 +1,398 @@
+"""
+Benchmarks the hot paths of the client, command line and MCP server.
+
+Runs against an in-process MockServer, so no MultiViewer is needed, and
+writes the results as JSON to compare them across versions.
+
+    $ python benchmarks/suite.py --output benchmarks.json
+    $ python benchmarks/suite.py --quick --only operations round_trips
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from mvf1 import MultiViewerForF1
+from mvf1 import __version__
+from mvf1.mock import MockServer
+from mvf1.mock import SyntheticTiming
+from mvf1.mvf1 import Player
+from mvf1.mvf1 import PlayerIndex
+from mvf1.replay import SimulatedPlayers
+
+
+# Client calls timed by `operations`, one per MultiViewerForF1 method. The
+# player deleted goes last so the others find their players.
+CALLS = {
+    "live_timing_clock": lambda client: client.live_timing_clock,
+    "live_timing_state": lambda client: client.live_timing_state,
+    "f1_live_timing_clock": lambda client: client.f1_live_timing_clock,
+    "f1_live_timing_state": lambda client: client.f1_live_timing_state,
+    "f1_live_timing_topics": lambda client: client.f1_live_timing_topics(
+        ["LapCount", "TimingData"]
+    ),
+    "fiawec_live_timing_state":
+        lambda client: client.fiawec_live_timing_state,
+    "players": lambda client: client.players,
+    "players_data": lambda client: client.players_data(
+        ["id", "state.paused", "streamData.title"]
+    ),
+    "system_info": lambda client: client.system_info,
+    "version": lambda client: client.version,
+    "player": lambda client: client.player(1),
+    "player_create": lambda client: client.player_create(
+        1, driver_tla="VER", x=0, y=0, width=640, height=360
+    ),
+    "player_seek_to": lambda client: client.player_seek_to(1, absolute=60),
+    "player_set_bounds": lambda client: client.player_set_bounds(
+        1, x=0, y=0, width=640, height=360
+    ),
+    "player_set_volume": lambda client: client.player_set_volume(1, 50),
+    "player_set_paused": lambda client: client.player_set_paused(1, True),
+    "player_set_fullscreen":
+        lambda client: client.player_set_fullscreen(1, False),
+    "player_set_muted": lambda client: client.player_set_muted(1, True),
+    "player_set_speedometer_visibility":
+        lambda client: client.player_set_speedometer_visibility(1, True),
+    "player_set_driver_header_mode":
+        lambda client: client.player_set_driver_header_mode(1, "NONE"),
+    "player_set_always_on_top":
+        lambda client: client.player_set_always_on_top(1, False),
+    "player_sync": lambda client: client.player_sync(1),
+    "player_sync_to_commentary":
+        lambda client: client.player_sync_to_commentary(),
+    "batch_10": lambda client: batch(client, 10),
+    "player_delete": lambda client: client.player_delete(3),
+}
+
+# MCP tools timed by `mcp_round_trips`, with their arguments.
+TOOLS = {
+    "version": {},
+    "players": {},
+    "players_fields": {"fields": ["state.paused", "streamData.title"]},
+    "player_set_volume": {"id": 1, "volume": 50},
+    "f1_standings": {},
+}
+
+
+def batch(client: MultiViewerForF1, size: int) -> list:
+    mutations = client.batch()
+
+    for _ in range(size):
+        mutations.player_set_volume(1, 50)
+
+    return mutations.execute()
+
+
+def summary(costs: list) -> dict:
+    """
+    Returns the mean, median, 99th percentile and minimum of costs in
+    microseconds.
+    """
+    costs = sorted(costs)
+
+    return {"runs": len(costs),
+            "mean_us": statistics.fmean(costs),
+            "median_us": statistics.median(costs),
+            "p99_us": costs[int(len(costs) * 0.99)],
+            "min_us": costs[0]}
+
+
+def measure(function, repeat: int, warmup: int = 3) -> dict:
+    """
+    Times `repeat` calls of a function after `warmup` untimed ones.
+    """
+    for _ in range(warmup):
+        function()
+
+    costs = []
+
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        function()
+        costs.append((time.perf_counter_ns() - start) / 1000)
+
+    return summary(costs)
+
+
+def players_server(count: int = 3) -> MockServer:
+    server = MockServer()
+
+    for index in range(count):
+        server.players.create({"contentId": 1,
+                               "streamTitle": ("INTERNATIONAL" if index == 0
+                                               else f"D{index:02d}")})
+
+    return server
+
+
+class CannedEndpoint(object):
+    """
+    Endpoint that serializes each operation, as HTTPEndpoint does, and
+    answers the response the mock server gave the first time.
+    """
+
+    def __init__(self, server: MockServer):
+        self.server = server
+        self.responses = {}
+
+    def __call__(self, operation, variables=None):
+        query = bytes(operation).decode("utf-8")
+
+        if query not in self.responses:
+            self.responses[query] = self.server.execute(query, variables)
+
+        return self.responses[query]
+
+
+def operations(repeat: int) -> dict:
+    """
+    Client overhead of every method without transport: Operation
+    construction, serialization and handling of the response.
+    """
+    server = players_server()
+    client = MultiViewerForF1()
+    client.endpoint = CannedEndpoint(server)
+    results = {}
+
+    try:
+        for name, call in CALLS.items():
+            results[name] = measure(lambda: call(client), repeat)
+    finally:
+        server.stop()
+
+    return results
+
+
+def player_construction(repeat: int, counts=(10, 100, 1000)) -> dict:
+    """
+    Player objects and the PlayerIndex built from large player lists.
+    """
+    client = MultiViewerForF1()
+    results = {}
+
+    for count in counts:
+        players = SimulatedPlayers(create_lag=0)
+
+        for index in range(count):
+            players.create({"contentId": 1, "streamTitle": f"D{index:04d}"})
+
+        data = [player.data() for player in players.visible()]
+        built = [Player(player, remote=client) for player in data]
+        runs = max(repeat // (count // 10 or 1), 5)
+
+        results[str(count)] = {
+            "construct": measure(
+                lambda: [Player(player, remote=client) for player in data],
+                runs
+            ),
+            "index": measure(lambda: PlayerIndex().replace(built), runs),
+        }
+
+    return results
+
+
+def round_trips(repeat: int) -> dict:
+    """
+    Client calls over HTTP to a local mock server.
+    """
+    results = {}
+
+    with players_server() as server:
+        client = MultiViewerForF1(server.url)
+
+        for name in ("version", "players", "players_data",
+                     "player_set_volume", "batch_10",
+                     "f1_live_timing_state"):
+            results[name] = measure(lambda: CALLS[name](client), repeat)
+
+    return results
+
+
+def cli_cold_start(repeat: int) -> dict:
+    """
+    Seconds for mvf1-cli --help in a new interpreter, and for a bare
+    interpreter as the baseline.
+    """
+    def run(code, *args):
+        subprocess.run([sys.executable, "-c", code, *args], check=True,
+                       stdout=subprocess.DEVNULL)
+
+    return {"interpreter": measure(lambda: run("pass"), repeat, warmup=1),
+            "cli_help": measure(
+                lambda: run("from mvf1.cmdline import cli; cli()", "--help"),
+                repeat, warmup=1
+            )}
+
+
+def mcp_round_trips(repeat: int) -> dict:
+    """
+    MCP tool calls through an in-memory fastmcp client, with the server
+    talking to a local mock server over HTTP.
+    """
+    from fastmcp import Client
+    from mvf1.mcp import create_mcp_server
+
+    async def run(url):
+        results = {}
+
+        async with Client(create_mcp_server(url=url)) as client:
+            for name, arguments in TOOLS.items():
+                tool = name.split("_fields")[0]
+
+                for _ in range(3):
+                    await client.call_tool(tool, arguments)
+
+                costs = []
+
+                for _ in range(repeat):
+                    start = time.perf_counter_ns()
+                    await client.call_tool(tool, arguments)
+                    costs.append((time.perf_counter_ns() - start) / 1000)
+
+                results[name] = summary(costs)
+
+        return results
+
+    with players_server() as server:
+        return asyncio.run(run(server.url))
+
+
+class LargeTiming(object):
+    """
+    Timing source answering a fixed state.
+    """
+
+    def __init__(self, state: dict):
+        self.fixed = state
+
+    def state(self, series):
+        return self.fixed if series == "f1" else None
+
+    def live_timing_clock(self):
+        return None
+
+
+def large_state(entries: int, drivers: int = 20) -> dict:
+    """
+    Returns a race state with `entries` CarData and Position samples of
+    every car, the bulk of real live timing payloads.
+    """
+    state = SyntheticTiming(drivers=drivers).f1_state(1800.0)
+    numbers = list(state["TimingData"]["Lines"])
+    start = datetime.datetime(2024, 3, 2, 15, 0)
+
+    def utc(index):
+        moment = start + datetime.timedelta(milliseconds=index * 270)
+        return moment.isoformat(timespec="milliseconds") + "Z"
+
+    state["CarData"] = {"Entries": [
+        {"Utc": utc(index),
+         "Cars": {number: {"Channels": {"0": 11000 + index % 500,
+                                        "2": 280 + index % 40, "3": 7,
+                                        "4": 99, "5": 0, "45": 8}}
+                  for number in numbers}}
+        for index in range(entries)
+    ]}
+    state["Position"] = {"Position": [
+        {"Timestamp": utc(index),
+         "Entries": {number: {"Status": "OnTrack", "X": -1200 + index,
+                              "Y": 5400 - index, "Z": 110}
+                     for number in numbers}}
+        for index in range(entries)
+    ]}
+
+    return state
+
+
+def timing_decode(repeat: int, sizes=(10, 100, 1000)) -> dict:
+    """
+    JSON decoding of large f1LiveTimingState payloads, alone and through
+    the client over HTTP.
+    """
+    results = {}
+
+    for entries in sizes:
+        state = large_state(entries)
+        payload = json.dumps({"data": {"f1LiveTimingState": state}})
+        runs = max(repeat // (entries // 10 or 1), 5)
+
+        with MockServer(LargeTiming(state)) as server:
+            client = MultiViewerForF1(server.url)
+            results[str(entries)] = {
+                "bytes": len(payload),
+                "json_loads": measure(lambda: json.loads(payload), runs),
+                "client": measure(lambda: client.f1_live_timing_state, runs),
+            }
+
+    return results
+
+
+def battle_detection(repeat: int) -> dict:
+    """
+    BattleDetector ticks, see benchmarks/battles.py.
+    """
+    from battles import run
+    from battles import synthetic_states
+
+    return run(synthetic_states(repeat * 10))
+
+
+BENCHMARKS = {
+    "operations": (operations, 200),
+    "player_construction": (player_construction, 200),
+    "round_trips": (round_trips, 100),
+    "cli_cold_start": (cli_cold_start, 10),
+    "mcp_round_trips": (mcp_round_trips, 100),
+    "timing_decode": (timing_decode, 100),
+    "battles": (battle_detection, 200),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default="benchmarks.json",
+                        help="JSON file to write the results to.")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS,
+                        help="Benchmarks to run. Defaults to all.")
+    parser.add_argument("--quick", action="store_true",
+                        help="A tenth of the runs, for a smoke test.")
+    args = parser.parse_args()
+
+    results = {}
+
+    for name in args.only or BENCHMARKS:
+        benchmark, repeat = BENCHMARKS[name]
+        repeat = max(repeat // 10, 3) if args.quick else repeat
+        started = time.perf_counter()
+
+        try:
+            results[name] = benchmark(repeat)
+        except ImportError as e:
+            results[name] = {"skipped": str(e)}
+
+        print(f"{name}: {time.perf_counter() - started:.1f} s",
+              file=sys.stderr)
+
+    report = {"version": __version__,
+              "python": platform.python_version(),
+              "platform": platform.platform(),
+              "date": datetime.datetime.now(
+                  datetime.timezone.utc
+              ).isoformat(timespec="seconds"),
+              "quick": args.quick,
+              "results": results}
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
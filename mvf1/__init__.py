@@ -1,6 +1,8 @@
 from .mvf1 import MultiViewerForF1
 from .mvf1 import MultiViewerForF1Error
 from .mvf1 import Player
+from .mvf1 import MutationBatch
+from .mvf1 import PlayerIndex
 from .mcp import mcp
 
 __title__ = "mvf1"
@@ -0,0 +1,457 @@
+import bisect
+import gzip
+import io
+import json
+import mmap
+import os
+import time
+
+from typing import Optional
+
+from . import delta
+from .mvf1 import MultiViewerForF1Error
+
+
+INDEX = "index.json"
+FORMAT = 1
+
+# File extension of the segments of each compression.
+EXTENSIONS = {
+    "gzip": ".jsonl.gz",
+    "zstd": ".jsonl.zst",
+}
+
+
+def compressions() -> list:
+    """
+    Returns the segment compressions available here.
+
+    Returns
+    -------
+    list
+        Compression names, the preferred first.
+
+    """
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return ["gzip"]
+
+    return ["zstd", "gzip"]
+
+
+def open_segment(path, mode: str, compression: str, level=None):
+    """
+    Opens a compressed JSONL segment as text.
+
+    Parameters
+    ----------
+    path: str or file
+        Path to the segment, or a binary file object such as a memory map.
+
+    mode: str
+        'r' to read or 'w' to write.
+
+    compression: str
+        gzip or zstd.
+
+    level: int, optional
+        Compression level when writing.
+
+    Returns
+    -------
+    file
+        Text file object.
+
+    """
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8",
+                         compresslevel=level or 6)
+
+    if compression != "zstd":
+        raise MultiViewerForF1Error(f"Unknown compression {compression} - "
+                                    f"can be {', '.join(EXTENSIONS)}.")
+
+    try:
+        import zstandard
+    except ImportError:
+        raise MultiViewerForF1Error("zstandard is required for zstd "
+                                    "archives - pip install mvf1[zstd]")
+
+    if isinstance(path, str):
+        path = open(path, mode + "b")
+
+    if mode == "w":
+        stream = zstandard.ZstdCompressor(level=level or 3).stream_writer(
+            path, closefd=True
+        )
+    else:
+        stream = zstandard.ZstdDecompressor().stream_reader(
+            path, closefd=True
+        )
+
+    return io.TextIOWrapper(stream, encoding="utf-8")
+
+
+class ArchiveWriter(object):
+    """
+    Writes live timing states to a keyframe-plus-delta archive.
+
+    An archive is a directory of compressed JSONL segments and an
+    `index.json` describing them. Each segment covers about
+    `segment_seconds` and starts with a keyframe (the full state) of each
+    series it holds, followed by one patch per change, so any segment can
+    be decoded alone. Every record is written once, so writing costs about
+    the size of the changes plus one state per series and segment.
+
+    The index lists a segment as soon as it is opened, and the segment is
+    flushed every `flush_seconds`, so an archive cut short by a crash only
+    loses the tail of its last segment. The index is written when the
+    archive is created and when a segment opens, flushes and closes; a
+    segment still open has no `bytes`.
+
+    Records are JSON objects with the wall time `t` in seconds, the track
+    time `track` in milliseconds (or null), the `series` and either the
+    full `state` or the `patch` from the previous record of the series.
+
+    Parameters
+    ----------
+    path: str
+        Directory of the archive, created if needed.
+    segment_seconds: float, optional
+        Seconds covered by each segment. Defaults to 300.
+    compression: str, optional
+        gzip or zstd. Defaults to zstd when zstandard is installed.
+    level: int, optional
+        Compression level.
+    flush_seconds: float, optional
+        Seconds between flushes of the open segment. Defaults to 5.
+
+    Attributes
+    ----------
+    index: dict
+        Contents of the index, with the `segments` written so far.
+    """
+
+    def __init__(self, path: str, segment_seconds: float = 300.0,
+                 compression: Optional[str] = None,
+                 level: Optional[int] = None,
+                 flush_seconds: float = 5.0):
+        self.path = path
+        self.segment_seconds = segment_seconds
+        self.flush_seconds = flush_seconds
+        self.compression = compression or compressions()[0]
+        self.level = level
+
+        if self.compression not in EXTENSIONS:
+            raise MultiViewerForF1Error(f"Unknown compression "
+                                        f"{self.compression} - can be "
+                                        f"{', '.join(EXTENSIONS)}.")
+
+        os.makedirs(path, exist_ok=True)
+
+        if os.path.exists(os.path.join(path, INDEX)):
+            raise MultiViewerForF1Error(f"{path} already holds an archive.")
+
+        self.index = {"format": FORMAT,
+                      "compression": self.compression,
+                      "segment_seconds": segment_seconds,
+                      "created": time.time(),
+                      "series": [],
+                      "segments": []}
+
+        self.file = None
+        self.segment = None
+        self.flushed = None
+        self.states = {}
+
+        self.write_index()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, series: str, state: dict, t: Optional[float] = None,
+              track: Optional[int] = None):
+        """
+        Records the state of a series.
+
+        Parameters
+        ----------
+        series: str
+            Name of the series (e.g. 'f1').
+
+        state: dict
+            Current live timing state of the series.
+
+        t: float, optional
+            Wall time of the state in seconds. Defaults to now.
+
+        track: int, optional
+            Track time of the state in milliseconds.
+
+        """
+        t = time.time() if t is None else t
+
+        if (self.segment is not None
+                and t - self.segment["start"] >= self.segment_seconds):
+            self.roll()
+
+        if self.segment is None:
+            self.open(t)
+
+        record = {"t": t, "track": track, "series": series}
+
+        if series in self.segment["series"]:
+            patch = delta.diff(self.states[series], state)
+
+            if not patch:
+                return
+
+            record["patch"] = patch
+        else:
+            record["state"] = state
+            self.segment["series"].append(series)
+
+            if series not in self.index["series"]:
+                self.index["series"].append(series)
+
+        self.states[series] = state
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+        self.segment["end"] = t
+        self.segment["records"] += 1
+
+        if track is not None:
+            if self.segment["track_start"] is None:
+                self.segment["track_start"] = track
+            self.segment["track_end"] = track
+
+        if t - self.flushed >= self.flush_seconds:
+            self.flush(t)
+
+    def open(self, t: float):
+        number = len(self.index["segments"])
+        name = f"{number:05d}{EXTENSIONS[self.compression]}"
+
+        self.segment = {"file": name,
+                        "start": t,
+                        "end": t,
+                        "track_start": None,
+                        "track_end": None,
+                        "records": 0,
+                        "series": []}
+        self.file = open_segment(os.path.join(self.path, name), "w",
+                                 self.compression, self.level)
+        self.flushed = t
+        self.index["segments"].append(self.segment)
+        self.write_index()
+
+    def flush(self, t: float):
+        """
+        Makes the records of the open segment so far readable.
+        """
+        self.file.flush()
+        self.flushed = t
+        self.write_index()
+
+    def roll(self):
+        """
+        Closes the current segment.
+        """
+        if self.segment is None:
+            return
+
+        self.file.close()
+        self.segment["bytes"] = os.path.getsize(
+            os.path.join(self.path, self.segment["file"])
+        )
+        self.file = None
+        self.segment = None
+        self.write_index()
+
+    def write_index(self):
+        path = os.path.join(self.path, INDEX)
+
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.index, f, indent=1)
+
+        os.replace(path + ".tmp", path)
+
+    def close(self):
+        """
+        Closes the archive, writing the last segment to the index.
+        """
+        self.roll()
+
+
+class ArchiveReader(object):
+    """
+    Reads an archive written by ArchiveWriter.
+
+    Segments are memory-mapped and decoded lazily, one record at a time, so
+    reading never holds more than a record and the states in memory however
+    large the session. `state_at` seeks through the index to the segment
+    holding the nearest keyframe before a track time and only applies the
+    patches from there.
+
+    Parameters
+    ----------
+    path: str
+        Directory of the archive.
+
+    Attributes
+    ----------
+    index: dict
+        Contents of the index.
+    segments: list
+        Segments of the archive in time order.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        try:
+            with open(os.path.join(path, INDEX)) as f:
+                self.index = json.load(f)
+        except FileNotFoundError:
+            raise MultiViewerForF1Error(f"No archive found in {path}.")
+
+        if self.index.get("format") != FORMAT:
+            raise MultiViewerForF1Error(f"Unsupported archive format "
+                                        f"{self.index.get('format')}.")
+
+        self.compression = self.index["compression"]
+        self.segments = self.index["segments"]
+
+        # Segments with a track time, and their track start for bisection.
+        self.tracked = [number for number, segment in enumerate(self.segments)
+                        if segment["track_start"] is not None]
+        self.track_starts = [self.segments[number]["track_start"]
+                             for number in self.tracked]
+
+    @property
+    def start(self) -> Optional[float]:
+        return self.segments[0]["start"] if self.segments else None
+
+    @property
+    def end(self) -> Optional[float]:
+        return self.segments[-1]["end"] if self.segments else None
+
+    def segment_records(self, segment: dict):
+        """
+        Decodes the records of a segment from a memory map.
+
+        A segment left open by a crash ends with a truncated stream or
+        record, so decoding stops at the last whole record.
+
+        Parameters
+        ----------
+        segment: dict
+            Segment from the index.
+
+        Yields
+        ------
+        dict
+            Records in order.
+
+        """
+        path = os.path.join(self.path, segment["file"])
+
+        # Nothing of a segment just opened may have reached the disk yet.
+        if "bytes" not in segment and os.path.getsize(path) == 0:
+            return
+
+        with open(path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                open_segment(mapped, "r", self.compression) as lines:
+            try:
+                for line in lines:
+                    yield json.loads(line)
+            except (EOFError, ValueError):
+                if "bytes" in segment:
+                    raise
+
+    def records(self, first: int = 0):
+        """
+        Iterates over the records of the archive, one segment at a time.
+
+        Parameters
+        ----------
+        first: int, optional
+            Index of the first segment to read. Defaults to 0.
+
+        Yields
+        ------
+        dict
+            Records in time order.
+
+        """
+        for segment in self.segments[first:]:
+            yield from self.segment_records(segment)
+
+    def state_at(self, track: int, series: Optional[list] = None) -> dict:
+        """
+        Returns the live timing states at a track time.
+
+        Parameters
+        ----------
+        track: int
+            Track time in milliseconds.
+
+        series: list, optional
+            Series to return. Defaults to all the series of the archive.
+
+        Returns
+        -------
+        dict
+            States keyed by series, without the series that had no state
+            yet.
+
+        """
+        wanted = set(series or self.index["series"])
+        states = {}
+        position = bisect.bisect_right(self.track_starts, track) - 1
+
+        # A series only has a keyframe in a segment from its first change
+        # there, so walk back until every series had its keyframe.
+        for number in reversed(self.tracked[:position + 1]):
+            found = {}
+
+            for record in self.segment_records(self.segments[number]):
+                if record["track"] is not None and record["track"] > track:
+                    break
+
+                if record["series"] in wanted:
+                    apply_record(found, record)
+
+            for name, state in found.items():
+                states.setdefault(name, state)
+
+            if wanted <= set(states):
+                break
+
+        return states
+
+
+def apply_record(states: dict, record: dict):
+    """
+    Updates the states of each series with a record.
+
+    Parameters
+    ----------
+    states: dict
+        States keyed by series, updated in place.
+
+    record: dict
+        Keyframe or patch record.
+
+    """
+    if "state" in record:
+        states[record["series"]] = record["state"]
+    else:
+        states[record["series"]] = delta.apply(
+            states.get(record["series"], {}), record["patch"]
+        )
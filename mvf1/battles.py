@@ -0,0 +1,291 @@
+import time
+
+from typing import Optional
+
+from .delta import DELETED
+from .model import RaceModel
+from .mvf1 import MultiViewerForF1Error
+from .poller import F1Listener
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BattleEvent(object):
+    """
+    A battle between two consecutive cars starting or ending.
+
+    Attributes
+    ----------
+    kind: str
+        start or end.
+    ahead: str
+        Racing number of the car ahead.
+    behind: str
+        Racing number of the car behind.
+    interval: float
+        Interval between them in seconds, None if unknown.
+    at: float
+        UNIX time of the tick that detected the event.
+    """
+
+    __slots__ = ("kind", "ahead", "behind", "interval", "at")
+
+    def __init__(self, kind: str, ahead: str, behind: str,
+                 interval: Optional[float], at: float):
+        self.kind = kind
+        self.ahead = ahead
+        self.behind = behind
+        self.interval = interval
+        self.at = at
+
+    def __repr__(self) -> str:
+        return f"{self.kind} {self.behind} on {self.ahead} ({self.interval})"
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, BattleEvent)
+                and (self.kind, self.ahead, self.behind)
+                == (other.kind, other.ahead, other.behind))
+
+
+class BattleDetector(F1Listener):
+    """
+    Detects on-track battles between consecutive cars.
+
+    Positions, intervals and gaps of every driver are kept in NumPy arrays
+    indexed by a slot per driver. Each tick only writes the slots of the
+    drivers whose timing changed (from the patch of a RaceModel), then
+    finds the car ahead of every car and compares all intervals at once.
+
+    A battle starts when the interval to the car ahead drops under
+    `threshold` and ends when it grows over `release`, when either car
+    pits or retires, or when the cars are no longer consecutive. The gap
+    between the two thresholds keeps battles from flickering on and off.
+
+    Requires numpy (pip install mvf1[telemetry]).
+
+    Parameters
+    ----------
+    threshold: float, optional
+        Interval in seconds under which a battle starts. Defaults to 1.
+    release: float, optional
+        Interval in seconds over which a battle ends. Defaults to
+        threshold + 0.5.
+    model: RaceModel, optional
+        Race model to update. Defaults to a new one.
+
+    Attributes
+    ----------
+    positions: numpy.ndarray
+        Position of each slot, 0 if unknown.
+    intervals: numpy.ndarray
+        Interval to the car ahead of each slot in seconds, NaN if unknown.
+    gaps: numpy.ndarray
+        Gap to the leader of each slot in seconds, NaN if unknown.
+    active: numpy.ndarray
+        Whether each slot is battling the car ahead.
+    """
+
+    def __init__(self, threshold: float = 1.0,
+                 release: Optional[float] = None,
+                 model: Optional[RaceModel] = None):
+        if numpy is None:
+            raise MultiViewerForF1Error("numpy is required for battles - "
+                                        "pip install mvf1[telemetry]")
+
+        self.threshold = threshold
+        self.release = threshold + 0.5 if release is None else release
+        self.model = model if model is not None else RaceModel()
+        self.slots = {}
+        self.numbers = []
+        self.listeners = []
+
+        self.positions = numpy.zeros(0, dtype="i2")
+        self.intervals = numpy.zeros(0)
+        self.gaps = numpy.zeros(0)
+        self.racing = numpy.zeros(0, dtype=bool)
+        self.active = numpy.zeros(0, dtype=bool)
+        self.rivals = numpy.zeros(0, dtype="i2")
+        self.grow(32)
+
+    @property
+    def battles(self) -> list:
+        """
+        Returns the current battles.
+
+        Returns
+        -------
+        list
+            Tuples of the racing numbers of the car ahead and behind, and
+            the interval, front of the field first.
+        """
+        slots = numpy.flatnonzero(self.active[:len(self.numbers)])
+        slots = slots[numpy.argsort(self.positions[slots])]
+
+        return [(self.numbers[self.rivals[slot]], self.numbers[slot],
+                 float(self.intervals[slot])) for slot in slots]
+
+    def add_listener(self, listener):
+        """
+        Registers a callable invoked with each BattleEvent.
+
+        Parameters
+        ----------
+        listener: callable
+            Called as listener(event).
+
+        """
+        self.listeners.append(listener)
+
+    def grow(self, size: int):
+        for name, fill in (("positions", 0), ("intervals", numpy.nan),
+                           ("gaps", numpy.nan), ("racing", False),
+                           ("active", False), ("rivals", -1)):
+            array = getattr(self, name)
+            grown = numpy.full(size, fill, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def slot(self, number: str) -> int:
+        if number not in self.slots:
+            if len(self.numbers) == len(self.positions):
+                self.grow(2 * len(self.positions))
+
+            self.slots[number] = len(self.numbers)
+            self.numbers.append(number)
+
+        return self.slots[number]
+
+    def write(self, patch: dict):
+        lines = (patch.get("TimingData") or {}).get("Lines") or {}
+
+        for number in lines:
+            if number == DELETED:
+                for removed in lines[DELETED]:
+                    if removed in self.slots:
+                        slot = self.slots[removed]
+                        self.positions[slot] = 0
+                        self.racing[slot] = False
+                continue
+
+            line = self.model.lines[number]
+            slot = self.slot(number)
+
+            self.positions[slot] = line.position or 0
+            self.intervals[slot] = (numpy.nan if line.interval_seconds is None
+                                    else line.interval_seconds)
+            self.gaps[slot] = (numpy.nan if line.gap_seconds is None
+                               else line.gap_seconds)
+            self.racing[slot] = not (line.in_pit or line.retired
+                                     or line.stopped)
+
+    def detect(self, at: Optional[float] = None) -> list:
+        """
+        Compares the intervals of all cars and emits battle events.
+
+        Parameters
+        ----------
+        at: float, optional
+            UNIX time of the tick. Defaults to now.
+
+        Returns
+        -------
+        list
+            BattleEvent objects, ends before starts.
+
+        """
+        at = time.time() if at is None else at
+        count = len(self.numbers)
+        positions = self.positions[:count]
+        intervals = self.intervals[:count]
+        active = self.active[:count]
+        rivals = self.rivals[:count]
+
+        # Slot of the car in each position, then of the car ahead of each.
+        placed = positions > 0
+        by_position = numpy.full(int(positions.max(initial=0)) + 1, -1)
+        by_position[positions[placed]] = numpy.flatnonzero(placed)
+        ahead = numpy.where(placed, by_position[positions - 1], -1)
+        ahead[positions <= 1] = -1
+
+        racing = self.racing[:count] & (ahead >= 0)
+        racing &= self.racing[numpy.maximum(ahead, 0)]
+
+        with numpy.errstate(invalid="ignore"):
+            kept = active & racing & (intervals <= self.release)
+            kept &= ahead == rivals
+            started = racing & ~kept & (intervals < self.threshold)
+
+        ended = active & ~kept
+        events = [self.event("end", rivals[slot], slot, at)
+                  for slot in numpy.flatnonzero(ended)]
+        events += [self.event("start", ahead[slot], slot, at)
+                   for slot in numpy.flatnonzero(started)]
+
+        active[:] = kept | started
+        rivals[:] = numpy.where(started, ahead, numpy.where(kept, rivals, -1))
+
+        for event in events:
+            for listener in self.listeners:
+                listener(event)
+
+        return events
+
+    def event(self, kind: str, ahead: int, behind: int,
+              at: float) -> BattleEvent:
+        interval = float(self.intervals[behind])
+
+        return BattleEvent(kind, self.numbers[ahead], self.numbers[behind],
+                           None if numpy.isnan(interval) else interval, at)
+
+    def apply(self, patch: dict, at: Optional[float] = None) -> list:
+        """
+        Applies a patch of the F1 live timing state and detects battles.
+
+        Parameters
+        ----------
+        patch: dict
+            Patch from `delta.diff`.
+
+        at: float, optional
+            UNIX time of the tick. Defaults to now.
+
+        Returns
+        -------
+        list
+            BattleEvent objects.
+
+        """
+        self.model.apply(patch)
+        self.write(patch)
+
+        return self.detect(at)
+
+    def ingest(self, state: dict, at: Optional[float] = None) -> list:
+        """
+        Updates from a full F1 live timing state and detects battles.
+
+        Parameters
+        ----------
+        state: dict
+            F1 live timing state.
+
+        at: float, optional
+            UNIX time of the tick. Defaults to now.
+
+        Returns
+        -------
+        list
+            BattleEvent objects, empty if the timing did not change.
+
+        """
+        patch = self.model.ingest(state)
+
+        if not patch:
+            return []
+
+        self.write(patch)
+
+        return self.detect(at)
@@ -0,0 +1,507 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Optional
+
+from .mvf1 import CACHE_TTL
+from .mvf1 import MultiViewerForF1
+from .mvf1 import MultiViewerForF1Error
+from .sync import FIELDS
+from .sync import drift
+from .sync import find_reference
+from .sync import measurable
+
+
+def host_uri(host: str) -> str:
+    """
+    Returns the GraphQL URI of a MultiViewerForF1 host.
+
+    Parameters
+    ----------
+    host: str
+        URI, or host name with an optional port (e.g. 'wall-2' or
+        '10.0.0.12:10101').
+
+    Returns
+    -------
+    str
+        URI of the GraphQL API.
+
+    """
+    if "://" in host:
+        return host
+
+    if ":" not in host:
+        host = f"{host}:10101"
+
+    return f"http://{host}/api/graphql"
+
+
+class ClockOffset(object):
+    """
+    Estimated clock of a host.
+
+    Attributes
+    ----------
+    host: str
+        Name of the host.
+    offset: float
+        Seconds the clock of the host is ahead of the local clock.
+    rtt: float
+        Round trip time of the probe the offset was taken from, in
+        seconds. The offset is within half of it.
+    """
+
+    __slots__ = ("host", "offset", "rtt")
+
+    def __init__(self, host: str, offset: float, rtt: float):
+        self.host = host
+        self.offset = offset
+        self.rtt = rtt
+
+    def __repr__(self) -> str:
+        return (f"{self.host}: {self.offset * 1000:+.1f} ms "
+                f"(rtt {self.rtt * 1000:.1f} ms)")
+
+
+def estimate_offset(client: MultiViewerForF1, samples: int = 8,
+                    host: str = "", spacing: float = 0.01) -> ClockOffset:
+    """
+    Estimates the clock offset of a MultiViewerForF1 host, NTP style.
+
+    Each probe reads the players and takes the latest time their states
+    were sampled (`state.ts`) as the time on the host, read halfway through
+    the round trip. The probe with the shortest round trip is kept, as it
+    bounds the error best. This is the clock `drifts` moves, unlike the
+    systemTime of the live timing clock, which is a trackTime anchor.
+
+    The probes are spread over `spacing` seconds each and the host time
+    must advance with the local clock across them, so a host serving stale
+    states gets no offset rather than a wrong one.
+
+    Parameters
+    ----------
+    client: MultiViewerForF1
+        Interface to the host.
+
+    samples: int, optional
+        Number of probes, at least 2. Defaults to 8.
+
+    host: str, optional
+        Name of the host.
+
+    spacing: float, optional
+        Seconds between probes. Defaults to 0.01.
+
+    Returns
+    -------
+    ClockOffset
+        Offset of the host clock.
+
+    """
+    if samples < 2:
+        raise MultiViewerForF1Error("At least 2 probes are needed to "
+                                    "estimate a clock offset.")
+
+    best = None
+    probes = []
+
+    for sample in range(samples):
+        if sample:
+            time.sleep(spacing)
+
+        sent = time.time()
+        players = client.players_data(["state.ts"])
+        received = time.time()
+
+        stamps = [player["state"]["ts"] for player in players
+                  if (player.get("state") or {}).get("ts") is not None]
+
+        if not stamps:
+            raise MultiViewerForF1Error(f"No player of {host} reports its "
+                                        f"state - cannot estimate its "
+                                        f"offset.")
+
+        system = max(stamps)
+        probes.append((sent, system, received))
+        rtt = received - sent
+        offset = system - (sent + received) / 2
+
+        if best is None or rtt < best.rtt:
+            best = ClockOffset(host, offset, rtt)
+
+    # Between the first and the last read, the host clock advanced by no
+    # less than the time between the first reply and the last request and
+    # no more than the time between the first request and the last reply,
+    # give or take a millisecond of rounding.
+    first, last = probes[0], probes[-1]
+    advanced = last[1] - first[1]
+
+    if not (last[0] - first[2] - 0.001 <= advanced
+            <= last[2] - first[0] + 0.001):
+        raise MultiViewerForF1Error(f"Player states of {host} do not follow "
+                                    f"its clock - cannot estimate its "
+                                    f"offset.")
+
+    return best
+
+
+class HostResult(object):
+    """
+    Result of an operation on one host of a cluster.
+
+    Attributes
+    ----------
+    host: str
+        Name of the host.
+    value: object
+        Value returned by the operation, None if it failed.
+    error: Exception
+        Error raised by the operation, TimeoutError if it did not finish
+        in time, or None.
+    elapsed: float
+        Seconds until the operation finished or timed out.
+    """
+
+    __slots__ = ("host", "value", "error", "elapsed")
+
+    def __init__(self, host: str, value=None,
+                 error: Optional[Exception] = None, elapsed: float = 0.0):
+        self.host = host
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return f"{self.host}: {self.error if self.error else 'ok'}"
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class MultiViewerCluster(object):
+    """
+    Controls several MultiViewerForF1 instances at once.
+
+    Holds one MultiViewerForF1 per host and runs each operation on every
+    host concurrently from a thread pool, so a command to the whole wall
+    takes about one round trip rather than one per host. A host that fails
+    or does not answer within `timeout` seconds only fails its own result.
+
+    Parameters
+    ----------
+    hosts: list or dict
+        Hosts as accepted by `host_uri`, or URIs keyed by host name.
+    timeout: float, optional
+        Seconds each host has to answer. Defaults to 2.
+    cache_ttl: float, optional
+        Seconds a players snapshot is trusted on each host, see
+        MultiViewerForF1. Defaults to CACHE_TTL.
+    max_workers: int, optional
+        Threads of the pool. Defaults to one per host.
+
+    Attributes
+    ----------
+    clients: dict
+        MultiViewerForF1 of each host keyed by host name.
+    offsets: dict
+        Latest ClockOffset of each host keyed by host name.
+    """
+
+    def __init__(self, hosts, timeout: float = 2.0,
+                 cache_ttl: float = CACHE_TTL,
+                 max_workers: Optional[int] = None):
+        if not isinstance(hosts, dict):
+            hosts = {host: host for host in hosts}
+
+        self.timeout = timeout
+        self.clients = {}
+        self.offsets = {}
+
+        for name, host in hosts.items():
+            client = MultiViewerForF1(host_uri(host), cache_ttl=cache_ttl)
+            client.endpoint.timeout = timeout
+            self.clients[name] = client
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or max(len(self.clients), 1),
+            thread_name_prefix="mvf1-cluster",
+        )
+
+    def __enter__(self) -> "MultiViewerCluster":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def close(self):
+        """
+        Shuts down the thread pool without waiting for hung hosts.
+        """
+        self.executor.shutdown(wait=False)
+
+    def map(self, operation, timeout: Optional[float] = None) -> dict:
+        """
+        Runs an operation on every host concurrently.
+
+        Parameters
+        ----------
+        operation: callable
+            Called as operation(client) with the MultiViewerForF1 of each
+            host.
+
+        timeout: float, optional
+            Seconds to wait for the hosts. Defaults to `timeout`.
+
+        Returns
+        -------
+        dict
+            HostResult keyed by host name.
+
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+
+        def run(client):
+            value = operation(client)
+            return value, time.monotonic() - started
+
+        futures = {name: self.executor.submit(run, client)
+                   for name, client in self.clients.items()}
+        wait(futures.values(), timeout=timeout)
+        results = {}
+
+        for name, future in futures.items():
+            if not future.done():
+                future.cancel()
+                results[name] = HostResult(name, error=TimeoutError(
+                    f"{name} did not answer in {timeout} seconds."
+                ), elapsed=timeout)
+            elif future.exception() is not None:
+                results[name] = HostResult(name, error=future.exception(),
+                                           elapsed=time.monotonic() - started)
+            else:
+                value, elapsed = future.result()
+                results[name] = HostResult(name, value, elapsed=elapsed)
+
+        return results
+
+    def call(self, method: str, *args, **kwargs) -> dict:
+        """
+        Calls a MultiViewerForF1 method on every host concurrently, e.g.
+        cluster.call('player_sync_to_commentary').
+
+        Parameters
+        ----------
+        method: str
+            Name of the method.
+
+        *args, **kwargs
+            Arguments of the method.
+
+        Returns
+        -------
+        dict
+            HostResult keyed by host name.
+
+        """
+        return self.map(lambda client: getattr(client, method)(*args,
+                                                               **kwargs))
+
+    def batch(self, build) -> dict:
+        """
+        Sends a batch of mutations to every host concurrently.
+
+        Parameters
+        ----------
+        build: callable
+            Called as build(batch, client) to add the mutations of a host
+            to its MutationBatch.
+
+        Returns
+        -------
+        dict
+            HostResult keyed by host name, with the results of
+            `MutationBatch.execute` as value.
+
+        """
+        def execute(client):
+            batch = client.batch()
+            build(batch, client)
+
+            return batch.execute() if len(batch) else []
+
+        return self.map(execute)
+
+    def players(self) -> list:
+        """
+        Returns the players of every host.
+
+        Returns
+        -------
+        list
+            Tuples of host name and Player, in host order. Hosts that
+            failed are left out, see `map` for their errors.
+
+        """
+        results = self.map(lambda client: client.players)
+
+        return [(name, player) for name, result in results.items()
+                if result.ok for player in result.value]
+
+    def players_data(self, fields: Optional[list] = None) -> list:
+        """
+        Returns the data of the players of every host, projected on some
+        fields, see `MultiViewerForF1.players_data`.
+
+        Parameters
+        ----------
+        fields: list, optional
+            Fields to fetch. Defaults to all fields.
+
+        Returns
+        -------
+        list
+            Dict of each player with a host key. Hosts that failed are left
+            out.
+
+        """
+        results = self.map(lambda client: client.players_data(fields))
+
+        return [dict(player, host=name) for name, result in results.items()
+                if result.ok for player in result.value]
+
+    def estimate_clocks(self, samples: int = 8) -> dict:
+        """
+        Estimates the clock offset of every host concurrently, see
+        `estimate_offset`.
+
+        Parameters
+        ----------
+        samples: int, optional
+            Probes per host. Defaults to 8.
+
+        Returns
+        -------
+        dict
+            HostResult keyed by host name, with a ClockOffset as value.
+
+        """
+        results = self.map(lambda client: estimate_offset(
+            client, samples, self.name(client)
+        ), timeout=(self.timeout + 0.01) * samples)
+
+        for name, result in results.items():
+            if result.ok:
+                self.offsets[name] = result.value
+
+        return results
+
+    def name(self, client: MultiViewerForF1) -> str:
+        return next(name for name, other in self.clients.items()
+                    if other is client)
+
+    def drifts(self, reference_host: Optional[str] = None,
+               reference: Optional[str] = None) -> dict:
+        """
+        Measures how far every player of every host is from a reference
+        player.
+
+        The states of all players are read concurrently, and the time each
+        was sampled on its host (`state.ts`) is moved to the local clock
+        with the offset of the host, so players on different hosts compare
+        exactly. Hosts without an offset are estimated first.
+
+        Parameters
+        ----------
+        reference_host: str, optional
+            Host of the reference player. Defaults to the first host with a
+            broadcast commentary player.
+        reference: str, optional
+            Id of the reference player on its host. Defaults to the player
+            with broadcast commentary.
+
+        Returns
+        -------
+        dict
+            Seconds each player is ahead of the reference, keyed by host
+            name then player id. Failed hosts are left out.
+
+        """
+        if set(self.clients) - set(self.offsets):
+            self.estimate_clocks()
+
+        results = self.map(lambda client: client.players_data(FIELDS))
+        players = {}
+
+        for name, result in results.items():
+            if not result.ok or name not in self.offsets:
+                continue
+
+            offset = self.offsets[name].offset
+            players[name] = [
+                dict(player, state=dict(player["state"],
+                                        ts=player["state"]["ts"] - offset))
+                for player in result.value if measurable(player)
+            ]
+
+        hosts = [reference_host] if reference_host is not None else players
+        target = None
+
+        for name in hosts:
+            target = find_reference(players.get(name, []), reference)
+
+            if target is not None:
+                break
+
+        if target is None:
+            raise MultiViewerForF1Error("No reference player to sync to.")
+
+        return {name: {str(player["id"]): drift(player, target)
+                       for player in host_players if player is not target}
+                for name, host_players in players.items()}
+
+    def sync(self, reference_host: Optional[str] = None,
+             reference: Optional[str] = None,
+             tolerance: float = 0.04) -> dict:
+        """
+        Synchronizes the players of every host to a reference player.
+
+        Unlike `player_sync`, which only works within one MultiViewer, this
+        measures the drifts across hosts with `drifts` and sends each host
+        a batch of relative seeks, concurrently. Relative seeks do not
+        depend on when they arrive, so the hosts line up to within the
+        clock offset error and a frame or two.
+
+        Parameters
+        ----------
+        reference_host: str, optional
+            Host of the reference player. Defaults to the first host with a
+            broadcast commentary player.
+        reference: str, optional
+            Id of the reference player on its host. Defaults to the player
+            with broadcast commentary.
+        tolerance: float, optional
+            Drift in seconds left uncorrected. Defaults to 0.04, a frame at
+            25 fps.
+
+        Returns
+        -------
+        dict
+            HostResult keyed by host name, with the results of the seeks as
+            value.
+
+        """
+        drifts = self.drifts(reference_host, reference)
+
+        def build(batch, client):
+            for id, seconds in drifts.get(self.name(client), {}).items():
+                if abs(seconds) > tolerance:
+                    batch.player_seek_to(id, relative=-seconds)
+
+        return self.batch(build)
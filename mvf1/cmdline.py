@@ -1,13 +1,21 @@
+import time
+
 import click
 
 from mvf1 import MultiViewerForF1
 from mvf1 import MultiViewerForF1Error
 from mvf1 import __version__
 from mvf1 import mcp
+from mvf1.mvf1 import CACHE_TTL
+from mvf1.plan import Plan
+from mvf1.plan import PlanRunner
+from mvf1.archive import EXTENSIONS
 
 from urllib.error import URLError
 
-remote = MultiViewerForF1()
+# Each command runs in its own process, so there is no snapshot worth
+# reusing across lookups.
+remote = MultiViewerForF1(cache_ttl=0.0)
 
 
 @click.group()
@@ -193,7 +201,7 @@ def mv_player(ctx, id, title):
             raise click.UsageError(f"Unexpected error: {str(e)}")
     else:
         try:
-            players = remote.players
+            player = remote.find_player(title=title)
         except URLError:
             raise click.UsageError("MultiViewer for F1 not found. Is the app "
                                    "running?")
@@ -202,11 +210,10 @@ def mv_player(ctx, id, title):
         except Exception as e:
             raise click.UsageError(f"Unexpected error: {str(e)}")
 
-        for player in players:
-            if player.title == title:
-                ctx.obj["player"] = player
-                return
-        raise click.UsageError("No player found with title " f"{title}")
+        if player is None:
+            raise click.UsageError("No player found with title " f"{title}")
+
+        ctx.obj["player"] = player
 
 
 @mv_player.command(help="Display information about player.")
@@ -437,13 +444,258 @@ def switch_stream(ctx, title):
     click.echo("Done.")
 
 
+@cli.command(help="Run a YAML or JSON plan of player actions.", name="run")
+@click.argument("plan_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--dry-run", is_flag=True, default=False,
+    help="Show the batched requests without sending them."
+)
+def run_plan(plan_file, dry_run):
+    try:
+        plan = Plan.load(plan_file)
+    except MultiViewerForF1Error as e:
+        raise click.UsageError(f"Invalid plan: {str(e)}")
+    except Exception as e:
+        raise click.UsageError(f"Unable to read plan: {str(e)}")
+
+    runner = PlanRunner(remote)
+
+    if dry_run:
+        for batch in runner.compile(plan):
+            click.echo(f"Batch {batch.number}:")
+            for step in batch.steps:
+                click.echo(f"  Step {step}")
+        return
+
+    try:
+        report = runner.run(plan)
+    except URLError:
+        raise click.UsageError("MultiViewer for F1 not found. Is the app "
+                               "running?")
+    except MultiViewerForF1Error as e:
+        raise click.UsageError(f"MultiViewer for F1 error: {str(e)}")
+    except Exception as e:
+        raise click.UsageError(f"Unexpected error: {str(e)}")
+
+    batch = None
+
+    for entry in report:
+        # Steps of a batch are sent in one request and share its timing.
+        if entry["batch"] != batch:
+            batch = entry["batch"]
+            click.echo(f"Batch {batch} - {entry['elapsed'] * 1000:.1f} ms "
+                       f"round trip:")
+
+        status = entry["error"] or "ok"
+        click.echo(f"  Step {entry['step']} {entry['action']} "
+                   f"(ID {entry['id']}) - {status}")
+
+    requests = len({entry["batch"] for entry in report
+                    if entry["action"] != "wait"})
+    click.echo(f"Done. {len(report)} steps in {requests} requests.")
+
+    if any(entry["error"] for entry in report):
+        raise click.UsageError("Some steps failed.")
+
+
+@cli.command(help="Record live timing to an archive directory.",
+             name="record")
+@click.argument("archive", type=click.Path(file_okay=False))
+@click.option(
+    "--series", multiple=True, default=["f1"],
+    type=click.Choice(["f1", "fiawec"]),
+    help="Live timing series to record. Can be repeated."
+)
+@click.option(
+    "--interval", default=1.0, type=float,
+    help="Seconds between polls."
+)
+@click.option(
+    "--segment-seconds", default=300.0, type=float,
+    help="Seconds covered by each archive segment."
+)
+@click.option(
+    "--compression", default=None, type=click.Choice(list(EXTENSIONS)),
+    help="Segment compression. Defaults to zstd when installed."
+)
+@click.option(
+    "--duration", default=None, type=float,
+    help="Seconds to record. Defaults to until interrupted."
+)
+def record(archive, series, interval, segment_seconds, compression,
+           duration):
+    from mvf1.recorder import Recorder
+
+    try:
+        recorder = Recorder(archive, remote=remote, interval=interval,
+                            series=tuple(series),
+                            segment_seconds=segment_seconds,
+                            compression=compression)
+    except MultiViewerForF1Error as e:
+        raise click.UsageError(str(e))
+
+    click.echo(f"Recording {', '.join(series)} to {archive}. "
+               "Press Ctrl+C to stop.")
+
+    with recorder:
+        try:
+            if duration:
+                time.sleep(duration)
+            else:
+                while True:
+                    time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+    click.echo(f"Done. {recorder.records} states in "
+               f"{len(recorder.writer.index['segments'])} segments"
+               f" ({recorder.dropped} dropped).")
+
+
+@cli.command(help="Serve an archive as a local MultiViewer GraphQL API.",
+             name="replay")
+@click.argument("archive", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--host", default="127.0.0.1",
+    help="Host to bind."
+)
+@click.option(
+    "--port", default=10101, type=int,
+    help="Port to bind."
+)
+@click.option(
+    "--speed", default=1.0, type=float,
+    help="Playback speed - 1 for real time, 10 for ten times faster."
+)
+@click.option(
+    "--create-lag", default=0.5, type=float,
+    help="Seconds before a created player is visible, like the app."
+)
+def replay(archive, host, port, speed, create_lag):
+    from mvf1.archive import ArchiveReader
+    from mvf1.replay import ArchivePlayback
+    from mvf1.replay import ReplayServer
+
+    try:
+        playback = ArchivePlayback(ArchiveReader(archive), speed=speed)
+    except MultiViewerForF1Error as e:
+        raise click.UsageError(str(e))
+
+    server = ReplayServer(playback, create_lag=create_lag, host=host,
+                          port=port)
+
+    click.echo(f"Replaying {archive} at {speed}x on {server.url}. "
+               "Press Ctrl+C to stop.")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+@cli.command(help="Serve a mock MultiViewer GraphQL API with synthetic "
+                  "race timing.", name="mock")
+@click.option(
+    "--host", default="127.0.0.1",
+    help="Host to bind."
+)
+@click.option(
+    "--port", default=10101, type=int,
+    help="Port to bind."
+)
+@click.option(
+    "--drivers", default=20, type=int,
+    help="Number of drivers in the synthetic race."
+)
+@click.option(
+    "--laps", default=57, type=int,
+    help="Laps of the synthetic race."
+)
+@click.option(
+    "--speed", default=1.0, type=float,
+    help="Race speed - 1 for real time, 10 for ten times faster."
+)
+@click.option(
+    "--latency", default=0.0, type=float,
+    help="Seconds added to every request."
+)
+@click.option(
+    "--jitter", default=0.0, type=float,
+    help="Maximum random seconds added on top of the latency."
+)
+@click.option(
+    "--error-rate", default=0.0, type=click.FloatRange(0, 1),
+    help="Probability a request answers a GraphQL error."
+)
+@click.option(
+    "--create-lag", default=0.5, type=float,
+    help="Seconds before a created player is visible, like the app."
+)
+def mock(host, port, drivers, laps, speed, latency, jitter, error_rate,
+         create_lag):
+    from mvf1.mock import MockServer
+    from mvf1.mock import SyntheticTiming
+
+    server = MockServer(SyntheticTiming(drivers=drivers, laps=laps,
+                                        speed=speed),
+                        latency=latency, jitter=jitter,
+                        error_rate=error_rate, create_lag=create_lag,
+                        host=host, port=port)
+
+    click.echo(f"Serving a {laps} lap race of {drivers} drivers at "
+               f"{speed}x on {server.url}. Press Ctrl+C to stop.")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
 @cli.command(help="Run Model Context Protocol server.", name="mcp")
 @click.option(
     "--url", 
     default="http://localhost:10101/api/graphql", 
     help="URL for MultiViewer for F1 GraphQL API endpoint."
 )
-def run_mcp(url):
+@click.option(
+    "--cache-ttl", default=CACHE_TTL, type=float,
+    help="Seconds to reuse a players snapshot for lookups, 0 to always "
+         "refetch."
+)
+@click.option(
+    "--max-workers", default=8, type=int,
+    help="Maximum concurrent calls to MultiViewer for F1."
+)
+@click.option(
+    "--poll-interval", default=None, type=float,
+    help="Poll live timing every N seconds and answer timing tools from "
+    "memory."
+)
+@click.option(
+    "--transport", default="stdio", type=click.Choice(["stdio", "http"]),
+    help="Serve one agent over stdio or many over streamable HTTP."
+)
+@click.option(
+    "--host", default="127.0.0.1",
+    help="Host to bind with the http transport."
+)
+@click.option(
+    "--port", default=8000, type=int,
+    help="Port to bind with the http transport."
+)
+@click.option(
+    "--rate-limit", default=None, type=float,
+    help="Maximum tool calls per second for each MCP session."
+)
+def run_mcp(url, cache_ttl, max_workers, poll_interval, transport, host,
+            port, rate_limit):
     from mvf1.mcp import create_mcp_server
-    mcp_server = create_mcp_server(url)
-    mcp_server.run()
+    mcp_server = create_mcp_server(url, cache_ttl=cache_ttl,
+                                   max_workers=max_workers,
+                                   poll_interval=poll_interval,
+                                   rate_limit=rate_limit)
+
+    if transport == "http":
+        mcp_server.run(transport="http", host=host, port=port)
+    else:
+        mcp_server.run()
@@ -0,0 +1,231 @@
+import bisect
+import threading
+import time
+
+from typing import Optional
+
+from .delta import apply
+from .delta import diff
+from .mvf1 import MultiViewerForF1
+from .timing import response_state
+from .timing import track_time
+
+
+class DelayBuffer(object):
+    """
+    Time-indexed buffer of live timing states.
+
+    Each pushed state is stored as the previous state patched with what
+    changed, so consecutive states share every unchanged branch and the
+    buffer costs about the size of the changes. Lookups bisect the track
+    times, so releasing the state at any time in the window is O(log n).
+
+    States older than `window` seconds before the newest one are dropped,
+    keeping the newest of them so the start of the window still resolves.
+
+    Parameters
+    ----------
+    window: float, optional
+        Seconds of track time kept. Defaults to 120.
+
+    Attributes
+    ----------
+    tracks: list
+        Track times of the states in milliseconds, oldest first.
+    states: list
+        States in the same order.
+    """
+
+    def __init__(self, window: float = 120.0):
+        self.window = window
+        self.tracks = []
+        self.states = []
+        self.start = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.tracks) - self.start
+
+    @property
+    def oldest(self) -> Optional[int]:
+        return self.tracks[self.start] if len(self) else None
+
+    @property
+    def newest(self) -> Optional[int]:
+        return self.tracks[-1] if len(self) else None
+
+    def push(self, track: int, state: dict):
+        """
+        Adds the state at a track time.
+
+        Parameters
+        ----------
+        track: int
+            Track time of the state in milliseconds, not older than the
+            newest state.
+
+        state: dict
+            Live timing state.
+
+        """
+        with self.lock:
+            if len(self):
+                previous = self.states[-1]
+                patch = diff(previous, state)
+
+                if not patch:
+                    return
+
+                state = apply(previous, patch)
+
+            self.tracks.append(track)
+            self.states.append(state)
+
+            cutoff = track - self.window * 1000
+            expired = bisect.bisect_right(self.tracks, cutoff, self.start) - 1
+
+            if expired > self.start:
+                self.start = expired
+
+            # Compact once the dropped entries outnumber the kept ones.
+            if self.start > len(self.tracks) // 2:
+                del self.tracks[:self.start]
+                del self.states[:self.start]
+                self.start = 0
+
+    def state_at(self, track: int) -> Optional[dict]:
+        """
+        Returns the latest state at or before a track time.
+
+        Parameters
+        ----------
+        track: int
+            Track time in milliseconds.
+
+        Returns
+        -------
+        dict
+            State, or None if the time is before the window.
+
+        """
+        with self.lock:
+            index = bisect.bisect_right(self.tracks, track, self.start) - 1
+
+            if index < self.start:
+                return None
+
+            return self.states[index]
+
+
+class DelayedTiming(object):
+    """
+    Spoiler-free live timing, delayed to the video on screen.
+
+    Register `update` with a LiveTimingPoller polling the clock and f1
+    series. F1 states go into a DelayBuffer stamped with the track time
+    of the clock, and `state` releases the one matching what the video
+    shows rather than the latest.
+
+    The track time of the video is `offset` plus the position of the
+    commentary player (`interpolatedCurrentTime`). The offset defaults to
+    `liveTimingStartTime`, which lines up streams and timing that start
+    together, as in replays; pass the offset measured on a known moment
+    (such as lights out) otherwise. With `delay`, the video is instead
+    assumed to run that many seconds behind live timing.
+
+    Parameters
+    ----------
+    remote: MultiViewerForF1, optional
+        Interface to control MultiViewerForF1.
+    player: str, optional
+        Id of the commentary player. Required without `delay`.
+    window: float, optional
+        Seconds of timing kept. Must cover the video delay. Defaults to
+        120.
+    delay: float, optional
+        Fixed seconds between live timing and the video.
+    offset: int, optional
+        Track time in milliseconds at position 0 of the player.
+
+    Attributes
+    ----------
+    buffer: DelayBuffer
+        Buffered F1 states.
+    clock: dict
+        Latest f1LiveTimingClock.
+    """
+
+    def __init__(self, remote: Optional[MultiViewerForF1] = None,
+                 player: Optional[str] = None,
+                 window: float = 120.0,
+                 delay: Optional[float] = None,
+                 offset: Optional[int] = None):
+        if player is None and delay is None:
+            raise ValueError("Pass the commentary player or a delay.")
+
+        self.remote = remote if remote is not None else MultiViewerForF1()
+        self.player = player
+        self.delay = delay
+        self.offset = offset
+        self.buffer = DelayBuffer(window)
+        self.clock = None
+
+    def update(self, snapshot, previous):
+        """
+        Buffers clock and F1 snapshots. Register with
+        LiveTimingPoller.add_listener.
+        """
+        state = response_state(snapshot.response)
+
+        if snapshot.series == "clock":
+            self.clock = state
+        elif snapshot.series == "f1":
+            track = track_time(self.clock, time.time())
+
+            if track is not None:
+                self.buffer.push(track, state)
+
+    def position(self) -> Optional[int]:
+        """
+        Returns the track time shown by the video.
+
+        Returns
+        -------
+        int
+            Track time in milliseconds, or None before the first clock.
+
+        """
+        if self.delay is not None:
+            live = track_time(self.clock, time.time())
+
+            return None if live is None else int(live - self.delay * 1000)
+
+        offset = self.offset
+
+        if offset is None:
+            offset = (self.clock or {}).get("liveTimingStartTime")
+
+        if offset is None:
+            return None
+
+        state = self.remote.player(self.player).state or {}
+        current = state.get("interpolatedCurrentTime")
+
+        if current is None:
+            current = state.get("currentTime") or 0.0
+
+        return int(offset + current * 1000)
+
+    def state(self) -> Optional[dict]:
+        """
+        Returns the F1 live timing state matching the video.
+
+        Returns
+        -------
+        dict
+            State, or None if the video is before the buffered window.
+
+        """
+        position = self.position()
+
+        return None if position is None else self.buffer.state_at(position)
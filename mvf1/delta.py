@@ -0,0 +1,272 @@
+import threading
+import uuid
+
+from collections import deque
+from typing import Optional
+
+
+# Keys a patch uses for removed keys and for items appended to a list.
+DELETED = "__deleted__"
+APPEND = "__append__"
+
+
+def diff(old: dict, new: dict) -> dict:
+    """
+    Returns a patch that turns one live timing state into another.
+
+    Nested dicts are diffed recursively, lists that only grew are sent as
+    the appended items, and anything else that changed is sent whole.
+
+    Parameters
+    ----------
+    old: dict
+        Previous state.
+
+    new: dict
+        Current state.
+
+    Returns
+    -------
+    dict
+        Patch for `apply`, empty if the states are equal.
+
+    """
+    patch = {}
+
+    for key, value in new.items():
+        if key not in old:
+            patch[key] = value
+            continue
+
+        previous = old[key]
+
+        if previous == value:
+            continue
+
+        if isinstance(previous, dict) and isinstance(value, dict):
+            patch[key] = diff(previous, value)
+        elif (isinstance(previous, list) and isinstance(value, list)
+                and len(value) > len(previous)
+                and value[:len(previous)] == previous):
+            patch[key] = {APPEND: value[len(previous):]}
+        else:
+            patch[key] = value
+
+    deleted = [key for key in old if key not in new]
+
+    if deleted:
+        patch[DELETED] = deleted
+
+    return patch
+
+
+def apply(state: dict, patch: dict) -> dict:
+    """
+    Applies a patch from `diff` to a state.
+
+    The state is not modified. Only the dicts along changed paths are
+    copied, so the result shares every unchanged branch with the state.
+
+    Parameters
+    ----------
+    state: dict
+        State to patch.
+
+    patch: dict
+        Patch from `diff`.
+
+    Returns
+    -------
+    dict
+        Patched state.
+
+    """
+    result = dict(state)
+
+    for key in patch.get(DELETED, ()):
+        result.pop(key, None)
+
+    for key, value in patch.items():
+        if key == DELETED:
+            continue
+
+        base = result.get(key)
+
+        if isinstance(value, dict) and isinstance(base, dict):
+            result[key] = apply(base, value)
+        elif (isinstance(value, dict) and isinstance(base, list)
+                and list(value) == [APPEND]):
+            result[key] = base + value[APPEND]
+        else:
+            result[key] = value
+
+    return result
+
+
+def select(patch: dict, topics: Optional[list] = None) -> dict:
+    """
+    Returns the part of a state or patch that concerns some topics.
+
+    Parameters
+    ----------
+    patch: dict
+        State or patch keyed by topic.
+
+    topics: list, optional
+        Topics to keep. Defaults to all of them.
+
+    Returns
+    -------
+    dict
+        Selected state or patch.
+
+    """
+    if not topics:
+        return patch
+
+    selected = {key: value for key, value in patch.items() if key in topics}
+    deleted = [key for key in patch.get(DELETED, ()) if key in topics]
+
+    if deleted:
+        selected[DELETED] = deleted
+
+    return selected
+
+
+class DeltaLog(object):
+    """
+    Bounded log of the changes between successive live timing states.
+
+    Each appended state that differs from the previous one gets a new
+    version and its patch is kept in a ring of `maxlen` entries. Readers
+    hold a cursor naming the last version they saw and ask for what
+    changed since, so polling costs as much as the changes rather than the
+    state.
+
+    Cursors carry the epoch of the log, so a cursor from another log (for
+    example before a server restart) or one older than the ring gets the
+    full state instead of changes.
+
+    Parameters
+    ----------
+    maxlen: int, optional
+        Number of patches to keep. Defaults to 1000.
+
+    Attributes
+    ----------
+    epoch: str
+        Random id of this log.
+    version: int
+        Version of the latest state, 0 before the first.
+    state: dict
+        Latest state.
+    entries: deque
+        Tuples of version and patch, oldest first.
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.version = 0
+        self.state = {}
+        self.entries = deque(maxlen=maxlen)
+        self.lock = threading.Lock()
+
+    @property
+    def cursor(self) -> str:
+        """
+        Returns the cursor of the latest version.
+
+        Returns
+        -------
+        str
+            Cursor.
+
+        """
+        return f"{self.epoch}:{self.version}"
+
+    def append(self, state: dict) -> Optional[dict]:
+        """
+        Records a new state.
+
+        Parameters
+        ----------
+        state: dict
+            Current live timing state.
+
+        Returns
+        -------
+        dict
+            Patch from the previous state or None if nothing changed.
+
+        """
+        state = state or {}
+
+        with self.lock:
+            patch = diff(self.state, state)
+
+            if not patch and self.version:
+                return None
+
+            self.version += 1
+            self.state = state
+            self.entries.append((self.version, patch))
+
+            return patch
+
+    def since(self, cursor: Optional[str] = None,
+              topics: Optional[list] = None) -> dict:
+        """
+        Returns what changed since a cursor.
+
+        Parameters
+        ----------
+        cursor: str, optional
+            Cursor from a previous call. Without one, the full state is
+            returned.
+
+        topics: list, optional
+            Topics to report. Defaults to all of them.
+
+        Returns
+        -------
+        dict
+            The new `cursor`, and either `changes`, a list of versions with
+            their patch in order, or `state`, the full state when the cursor
+            is missing, unknown or too old (with `reset` set to True).
+
+        """
+        with self.lock:
+            version = self._version(cursor)
+            oldest = self.entries[0][0] if self.entries else 1
+
+            if version is None or version < oldest - 1:
+                return {"cursor": self.cursor,
+                        "reset": True,
+                        "state": select(self.state, topics)}
+
+            changes = []
+
+            for entry_version, patch in self.entries:
+                if entry_version <= version:
+                    continue
+
+                selected = select(patch, topics)
+
+                if selected:
+                    changes.append({"version": entry_version,
+                                    "changes": selected})
+
+            return {"cursor": self.cursor, "reset": False, "changes": changes}
+
+    def _version(self, cursor: Optional[str]) -> Optional[int]:
+        if not cursor:
+            return None
+
+        epoch, _, version = cursor.partition(":")
+
+        if epoch != self.epoch or not version.isdigit():
+            return None
+
+        version = int(version)
+
+        return version if version <= self.version else None
@@ -0,0 +1,388 @@
+import statistics
+import threading
+import time
+
+from collections import deque
+from typing import Optional
+
+from .mvf1 import MultiViewerForF1
+from .mvf1 import MultiViewerForF1Error
+from .sync import COMMENTARY
+
+# Priority of each kind of event, higher first. Kinds missing here are
+# ignored.
+PRIORITIES = {
+    "battle": 50,
+    "position_change": 40,
+    "pit_in": 30,
+    "team_radio": 20,
+    "pit_out": 10,
+}
+
+
+class Shot(object):
+    """
+    A driver the director could cut to.
+
+    Attributes
+    ----------
+    kind: str
+        Kind of the event that made the shot.
+    number: str
+        Racing number of the driver.
+    tla: str
+        Three letter acronym of the driver, if known.
+    priority: int
+        Priority of the kind.
+    at: float
+        UNIX time the event was detected.
+    """
+
+    __slots__ = ("kind", "number", "tla", "priority", "at")
+
+    def __init__(self, kind: str, number: str, tla: Optional[str],
+                 priority: int, at: float):
+        self.kind = kind
+        self.number = number
+        self.tla = tla
+        self.priority = priority
+        self.at = at
+
+    def __repr__(self) -> str:
+        return f"{self.kind} {self.tla or self.number} ({self.priority})"
+
+
+class Director(object):
+    """
+    Switches a director player to the onboard of the action.
+
+    Events from an EventDetector and a BattleDetector become shots, ranked
+    by the priority of their kind and then by recency; shots expire after
+    `ttl` seconds and a battle shot lasts until the battle ends. The
+    director cuts to the best shot when the current one has been on screen
+    for `dwell` seconds and fewer than `max_switches` cuts were made in the
+    last `window` seconds, unless the best shot is already on screen.
+
+    A cut is one batched request: if an onboard of the driver is already
+    open, it swaps bounds and volume with the director player, otherwise
+    it replaces the director player with a new onboard, like
+    `Player.switch_stream`. For team radio, the commentary player is ducked
+    until the next cut.
+
+    Parameters
+    ----------
+    remote: MultiViewerForF1, optional
+        Interface to control MultiViewerForF1.
+    player: str
+        Id of the director player, whose screen the cuts take over. It is
+        muted or closed by cuts, so it cannot be a commentary player.
+    commentary: str, optional
+        Id of the player to duck for team radio.
+    model: RaceModel, optional
+        Race model for the TLAs of battle events.
+    priorities: dict, optional
+        Priority of each kind of event. Defaults to PRIORITIES.
+    dwell: float, optional
+        Minimum seconds on a shot. Defaults to 8.
+    max_switches: int, optional
+        Maximum cuts in `window`. Defaults to 4.
+    window: float, optional
+        Seconds of the cut rate limit. Defaults to 60.
+    ttl: float, optional
+        Seconds a shot stays eligible. Defaults to 15.
+    volume: int, optional
+        Volume of the director player. Defaults to 100.
+    duck_volume: int, optional
+        Volume of the commentary during team radio. Defaults to 20.
+
+    Attributes
+    ----------
+    shot: Shot
+        Shot on screen, None before the first cut.
+    cuts: list
+        Recent cuts with the shot and their latencies.
+    """
+
+    def __init__(self, remote: Optional[MultiViewerForF1] = None,
+                 player: Optional[str] = None,
+                 commentary: Optional[str] = None,
+                 model=None,
+                 priorities: Optional[dict] = None,
+                 dwell: float = 8.0,
+                 max_switches: int = 4,
+                 window: float = 60.0,
+                 ttl: float = 15.0,
+                 volume: int = 100,
+                 duck_volume: int = 20):
+        if player is None:
+            raise MultiViewerForF1Error("No director player - pass the id "
+                                        "of one.")
+
+        if commentary is not None and str(player) == str(commentary):
+            raise MultiViewerForF1Error("The director player cannot be the "
+                                        "commentary player.")
+
+        self.remote = remote if remote is not None else MultiViewerForF1()
+        self.player = str(player)
+        self.commentary = commentary
+        self.model = model
+        self.priorities = PRIORITIES if priorities is None else priorities
+        self.dwell = dwell
+        self.max_switches = max_switches
+        self.window = window
+        self.ttl = ttl
+        self.volume = volume
+        self.duck_volume = duck_volume
+
+        self.shots = {}
+        self.shot = None
+        self.switched = None
+        self.ducked = False
+        self.switches = deque()
+        self.created = None
+        self.cuts = deque(maxlen=100)
+        self.lock = threading.Lock()
+        self.cutting = threading.Lock()
+
+    def handle(self, event):
+        """
+        Takes a RaceEvent or BattleEvent and cuts if it is the best shot.
+        Register with EventDetector.add_listener and
+        BattleDetector.add_listener.
+        """
+        kind = getattr(event, "kind", None)
+
+        if hasattr(event, "behind"):
+            number = event.behind
+
+            if kind == "end":
+                with self.lock:
+                    shot = self.shots.get(number)
+
+                    if shot is not None and shot.kind == "battle":
+                        del self.shots[number]
+                return
+
+            kind = "battle"
+        else:
+            number = event.number
+
+        if number is None or kind not in self.priorities:
+            return
+
+        tla = getattr(event, "tla", None)
+
+        if tla is None and self.model is not None:
+            line = self.model.driver(number)
+            tla = line.tla if line else None
+
+        shot = Shot(kind, str(number), tla, self.priorities[kind], event.at)
+
+        with self.lock:
+            current = self.shots.get(shot.number)
+
+            if current is None or current.priority <= shot.priority:
+                self.shots[shot.number] = shot
+
+        self.tick()
+
+    def update(self, snapshot, previous):
+        """
+        Cuts to shots held back by the dwell time or rate limit. Register
+        with LiveTimingPoller.add_listener.
+        """
+        self.tick()
+
+    def decide(self, now: Optional[float] = None) -> Optional[Shot]:
+        """
+        Returns the shot to cut to now.
+
+        Parameters
+        ----------
+        now: float, optional
+            UNIX time. Defaults to now.
+
+        Returns
+        -------
+        Shot
+            Best shot, or None if the director should hold.
+
+        """
+        now = time.time() if now is None else now
+
+        with self.lock:
+            for number, shot in list(self.shots.items()):
+                if shot.kind != "battle" and now - shot.at > self.ttl:
+                    del self.shots[number]
+
+            while self.switches and now - self.switches[0] > self.window:
+                self.switches.popleft()
+
+            if not self.shots:
+                return None
+
+            best = max(self.shots.values(),
+                       key=lambda shot: (shot.priority, shot.at))
+
+            if self.shot is not None and best.number == self.shot.number:
+                return None
+
+            if self.switched is not None and now - self.switched < self.dwell:
+                return None
+
+            if len(self.switches) >= self.max_switches:
+                return None
+
+            return best
+
+    def tick(self, now: Optional[float] = None) -> Optional[dict]:
+        """
+        Cuts to the best shot if the director should.
+
+        Parameters
+        ----------
+        now: float, optional
+            UNIX time. Defaults to now.
+
+        Returns
+        -------
+        dict
+            The cut, with the shot, the batch results, and the decision and
+            screen latencies in seconds from the event, or None. The shot
+            is only recorded once its cut went through.
+
+        """
+        # Events and polls arrive on different threads - one cut at a time.
+        if not self.cutting.acquire(blocking=False):
+            return None
+
+        try:
+            shot = self.decide(now)
+
+            if shot is None:
+                return None
+
+            decided = time.time()
+            results = self.cut(shot)
+            done = time.time()
+
+            if results is None:
+                return None
+
+            with self.lock:
+                self.shot = shot
+                self.switched = decided if now is None else now
+                self.switches.append(self.switched)
+        finally:
+            self.cutting.release()
+
+        cut = {"shot": shot,
+               "results": results,
+               "decision_latency": decided - shot.at,
+               "screen_latency": done - shot.at}
+        self.cuts.append(cut)
+
+        return cut
+
+    def cut(self, shot: Shot) -> Optional[list]:
+        """
+        Puts a shot on the director screen in one batched request.
+
+        Parameters
+        ----------
+        shot: Shot
+            Shot to cut to.
+
+        Returns
+        -------
+        list
+            Results of the batch, see `MutationBatch.execute`, or None if
+            the onboard created by the previous cut is not visible yet.
+
+        """
+        index = self.remote.player_index()
+        player = index.get(self.player)
+
+        if player is None and self.player == self.created:
+            # Created players take a moment to appear - cut once it has.
+            index.invalidate()
+            return None
+
+        if player is None:
+            raise MultiViewerForF1Error(f"Director player {self.player} "
+                                        f"not found.")
+
+        if player.driver_data is None and player.title in COMMENTARY:
+            raise MultiViewerForF1Error(f"Director player {self.player} is "
+                                        f"a commentary player.")
+
+        onboard = index.find(driver_number=shot.number)
+
+        if onboard is None and shot.tla is not None:
+            onboard = index.find(title=shot.tla)
+
+        batch = self.remote.batch()
+
+        if onboard is not None and str(onboard.id) == str(player.id):
+            # The onboard is already on the director screen.
+            switched = str(player.id)
+        elif onboard is not None:
+            batch.player_set_bounds(onboard.id, x=player.x, y=player.y,
+                                    width=player.width, height=player.height)
+            batch.player_set_bounds(player.id, x=onboard.x, y=onboard.y,
+                                    width=onboard.width,
+                                    height=onboard.height)
+            batch.player_set_volume(onboard.id, self.volume)
+            batch.player_set_volume(player.id, 0)
+            switched = str(onboard.id)
+        else:
+            batch.player_delete(player.id)
+            batch.player_create(player.content_id,
+                                driver_tla=shot.tla,
+                                driver_number=int(shot.number),
+                                x=player.x, y=player.y,
+                                width=player.width, height=player.height)
+            switched = None
+
+        if self.commentary is not None:
+            duck = shot.kind == "team_radio"
+
+            if duck != self.ducked:
+                batch.player_set_volume(self.commentary,
+                                        self.duck_volume if duck
+                                        else self.volume)
+                self.ducked = duck
+
+        results = batch.execute() if len(batch) else []
+
+        if switched is None:
+            switched = results[1]["result"] or self.player
+            self.created = str(switched)
+
+        self.player = str(switched)
+
+        return results
+
+    def metrics(self) -> dict:
+        """
+        Returns the latencies of the recent cuts.
+
+        Returns
+        -------
+        dict
+            Number of cuts, and mean and maximum decision and screen
+            latency in milliseconds.
+
+        """
+        decisions = [cut["decision_latency"] * 1000 for cut in self.cuts]
+        screens = [cut["screen_latency"] * 1000 for cut in self.cuts]
+
+        return {"cuts": len(self.cuts),
+                "decision_latency_ms": {
+                    "mean": statistics.fmean(decisions) if decisions else None,
+                    "max": max(decisions, default=None),
+                },
+                "screen_latency_ms": {
+                    "mean": statistics.fmean(screens) if screens else None,
+                    "max": max(screens, default=None),
+                }}
@@ -0,0 +1,251 @@
+import re
+import time
+
+from typing import Optional
+
+from .delta import DELETED
+from .model import RaceModel
+from .poller import F1Listener
+from .timing import TRACK_STATUS
+from .timing import values
+
+
+PIT_IN = "pit_in"
+PIT_OUT = "pit_out"
+POSITION_CHANGE = "position_change"
+FLAG = "flag"
+FASTEST_LAP = "fastest_lap"
+PENALTY = "penalty"
+INCIDENT = "incident"
+RETIREMENT = "retirement"
+TEAM_RADIO = "team_radio"
+
+KINDS = (PIT_IN, PIT_OUT, POSITION_CHANGE, FLAG, FASTEST_LAP, PENALTY,
+         INCIDENT, RETIREMENT, TEAM_RADIO)
+
+# Racing number in a race control message, e.g. 'CAR 16 (LEC) TIME ...'.
+CAR = re.compile(r"\bCARS? (\d+)\b")
+
+
+class RaceEvent(object):
+    """
+    A race event detected from live timing.
+
+    Attributes
+    ----------
+    kind: str
+        One of KINDS.
+    number: str
+        Racing number of the driver, None for track-wide events.
+    tla: str
+        Three letter acronym of the driver.
+    lap: int
+        Lap of the leader, or of the message.
+    data: dict
+        Details of the event: previous and new position, flag and status,
+        lap time or race control message.
+    at: float
+        UNIX time of the tick that detected the event.
+    """
+
+    __slots__ = ("kind", "number", "tla", "lap", "data", "at")
+
+    def __init__(self, kind: str, number: Optional[str] = None,
+                 tla: Optional[str] = None, lap: Optional[int] = None,
+                 data: Optional[dict] = None, at: float = 0.0):
+        self.kind = kind
+        self.number = number
+        self.tla = tla
+        self.lap = lap
+        self.data = data or {}
+        self.at = at
+
+    def __repr__(self) -> str:
+        return f"{self.kind} {self.tla or self.number or ''} {self.data}"
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, RaceEvent)
+                and (self.kind, self.number, self.data)
+                == (other.kind, other.number, other.data))
+
+
+class EventDetector(F1Listener):
+    """
+    Detects race events from successive F1 live timing states.
+
+    Each tick diffs the state once: timing lines go through a RaceModel,
+    so only the drivers whose timing changed are looked at, and each of
+    them is compared in a single pass with the previous position, pit,
+    retirement and best lap kept per driver. Track status changes, new
+    race control messages and new team radio captures are read from the
+    same tick.
+
+    The first state sets the baseline and emits no events.
+
+    Parameters
+    ----------
+    model: RaceModel, optional
+        Race model to update. Defaults to a new one.
+
+    Attributes
+    ----------
+    fastest: float
+        Fastest lap of the session in seconds.
+    """
+
+    def __init__(self, model: Optional[RaceModel] = None):
+        self.model = model if model is not None else RaceModel()
+        self.listeners = {kind: [] for kind in KINDS}
+        self.drivers = {}
+        self.fastest = None
+        self.status = None
+        self.messages = 0
+        self.captures = 0
+        self.started = False
+
+    def add_listener(self, listener, kind: Optional[str] = None):
+        """
+        Registers a callable invoked with each RaceEvent.
+
+        Parameters
+        ----------
+        listener: callable
+            Called as listener(event).
+
+        kind: str, optional
+            Only call for events of this kind. Defaults to all kinds.
+
+        """
+        if kind is not None and kind not in self.listeners:
+            raise ValueError(f"Unknown event {kind} - can be "
+                             f"{', '.join(KINDS)}.")
+
+        for name in ([kind] if kind else KINDS):
+            self.listeners[name].append(listener)
+
+    def ingest(self, state: dict, at: Optional[float] = None) -> list:
+        """
+        Detects the events since the previous state.
+
+        Parameters
+        ----------
+        state: dict
+            F1 live timing state.
+
+        at: float, optional
+            UNIX time of the tick. Defaults to now.
+
+        Returns
+        -------
+        list
+            RaceEvent objects in detection order.
+
+        """
+        at = time.time() if at is None else at
+        leader = self.model.leader
+        lap = leader.laps if leader else None
+        events = []
+
+        patch = self.model.ingest(state)
+        lines = (patch.get("TimingData") or {}).get("Lines") or {}
+
+        for number in lines:
+            if number != DELETED:
+                events += self.driver_events(number, lap, at)
+
+        status = (state.get("TrackStatus") or {}).get("Status")
+
+        if status != self.status:
+            if self.status is not None:
+                events.append(RaceEvent(FLAG, lap=lap, at=at, data={
+                    "flag": TRACK_STATUS.get(status, status),
+                    "status": status,
+                    "previous": TRACK_STATUS.get(self.status, self.status),
+                }))
+
+            self.status = status
+
+        messages = values((state.get("RaceControlMessages") or {})
+                          .get("Messages"))
+
+        for message in messages[self.messages:]:
+            events += self.message_events(message, at)
+
+        self.messages = len(messages)
+
+        captures = values((state.get("TeamRadio") or {}).get("Captures"))
+
+        for capture in captures[self.captures:]:
+            number = capture.get("RacingNumber")
+            line = self.model.driver(number) if number else None
+            events.append(RaceEvent(TEAM_RADIO, number,
+                                    line.tla if line else None, lap,
+                                    {"path": capture.get("Path"),
+                                     "utc": capture.get("Utc")}, at))
+
+        self.captures = len(captures)
+
+        if not self.started:
+            self.started = True
+            return []
+
+        for event in events:
+            for listener in self.listeners[event.kind]:
+                listener(event)
+
+        return events
+
+    def driver_events(self, number: str, lap: Optional[int],
+                      at: float) -> list:
+        line = self.model.lines[number]
+        position, in_pit, retired = self.drivers.get(number,
+                                                     (None, False, False))
+        self.drivers[number] = (line.position, line.in_pit, line.retired)
+        events = []
+
+        def event(kind, **data):
+            events.append(RaceEvent(kind, number, line.tla, lap, data, at))
+
+        if line.in_pit and not in_pit:
+            event(PIT_IN, stops=line.pit_stops)
+        elif in_pit and not line.in_pit:
+            event(PIT_OUT, stops=line.pit_stops)
+
+        if (position is not None and line.position is not None
+                and line.position != position):
+            event(POSITION_CHANGE, previous=position, position=line.position)
+
+        if line.retired and not retired:
+            event(RETIREMENT, position=line.position)
+
+        seconds = line.best_lap.seconds
+
+        if seconds is not None and (self.fastest is None
+                                    or seconds < self.fastest):
+            self.fastest = seconds
+            event(FASTEST_LAP, time=line.best_lap.value, seconds=seconds)
+
+        return events
+
+    def message_events(self, message: dict, at: float) -> list:
+        text = (message.get("Message") or "").upper()
+
+        if "PENALTY" in text:
+            kind = PENALTY
+        elif "INCIDENT" in text or "INVESTIGATION" in text:
+            kind = INCIDENT
+        else:
+            return []
+
+        number = message.get("RacingNumber")
+
+        if number is None:
+            match = CAR.search(text)
+            number = match.group(1) if match else None
+
+        line = self.model.driver(number) if number else None
+
+        return [RaceEvent(kind, str(number) if number else None,
+                          line.tla if line else None, message.get("Lap"),
+                          {"message": message.get("Message"),
+                           "category": message.get("Category")}, at)]
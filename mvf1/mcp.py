@@ -1,15 +1,395 @@
+import contextlib
+import functools
+import time
+
 from typing import Optional
 
+import anyio
+
 from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware
+from fastmcp.server.middleware.rate_limiting import RateLimitError
+from fastmcp.server.middleware.rate_limiting import TokenBucketRateLimiter
 
 from mvf1 import MultiViewerForF1
+from mvf1 import MultiViewerForF1Error
+from mvf1 import timing
+from mvf1.delta import DeltaLog
+from mvf1.mvf1 import CACHE_TTL
+from mvf1.mvf1 import F1_TOPICS
+from mvf1.plan import Plan
+from mvf1.plan import PlanRunner
+from mvf1.poller import LiveTimingPoller
+from mvf1.timing import f1_state
+
+# Resource subscriptions need the mcp 2.x SDK; without it the live timing
+# resources are still served, clients just have to poll them.
+try:
+    import mcp_types
+
+    from mcp.server.subscriptions import InMemorySubscriptionBus
+    from mcp.server.subscriptions import ListenHandler
+    from mcp.server.subscriptions import ResourceUpdated
+except ImportError:
+    mcp_types = None
+
+
+# Concurrent calls allowed per tool. The live timing states are large and
+# slow to produce, so they get fewer slots than quick player mutations.
+TOOL_LIMITS = {
+    "f1_live_timing_state": 2,
+    "fiawec_live_timing_state": 2,
+}
+
+# F1 live timing topics served as subscribable resources.
+RESOURCE_TOPICS = {
+    "TrackStatus": "Current track flag and message.",
+    "RaceControlMessages": "Messages from FIA race control.",
+    "TimingData": "Running order, gaps, intervals and lap times.",
+    "SessionStatus": "Status of the session (e.g. Started or Finished).",
+}
+
+
+class SessionMiddleware(Middleware):
+    """
+    Counts the requests of each MCP session and optionally rate limits
+    them.
+
+    Over HTTP many agents share one server, so each session gets its own
+    token bucket of `burst` tool calls or resource reads refilled at `rate`
+    per second, and sessions idle for longer than `idle_timeout` are
+    forgotten.
+
+    Parameters
+    ----------
+    rate: float, optional
+        Sustained calls per second allowed per session. Unlimited by
+        default.
+    burst: int, optional
+        Calls a session can make at once. Defaults to twice the rate.
+    idle_timeout: float, optional
+        Seconds after which an idle session is dropped. Defaults to 3600.
+
+    Attributes
+    ----------
+    sessions: dict
+        Metrics of each session keyed by session id.
+    """
+
+    # Requests that reach MultiViewer and count against the rate limit.
+    LIMITED = ("tools/call", "resources/read")
+
+    def __init__(self,
+                 rate: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 idle_timeout: float = 3600.0):
+        self.rate = rate
+        self.burst = burst or max(1, int((rate or 0) * 2))
+        self.idle_timeout = idle_timeout
+        self.sessions = {}
+        self.limiters = {}
+        self.started = time.time()
+
+    @staticmethod
+    def session_id(context) -> str:
+        """
+        Returns the id of the session a request belongs to.
+
+        This is the MCP session id when the client negotiated one. Stateless
+        HTTP clients are told apart by address, and stdio or in-memory
+        clients are a single local session.
+
+        Parameters
+        ----------
+        context: MiddlewareContext
+            Context of the request.
+
+        Returns
+        -------
+        str
+            Session id.
+
+        """
+        request_context = getattr(context.fastmcp_context, "request_context",
+                                  None)
+        request = getattr(request_context, "request", None)
+
+        if request is None:
+            return "local"
+
+        session_id = request.headers.get("mcp-session-id")
+
+        if session_id:
+            return session_id
+
+        return request.client.host if request.client else "http"
+
+    def session(self, session_id: str) -> dict:
+        now = time.time()
+
+        for idle in [id for id, metrics in self.sessions.items()
+                     if not metrics["active"]
+                     and now - metrics["last_seen"] > self.idle_timeout]:
+            del self.sessions[idle]
+            self.limiters.pop(idle, None)
+
+        if session_id not in self.sessions:
+            self.sessions[session_id] = {"connected_at": now,
+                                         "last_seen": now,
+                                         "requests": 0,
+                                         "tool_calls": 0,
+                                         "errors": 0,
+                                         "rate_limited": 0,
+                                         "active": 0,
+                                         "busy_seconds": 0.0}
+
+            if self.rate:
+                self.limiters[session_id] = TokenBucketRateLimiter(
+                    self.burst, self.rate
+                )
+
+        return self.sessions[session_id]
+
+    async def on_request(self, context, call_next):
+        session_id = self.session_id(context)
+        metrics = self.session(session_id)
+        metrics["last_seen"] = time.time()
+        metrics["requests"] += 1
+
+        if context.method == "tools/call":
+            metrics["tool_calls"] += 1
+
+        limiter = self.limiters.get(session_id)
+
+        if (limiter is not None and context.method in self.LIMITED
+                and not await limiter.consume()):
+            metrics["rate_limited"] += 1
+            raise RateLimitError(f"Rate limit exceeded for session "
+                                 f"{session_id}")
+
+        metrics["active"] += 1
+        start = time.monotonic()
+
+        try:
+            return await call_next(context)
+        except Exception:
+            metrics["errors"] += 1
+            raise
+        finally:
+            metrics["active"] -= 1
+            metrics["busy_seconds"] += time.monotonic() - start
+
+    def metrics(self) -> dict:
+        """
+        Returns the metrics of the server and of each session.
+
+        Returns
+        -------
+        dict
+            Uptime, number of sessions and of requests in flight, totals of
+            requests, tool calls, errors and rate limited requests, and the
+            same counters per session.
 
+        """
+        sessions = list(self.sessions.values())
+        totals = {key: sum(metrics[key] for metrics in sessions)
+                  for key in ("requests", "tool_calls", "errors",
+                              "rate_limited", "active")}
+
+        return dict(totals,
+                    uptime=time.time() - self.started,
+                    sessions=len(sessions),
+                    per_session={id: dict(metrics)
+                                 for id, metrics in self.sessions.items()})
+
+
+class ResourceNotifier(object):
+    """
+    Notifies MCP clients subscribed to live timing resources when their
+    topic changes.
+
+    Clients of the 2026-07-28 protocol open a `subscriptions/listen`
+    stream, older clients call `resources/subscribe`. Both are served from
+    the changes seen by one poller, which starts with the first
+    subscription if the server does not already poll. Without the mcp 2.x
+    SDK no subscription handler is registered.
+
+    Parameters
+    ----------
+    poller: LiveTimingPoller
+        Poller of the F1 live timing state.
+    topics: tuple
+        Live timing topics exposed as resources.
+
+    Attributes
+    ----------
+    sessions: dict
+        Sessions subscribed with `resources/subscribe`, keyed by URI.
+    """
+
+    def __init__(self, poller: LiveTimingPoller, topics: tuple):
+        self.poller = poller
+        self.topics = topics
+        self.bus = InMemorySubscriptionBus() if mcp_types else None
+        self.listen = ListenHandler(self.bus) if mcp_types else None
+        self.sessions = {}
+        self.polling = False
+        self.token = None
+
+        poller.add_listener(self.changed)
+
+    @staticmethod
+    def uri(topic: str) -> str:
+        return f"mvf1://f1/live-timing/{topic}"
+
+    def register(self, server: FastMCP):
+        """
+        Adds the subscription handlers to an MCP server.
+
+        Parameters
+        ----------
+        server: FastMCP
+            MCP server.
+
+        """
+        # FastMCP has no public hook for these - its extension API refuses
+        # spec methods - so they go on its low-level server, which the
+        # fastmcp pin in requirements.txt and pyproject.toml covers.
+        low_level = getattr(server, "_mcp_server", None)
+
+        if mcp_types is None or low_level is None:
+            return
+
+        handlers = (
+            ("subscriptions/listen",
+             mcp_types.SubscriptionsListenRequestParams, self.listen_stream),
+            ("resources/subscribe",
+             mcp_types.SubscribeRequestParams, self.subscribe),
+            ("resources/unsubscribe",
+             mcp_types.UnsubscribeRequestParams, self.unsubscribe),
+        )
+
+        for method, params, handler in handlers:
+            low_level.add_request_handler(method, params, handler)
+
+    def open(self):
+        self.token = anyio.lowlevel.current_token()
+
+    async def close(self):
+        self.token = None
+
+        if self.listen is not None:
+            self.listen.close()
+
+        self.sessions.clear()
+
+        if self.polling:
+            self.polling = False
+            # The poller thread may be waiting on this loop to publish.
+            await anyio.to_thread.run_sync(self.poller.stop)
+
+    def watch(self):
+        if not self.polling:
+            self.polling = True
+            self.poller.start()
+
+    async def listen_stream(self, ctx, params):
+        if params.notifications.resource_subscriptions:
+            self.watch()
+
+        return await self.listen(ctx, params)
+
+    async def subscribe(self, ctx, params):
+        self.sessions.setdefault(str(params.uri), set()).add(ctx.session)
+        self.watch()
+
+        return mcp_types.EmptyResult()
+
+    async def unsubscribe(self, ctx, params):
+        self.sessions.get(str(params.uri), set()).discard(ctx.session)
+
+        return mcp_types.EmptyResult()
+
+    async def publish(self, uris: list):
+        for uri in uris:
+            await self.bus.publish(ResourceUpdated(uri=uri))
+
+            for session in list(self.sessions.get(uri, ())):
+                try:
+                    await session.send_resource_updated(uri)
+                except Exception:
+                    self.sessions[uri].discard(session)
+
+    def changed(self, snapshot, previous):
+        if (snapshot.series != "f1" or self.token is None
+                or self.bus is None):
+            return
+
+        state = f1_state(snapshot.response)
+        before = f1_state(previous.response) if previous else {}
+        uris = [self.uri(topic) for topic in self.topics
+                if state.get(topic) != before.get(topic)]
+
+        if uris:
+            anyio.from_thread.run(self.publish, uris, token=self.token)
+
+
+def create_mcp_server(url: str = "http://localhost:10101/api/graphql",
+                      cache_ttl: float = CACHE_TTL,
+                      max_workers: int = 8,
+                      tool_limit: int = 4,
+                      tool_limits: Optional[dict] = None,
+                      poll_interval: Optional[float] = None,
+                      delta_log_size: int = 1000,
+                      rate_limit: Optional[float] = None,
+                      burst: Optional[int] = None) -> FastMCP:
+    """
+    Create and configure MCP server with custom MultiViewer URL.
+
+    Tools are async. Blocking calls to MultiViewer run on a bounded pool of
+    `max_workers` threads and each tool admits at most `tool_limit` calls at
+    once (overridable per tool name through `tool_limits`), so a slow tool
+    cannot hold up the others.
+
+    With a `poll_interval`, a background poller keeps the F1 live timing
+    state in memory while the server runs, and the live timing tools
+    answer from it with the version and age of the snapshot. The WEC state
+    is only polled after the first WEC tool call.
+
+    Successive F1 states are kept as patches in a delta log of
+    `delta_log_size` entries, from which `timing_changes_since` serves
+    agents that follow a session. It is fed by the poller, or by the tool
+    itself when the server does not poll.
+
+    One server can serve many sessions at once over HTTP. They all share
+    the client, cache, pool and poller, and each session is limited to
+    `rate_limit` tool calls per second with bursts of `burst`.
+    """
+    client = MultiViewerForF1(uri=url, cache_ttl=cache_ttl)
+    delta_log = DeltaLog(maxlen=delta_log_size)
+    poller = LiveTimingPoller(client, interval=poll_interval or 1.0)
+    notifier = ResourceNotifier(poller, RESOURCE_TOPICS)
+
+    def log_changes(snapshot, previous):
+        if snapshot.series == "f1":
+            delta_log.append(f1_state(snapshot.response))
+
+    poller.add_listener(log_changes)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(server):
+        notifier.open()
+        if poll_interval:
+            poller.start()
+        try:
+            yield {}
+        finally:
+            await notifier.close()
+            if poll_interval:
+                await anyio.to_thread.run_sync(poller.stop)
 
-def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMCP:
-    """Create and configure MCP server with custom MultiViewer URL."""
-    client = MultiViewerForF1(uri=url)
-    
     mcp = FastMCP(name="MultiViewer MCP Server",
+                  lifespan=lifespan,
                   instructions="""
                   This server provides control of MultiViewer,
                   a desktop application for watching motorsports
@@ -21,19 +401,37 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
                   event successfully including the main broadcast,
                   driver onboards and data on the event.
 
-                  Call f1_live_timing_state() for all the data about
-                  the Formula 1 racing session so far.
+                  Call f1_standings(), f1_track_status(),
+                  f1_race_control_messages(), f1_weather(),
+                  f1_tyre_stints() and f1_pit_stops() for compact
+                  summaries of a Formula 1 session. Prefer them to
+                  f1_live_timing_state(), which returns all the raw
+                  data about the session including car telemetry.
+
+                  To follow a Formula 1 session, call
+                  timing_changes_since() once for the full state and a
+                  cursor, then call it again with the cursor to get only
+                  what changed.
+
+                  Subscribe to the mvf1://f1/live-timing/ resources
+                  (TrackStatus, RaceControlMessages, TimingData and
+                  SessionStatus) to be notified when they change instead
+                  of polling.
 
                   Call wec_live_timing_state() for all the data about
                   the World Endurance Championship racing sesion
                   so far.
 
                   Call players() to get the ideas and titles for all
-                  the currently running players.
+                  the currently running players, or players(fields=[...])
+                  to also get their bounds, state, driver and stream data
+                  in one call.
 
                   Call the tools prefixed with players_ to create,
                   delete or manipulate existing MultiViewer video
-                  players.
+                  players. To change several players at once (e.g. to
+                  rearrange the wall), call players_apply() with all the
+                  actions instead of one tool per change.
 
                   For most prompts, you will want to call the appropriate
                   live_timing tool first to get the current state
@@ -55,8 +453,73 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
                   of the screen.
                   """)
 
-    @mcp.tool()
-    def f1_live_timing_clock() -> dict:
+    sessions = SessionMiddleware(rate=rate_limit, burst=burst)
+    mcp.add_middleware(sessions)
+    notifier.register(mcp)
+
+    workers = anyio.CapacityLimiter(max_workers)
+    limits = dict(TOOL_LIMITS, **(tool_limits or {}))
+
+    async def call(fn, *args, **kwargs):
+        return await anyio.to_thread.run_sync(
+            functools.partial(fn, *args, **kwargs), limiter=workers
+        )
+
+    def tool(fn):
+        limiter = anyio.CapacityLimiter(limits.get(fn.__name__, tool_limit))
+
+        @functools.wraps(fn)
+        async def limited(*args, **kwargs):
+            async with limiter:
+                return await fn(*args, **kwargs)
+
+        return mcp.tool()(limited)
+
+    def snapshot_of(series):
+        return poller.snapshot(series) if poller.running else None
+
+    async def live_timing(series, fn):
+        snapshot = snapshot_of(series)
+
+        if snapshot is None:
+            return await call(fn)
+
+        return dict(snapshot.response,
+                    extensions={"snapshot": {"version": snapshot.version,
+                                             "age": snapshot.age}})
+
+    async def f1_topics(summary):
+        snapshot = snapshot_of("f1")
+
+        if snapshot is None:
+            response = await call(client.f1_live_timing_topics,
+                                  timing.TOPICS[summary])
+        else:
+            response = snapshot.response
+
+        return f1_state(response)
+
+    def topic_resource(topic):
+        async def read() -> dict:
+            snapshot = snapshot_of("f1")
+
+            if snapshot is None:
+                response = await call(client.f1_live_timing_topics, [topic])
+            else:
+                response = snapshot.response
+
+            return f1_state(response).get(topic) or {}
+
+        mcp.resource(notifier.uri(topic),
+                     name=topic,
+                     description=RESOURCE_TOPICS[topic],
+                     mime_type="application/json")(read)
+
+    for topic in RESOURCE_TOPICS:
+        topic_resource(topic)
+
+    @tool
+    async def f1_live_timing_clock() -> dict:
         """
         Returns the time for a Formula 1 event when it is playing.
 
@@ -66,10 +529,10 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             Current time.
 
         """
-        return client.f1_live_timing_clock
+        return await call(lambda: client.f1_live_timing_clock)
 
-    @mcp.tool()
-    def f1_live_timing_state() -> dict:
+    @tool
+    async def f1_live_timing_state() -> dict:
         """
         Returns state of live timing for a Formula 1 event
         when it is playing. These data provide the current
@@ -81,12 +544,14 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
         -------
         dict
             Current state of Formula 1 race.
+            When the server polls live timing, extensions.snapshot
+            holds the version and age in seconds of the state.
 
         """
-        return client.f1_live_timing_state
+        return await live_timing("f1", lambda: client.f1_live_timing_state)
 
-    @mcp.tool()
-    def fiawec_live_timing_state() -> dict:
+    @tool
+    async def fiawec_live_timing_state() -> dict:
         """
         Returns state of live timing for a World Endurance
         Championship event when it is playing. These data
@@ -99,28 +564,251 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
         dict
             Current state of World Endurance Championship
             race.
+            When the server polls live timing, extensions.snapshot
+            holds the version and age in seconds of the state.
+
+        """
+        poller.add_series("fiawec")
+
+        return await live_timing("fiawec",
+                                 lambda: client.fiawec_live_timing_state)
+
+    @tool
+    async def f1_standings() -> list:
+        """
+        Returns the running order of a Formula 1 session: position,
+        driver, team, gap to leader, interval to the car ahead, laps,
+        last and best lap, pit stops and pit/retired status.
+
+        Returns
+        -------
+        list
+            One row per driver in position order.
+
+        """
+        return timing.standings(await f1_topics("standings"))
+
+    @tool
+    async def f1_track_status() -> dict:
+        """
+        Returns the track flag (GREEN, YELLOW, SC, VSC, VSC_ENDING or RED),
+        session status and lap count of a Formula 1 session.
+
+        Returns
+        -------
+        dict
+            Track status.
 
         """
-        return client.fiawec_live_timing_state
+        return timing.track_status(await f1_topics("track_status"))
 
-    @mcp.tool()
-    def players() -> list:
+    @tool
+    async def f1_race_control_messages(limit: Optional[int] = 10) -> list:
+        """
+        Returns the latest messages from FIA race control, such as flags,
+        penalties and investigations.
+
+        Parameters
+        ----------
+        limit: int, optional
+            Maximum number of messages, newest last. Defaults to 10.
+
+        Returns
+        -------
+        list
+            Race control messages.
+
+        """
+        return timing.race_control_messages(
+            await f1_topics("race_control_messages"), limit=limit
+        )
+
+    @tool
+    async def f1_weather() -> dict:
+        """
+        Returns the current weather at a Formula 1 session: air and track
+        temperature, humidity, pressure, wind and rainfall.
+
+        Returns
+        -------
+        dict
+            Current weather.
+
+        """
+        return timing.weather(await f1_topics("weather"))
+
+    @tool
+    async def f1_tyre_stints() -> list:
+        """
+        Returns the current tyre compound, tyre age in laps and stint
+        history of each driver in a Formula 1 session.
+
+        Returns
+        -------
+        list
+            One row per driver.
+
+        """
+        return timing.tyre_stints(await f1_topics("tyre_stints"))
+
+    @tool
+    async def f1_pit_stops() -> list:
+        """
+        Returns the pit stops of a Formula 1 session: number of stops,
+        who is in the pit lane and the lap and duration of each driver's
+        latest timed stop.
+
+        Returns
+        -------
+        list
+            One row per driver that has pitted.
+
+        """
+        return timing.pit_stops(await f1_topics("pit_stops"))
+
+    @tool
+    async def timing_changes_since(cursor: Optional[str] = None,
+                                   topics: Optional[list[str]] = None) -> dict:
+        """
+        Returns what changed in the live timing of a Formula 1 session
+        since a cursor, and a new cursor to pass to the next call.
+
+        Parameters
+        ----------
+        cursor: str, optional
+            Cursor returned by the previous call. Leave it out on the first
+            call to get the full state.
+
+        topics: list, optional
+            Live timing topics to report (e.g. ['TimingData',
+            'TrackStatus']). Defaults to all of them.
+
+        Returns
+        -------
+        dict
+            `cursor` for the next call and `changes`, a list of patches in
+            order. A patch holds the changed values by topic, nested dicts
+            only hold the keys that changed, `__deleted__` lists removed
+            keys and `__append__` holds items added to a list. When the
+            cursor is missing or too old, `reset` is true and `state` holds
+            the full state instead.
+
+        """
+        unknown = set(topics or ()) - set(F1_TOPICS)
+
+        if unknown:
+            raise MultiViewerForF1Error(f"Unknown live timing topic "
+                                        f"{', '.join(sorted(unknown))}.")
+
+        if snapshot_of("f1") is None:
+            response = await call(lambda: client.f1_live_timing_state)
+            delta_log.append(f1_state(response))
+
+        return delta_log.since(cursor, topics)
+
+    @tool
+    async def server_metrics() -> dict:
+        """
+        Returns the connection metrics of this MCP server: connected
+        sessions, requests in flight, and request, tool call, error and
+        rate limit counts in total and per session.
+
+        Returns
+        -------
+        dict
+            Server metrics.
+
+        """
+        return sessions.metrics()
+
+    @tool
+    async def players(fields: Optional[list[str]] = None) -> list:
         """
         Returns a list of active MultiViewer video players
         displaying content.
 
+        Without fields, each player is summarized as "id: title". With
+        fields, each player is a dict with its id and the requested fields,
+        all fetched in one request, so there is no need to call player()
+        for each one.
+
+        Parameters
+        ----------
+        fields: list, optional
+            Fields of each player - can be type, state, driverData,
+            streamData, bounds, fullscreen, alwaysOnTop and
+            maintainAspectRatio. A dotted name only returns part of a
+            field, e.g. state.paused, state.muted, state.volume,
+            state.live, state.ts, driverData.tla or streamData.title.
+
         Returns
         -------
         list
-            List of player information as dictionaries.
+            List of player summaries, or of player dicts with fields.
 
         """
-        players_list = client.players
+        if fields:
+            return await call(client.players_data, fields)
+
+        players_list = await call(lambda: client.players)
         # Convert Player objects to serializable dictionaries
         return [str(player) for player in players_list]
 
-    @mcp.tool()
-    def system_info() -> dict:
+    @tool
+    async def players_apply(actions: list[dict],
+                            settle: float = 0.8) -> list:
+        """
+        Applies a list of player actions in as few MultiViewer requests as
+        possible and returns the result of each action.
+
+        Each action is a dict with an `action`, the target player as `id`
+        or `title` and the arguments of the action:
+
+        - create: content_id, driver_tla, driver_number, stream_title, x, y,
+          width, height, fullscreen, always_on_top, maintain_aspect_ratio
+          and a `name` later actions can use as title
+        - set-bounds: x, y, width, height
+        - volume: volume
+        - mute: muted
+        - pause: paused
+        - fullscreen: fullscreen
+        - seek: absolute, relative
+        - sync, close: no arguments
+        - wait: seconds
+
+        For example [{"action": "set-bounds", "id": 3, "x": 0, "y": 0,
+        "width": 384, "height": 216}, {"action": "volume", "title": "PER",
+        "volume": 30}]. Actions run in order and are sent in one request,
+        except after a wait or when an action targets a player created in
+        the same call, which waits `settle` seconds for it to start.
+
+        Parameters
+        ----------
+        actions: list
+            Actions to apply in order.
+
+        settle: float, optional
+            Seconds to wait after creating a player before changing it.
+            Defaults to 0.8.
+
+        Returns
+        -------
+        list
+            One dict per action with its `step`, `action`, the `id` of the
+            player, the `batch` (request) it was sent in and its `result`
+            or `error`.
+
+        """
+        plan = Plan(actions, settle=settle)
+        report = await call(PlanRunner(client).run, plan)
+
+        return [{key: entry[key]
+                 for key in ("step", "action", "id", "batch", "result",
+                             "error")}
+                for entry in report]
+
+    @tool
+    async def system_info() -> dict:
         """
         Returns the information on the system running MultiViewer.
 
@@ -130,10 +818,10 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             System information.
 
         """
-        return client.system_info
+        return await call(lambda: client.system_info)
 
-    @mcp.tool()
-    def version() -> dict:
+    @tool
+    async def version() -> dict:
         """
         Returns the MultiViewer version.
 
@@ -143,10 +831,10 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             Version information.
 
         """
-        return client.version
+        return await call(lambda: client.version)
 
-    @mcp.tool()
-    def player(id: int) -> str:
+    @tool
+    async def player(id: int) -> str:
         """
         Returns the MultiViewer video player with specific id.
 
@@ -161,11 +849,11 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             Player information as string.
 
         """
-        player_obj = client.player(id=id)
+        player_obj = await call(client.player, id=id)
         return str(player_obj)
 
-    @mcp.tool()
-    def player_create(
+    @tool
+    async def player_create(
         content_id,  # Accept both int and str
         driver_tla: Optional[str] = None,
         driver_number: Optional[int] = None,
@@ -232,20 +920,21 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             Most folks put a sleep in between player creation and player
             access.
         """
-        return client.player_create(content_id=content_id,
-                                    driver_tla=driver_tla,
-                                    driver_number=driver_number,
-                                    stream_title=stream_title,
-                                    x=x,
-                                    y=y,
-                                    width=width,
-                                    height=height,
-                                    fullscreen=fullscreen,
-                                    always_on_top=always_on_top,
-                                    maintain_aspect_ratio=maintain_aspect_ratio)
-
-    @mcp.tool()
-    def player_delete(id: int) -> dict:
+        return await call(client.player_create,
+                          content_id=content_id,
+                          driver_tla=driver_tla,
+                          driver_number=driver_number,
+                          stream_title=stream_title,
+                          x=x,
+                          y=y,
+                          width=width,
+                          height=height,
+                          fullscreen=fullscreen,
+                          always_on_top=always_on_top,
+                          maintain_aspect_ratio=maintain_aspect_ratio)
+
+    @tool
+    async def player_delete(id: int) -> dict:
         """
         Deletes a MultiViewer video player.
 
@@ -260,12 +949,12 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             Deletion response.
 
         """
-        return client.player_delete(id=id)
+        return await call(client.player_delete, id=id)
 
-    @mcp.tool()
-    def player_seek_to(id: int,
-                       absolute: Optional[int] = None,
-                       relative: Optional[int] = None) -> dict:
+    @tool
+    async def player_seek_to(id: int,
+                             absolute: Optional[int] = None,
+                             relative: Optional[int] = None) -> dict:
         """
         Seeks to a specific position in time for a MultiViewer view player.
 
@@ -286,12 +975,13 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             Seek response.
 
         """
-        return client.player_seek_to(id=id,
-                                     absolute=absolute,
-                                     relative=relative)
+        return await call(client.player_seek_to,
+                          id=id,
+                          absolute=absolute,
+                          relative=relative)
 
-    @mcp.tool()
-    def player_set_bounds(
+    @tool
+    async def player_set_bounds(
         id: int,
         x: Optional[int] = None,
         y: Optional[int] = None,
@@ -324,14 +1014,15 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_set_bounds(id=id,
-                                        x=x,
-                                        y=y,
-                                        width=width,
-                                        height=height)
-
-    @mcp.tool()
-    def player_set_volume(id: int, volume: int) -> dict:
+        return await call(client.player_set_bounds,
+                          id=id,
+                          x=x,
+                          y=y,
+                          width=width,
+                          height=height)
+
+    @tool
+    async def player_set_volume(id: int, volume: int) -> dict:
         """
         Set the volume of a MultiViewer video player.
 
@@ -349,10 +1040,11 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_set_volume(id=id, volume=volume)
+        return await call(client.player_set_volume, id=id, volume=volume)
 
-    @mcp.tool()
-    def player_set_paused(id: int, paused: Optional[bool] = None) -> dict:
+    @tool
+    async def player_set_paused(id: int,
+                                paused: Optional[bool] = None) -> dict:
         """
         Pauses/unpauses a MultiViewer video player or
         specifies pause state for player.
@@ -371,10 +1063,12 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_set_paused(id=id, paused=paused)
+        return await call(client.player_set_paused, id=id, paused=paused)
 
-    @mcp.tool()
-    def player_set_fullscreen(id: int, fullscreen: Optional[bool] = None) -> dict:
+    @tool
+    async def player_set_fullscreen(
+        id: int, fullscreen: Optional[bool] = None
+    ) -> dict:
         """
         Toggles fullscreen for a MultiViewer video player
         or specifies fullscreen state for player.
@@ -393,10 +1087,12 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_set_fullscreen(id=id, fullscreen=fullscreen)
+        return await call(client.player_set_fullscreen,
+                          id=id,
+                          fullscreen=fullscreen)
 
-    @mcp.tool()
-    def player_set_muted(id: int, muted: Optional[bool] = None) -> dict:
+    @tool
+    async def player_set_muted(id: int, muted: Optional[bool] = None) -> dict:
         """
         Mutes/unmutes MultiViewer video player or specifies
         muted state for player.
@@ -415,10 +1111,10 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_set_muted(id=id, muted=muted)
+        return await call(client.player_set_muted, id=id, muted=muted)
 
-    @mcp.tool()
-    def player_set_speedometer_visibility(
+    @tool
+    async def player_set_speedometer_visibility(
         id: int, visible: Optional[bool] = None
     ) -> dict:
         """
@@ -439,12 +1135,14 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_set_speedometer_visibility(id=id,
-                                                        visible=visible)
+        return await call(client.player_set_speedometer_visibility,
+                          id=id,
+                          visible=visible)
 
-    @mcp.tool()
-    def player_set_driver_header_mode(id: int,
-                                      mode: Optional[str] = None) -> dict:
+    @tool
+    async def player_set_driver_header_mode(
+        id: int, mode: Optional[str] = None
+    ) -> dict:
         """
         Sets the overlay display for a driver onboard MultiViewer vide
         player.
@@ -464,11 +1162,12 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_set_driver_header_mode(id=id,
-                                                    mode=mode)
+        return await call(client.player_set_driver_header_mode,
+                          id=id,
+                          mode=mode)
 
-    @mcp.tool()
-    def player_set_always_on_top(
+    @tool
+    async def player_set_always_on_top(
         id: int, always_on_top: Optional[bool] = None
     ) -> dict:
         """
@@ -488,11 +1187,12 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_set_always_on_top(id=id,
-                                               always_on_top=always_on_top)
+        return await call(client.player_set_always_on_top,
+                          id=id,
+                          always_on_top=always_on_top)
 
-    @mcp.tool()
-    def player_sync(id: int) -> dict:
+    @tool
+    async def player_sync(id: int) -> dict:
         """
         Synchronizes all players to the timestamp of specified MultiViewer
         video player.
@@ -509,10 +1209,10 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_sync(id=id)
+        return await call(client.player_sync, id=id)
 
-    @mcp.tool()
-    def player_sync_to_commentary() -> dict:
+    @tool
+    async def player_sync_to_commentary() -> dict:
         """
         Synchronizes all MultiViewer video players to the player
         with a broadcast commentary stream.
@@ -523,10 +1223,10 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             True if operation is successful.
 
         """
-        return client.player_sync_to_commentary()
+        return await call(client.player_sync_to_commentary)
 
-    @mcp.tool()
-    def player_get_content_id() -> str:
+    @tool
+    async def player_get_content_id() -> str:
         """
         Retrieve the content_id from the first MultiViewer video player.
 
@@ -536,16 +1236,18 @@ def create_mcp_server(url: str = "http://localhost:10101/api/graphql") -> FastMC
             The content_id of the currently playing session.
 
         """
-        players = client.players
+        index = await call(client.player_index)
+        player = next(iter(index), None)
 
-        if len(players) > 0:
-            return players[0].content_id
+        if player is not None:
+            return player.content_id
         else:
             return "No players are currently active."
 
     return mcp
 
 
-# Backward compatibility - create default server instance
-client = MultiViewerForF1()
-mcp = create_mcp_server()
\ No newline at end of file
+# Backward compatibility - create default server instance, which looks
+# players up afresh on every call as it always did
+client = MultiViewerForF1(cache_ttl=0.0)
+mcp = create_mcp_server(cache_ttl=0.0)
\ No newline at end of file
@@ -0,0 +1,307 @@
+import random
+import threading
+import time
+
+from typing import Optional
+
+from .replay import ReplayServer
+from .replay import SimulatedPlayers
+
+# Racing number, TLA, name and team of the synthetic grid, in grid order.
+GRID = (
+    ("1", "VER", "Max VERSTAPPEN", "Red Bull Racing"),
+    ("16", "LEC", "Charles LECLERC", "Ferrari"),
+    ("4", "NOR", "Lando NORRIS", "McLaren"),
+    ("44", "HAM", "Lewis HAMILTON", "Mercedes"),
+    ("11", "PER", "Sergio PEREZ", "Red Bull Racing"),
+    ("55", "SAI", "Carlos SAINZ", "Ferrari"),
+    ("81", "PIA", "Oscar PIASTRI", "McLaren"),
+    ("63", "RUS", "George RUSSELL", "Mercedes"),
+    ("14", "ALO", "Fernando ALONSO", "Aston Martin"),
+    ("18", "STR", "Lance STROLL", "Aston Martin"),
+    ("10", "GAS", "Pierre GASLY", "Alpine"),
+    ("31", "OCO", "Esteban OCON", "Alpine"),
+    ("23", "ALB", "Alexander ALBON", "Williams"),
+    ("2", "SAR", "Logan SARGEANT", "Williams"),
+    ("22", "TSU", "Yuki TSUNODA", "RB"),
+    ("3", "RIC", "Daniel RICCIARDO", "RB"),
+    ("77", "BOT", "Valtteri BOTTAS", "Kick Sauber"),
+    ("24", "ZHO", "Guanyu ZHOU", "Kick Sauber"),
+    ("20", "MAG", "Kevin MAGNUSSEN", "Haas F1 Team"),
+    ("27", "HUL", "Nico HULKENBERG", "Haas F1 Team"),
+)
+
+
+def format_lap(seconds: float) -> str:
+    minutes, seconds = divmod(seconds, 60)
+
+    return f"{int(minutes)}:{seconds:06.3f}" if minutes else f"{seconds:.3f}"
+
+
+def format_gap(laps: float, seconds: float) -> str:
+    return f"{int(laps)} L" if laps >= 1 else f"+{seconds:.3f}"
+
+
+class SyntheticTiming(object):
+    """
+    Synthetic F1 race timing for a MockServer.
+
+    Each driver laps at a constant pace drawn from `seed`, a little slower
+    down the grid, so the order, gaps and intervals evolve like a race
+    without a recording. The session runs `speed` times faster than the
+    wall clock and finishes when the leader completes `laps` laps.
+
+    Parameters
+    ----------
+    drivers: int, optional
+        Number of drivers, extra ones past the 20 of GRID get made up
+        numbers. Defaults to 20.
+    laps: int, optional
+        Race distance. Defaults to 57.
+    lap_time: float, optional
+        Pace of the fastest driver in seconds. Defaults to 90.
+    speed: float, optional
+        Session speed. Defaults to 1, real time.
+    seed: int, optional
+        Seed of the paces. Defaults to 0.
+    clock: callable, optional
+        Wall clock in seconds. Defaults to time.time.
+
+    Attributes
+    ----------
+    grid: list
+        Tuples of racing number, TLA, name, team and pace in seconds.
+    track_start: int
+        Track time of the start in milliseconds.
+    """
+
+    def __init__(self, drivers: int = 20, laps: int = 57,
+                 lap_time: float = 90.0, speed: float = 1.0,
+                 seed: int = 0, clock=time.time):
+        generator = random.Random(seed)
+
+        self.laps = laps
+        self.speed = speed
+        self.clock = clock
+        self.started = clock()
+        self.track_start = int(self.started * 1000)
+        self.grid = []
+
+        for index in range(drivers):
+            if index < len(GRID):
+                number, tla, name, team = GRID[index]
+            else:
+                number, tla = str(100 + index), f"D{index:02d}"
+                name, team = f"Driver {tla}", "Synthetic"
+
+            pace = lap_time + index * 0.05 + generator.uniform(0.0, 0.4)
+            self.grid.append((number, tla, name, team, pace))
+
+        self.duration = laps * min(pace for *_, pace in self.grid)
+
+    @property
+    def elapsed(self) -> float:
+        return min((self.clock() - self.started) * self.speed, self.duration)
+
+    @property
+    def finished(self) -> bool:
+        return self.elapsed >= self.duration
+
+    def live_timing_clock(self) -> dict:
+        """
+        Returns the running live timing clock.
+
+        Returns
+        -------
+        dict
+            Clock with paused, systemTime, trackTime and
+            liveTimingStartTime.
+
+        """
+        return {"paused": self.finished,
+                "systemTime": int(self.clock() * 1000),
+                "trackTime": self.track_start + int(self.elapsed * 1000),
+                "liveTimingStartTime": self.track_start}
+
+    def state(self, series: str) -> Optional[dict]:
+        """
+        Returns the live timing state of a series.
+
+        Parameters
+        ----------
+        series: str
+            f1 or fiawec.
+
+        Returns
+        -------
+        dict
+            F1 state at the current session time, None for other series.
+
+        """
+        return self.f1_state(self.elapsed) if series == "f1" else None
+
+    def f1_state(self, elapsed: float) -> dict:
+        """
+        Returns the F1 live timing state at a session time.
+
+        Parameters
+        ----------
+        elapsed: float
+            Seconds since the start.
+
+        Returns
+        -------
+        dict
+            F1 live timing state.
+
+        """
+        # Laps covered by each driver, the grid starting a quarter second
+        # apart.
+        distances = [(min(max(elapsed - index * 0.25, 0.0) / pace,
+                          self.laps), index)
+                     for index, (*_, pace) in enumerate(self.grid)]
+        order = sorted(distances, reverse=True)
+        leader = order[0][0]
+        lines = {}
+
+        for position, (distance, index) in enumerate(order, start=1):
+            number, tla, name, team, pace = self.grid[index]
+            ahead = order[position - 2][0] if position > 1 else distance
+            completed = int(distance)
+
+            lines[number] = {
+                "RacingNumber": number,
+                "Line": position,
+                "Position": str(position),
+                "GapToLeader": (f"LAP {min(completed + 1, self.laps)}"
+                                if position == 1 else
+                                format_gap(leader - distance,
+                                           (leader - distance) * pace)),
+                "IntervalToPositionAhead": {
+                    "Value": ("" if position == 1 else
+                              format_gap(ahead - distance,
+                                         (ahead - distance) * pace)),
+                    "Catching": False,
+                },
+                "NumberOfLaps": completed,
+                "NumberOfPitStops": 0,
+                "InPit": False,
+                "PitOut": False,
+                "Retired": False,
+                "Stopped": False,
+                "LastLapTime": {"Value": format_lap(pace) if completed
+                                else "", "PersonalFastest": False},
+                "BestLapTime": {"Value": format_lap(pace) if completed
+                                else "", "Lap": 1 if completed else None},
+                "Sectors": [{"Value": format_lap(pace / 3),
+                             "PersonalFastest": False,
+                             "OverallFastest": False,
+                             "Segments": []} for _ in range(3)],
+            }
+
+        finished = elapsed >= self.duration
+
+        return {
+            "SessionInfo": {"Meeting": {"Name": "Synthetic Grand Prix"},
+                            "Name": "Race", "Type": "Race"},
+            "SessionStatus": {"Status": "Finished" if finished
+                              else "Started"},
+            "TrackStatus": {"Status": "1", "Message": "AllClear"},
+            "LapCount": {"CurrentLap": min(int(leader) + 1, self.laps),
+                         "TotalLaps": self.laps},
+            "DriverList": {number: {"RacingNumber": number, "Tla": tla,
+                                    "FullName": name, "TeamName": team,
+                                    "Line": lines[number]["Line"]}
+                           for number, tla, name, team, _ in self.grid},
+            "TimingData": {"Lines": lines},
+            "RaceControlMessages": {"Messages": [
+                {"Lap": 1, "Category": "Flag", "Flag": "GREEN",
+                 "Scope": "Track", "Message": "GREEN LIGHT - PIT EXIT OPEN"},
+            ]},
+        }
+
+
+class MockServer(ReplayServer):
+    """
+    MultiViewerForF1 GraphQL API stand-in with injected latency and errors.
+
+    A ReplayServer - stateful SimulatedPlayers honouring every mutation,
+    over real HTTP on its own threads - serving SyntheticTiming by default,
+    for integration tests and benchmarks. Each request is delayed by
+    `latency` plus up to `jitter` seconds, and fails with an HTTP 500 with
+    probability `http_error_rate` or with a GraphQL error with probability
+    `error_rate`.
+
+    Parameters
+    ----------
+    timing: object, optional
+        Source with `state(series)` and `live_timing_clock()` methods.
+        Defaults to SyntheticTiming.
+    players: SimulatedPlayers, optional
+        Simulated players. Defaults to new SimulatedPlayers.
+    latency: float, optional
+        Seconds added to every request. Defaults to 0.
+    jitter: float, optional
+        Maximum random seconds added on top of `latency`. Defaults to 0.
+    error_rate: float, optional
+        Probability a request answers a GraphQL error. Defaults to 0.
+    http_error_rate: float, optional
+        Probability a request answers an HTTP 500. Defaults to 0.
+    seed: int, optional
+        Seed of the jitter and errors, for reproducible runs.
+    create_lag: float, optional
+        Seconds before a created player is visible. Defaults to 0.
+    host: str, optional
+        Host to bind. Defaults to 127.0.0.1.
+    port: int, optional
+        Port to bind, 0 for any free port. Defaults to 0.
+
+    Attributes
+    ----------
+    requests: int
+        Number of requests received.
+    errors: int
+        Number of errors injected.
+    """
+
+    def __init__(self, timing=None,
+                 players: Optional[SimulatedPlayers] = None,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 error_rate: float = 0.0,
+                 http_error_rate: float = 0.0,
+                 seed: Optional[int] = None,
+                 create_lag: float = 0.0,
+                 host: str = "127.0.0.1", port: int = 0):
+        super().__init__(timing if timing is not None else SyntheticTiming(),
+                         players, create_lag=create_lag, host=host,
+                         port=port)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.http_error_rate = http_error_rate
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def respond(self, request: dict) -> tuple:
+        with self.lock:
+            self.requests += 1
+            delay = self.latency + self.random.uniform(0.0, self.jitter)
+            roll = self.random.random()
+
+        if delay:
+            time.sleep(delay)
+
+        if roll < self.http_error_rate + self.error_rate:
+            with self.lock:
+                self.errors += 1
+
+            if roll < self.http_error_rate:
+                return 500, {"errors": [{"message": "Injected HTTP error"}]}
+
+            return 200, {"data": None,
+                         "errors": [{"message": "Injected error"}]}
+
+        return super().respond(request)
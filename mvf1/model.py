@@ -0,0 +1,460 @@
+from typing import Optional
+
+from .delta import APPEND
+from .delta import DELETED
+from .delta import diff
+from .poller import F1Listener
+
+
+# Topics of the F1 live timing state the race model reads.
+TOPICS = ("TimingData", "DriverList")
+
+
+def lap_seconds(value) -> Optional[float]:
+    """
+    Returns the seconds of a live timing lap or sector time.
+
+    Parameters
+    ----------
+    value: str
+        Time such as 1:21.456 or 26.101.
+
+    Returns
+    -------
+    float
+        Seconds or None if the time is empty or not a time.
+
+    """
+    if not value:
+        return None
+
+    minutes, _, seconds = str(value).rpartition(":")
+
+    try:
+        return int(minutes or 0) * 60 + float(seconds)
+    except ValueError:
+        return None
+
+
+def gap_seconds(value) -> Optional[float]:
+    """
+    Returns the seconds of a live timing gap or interval.
+
+    Parameters
+    ----------
+    value: str
+        Gap such as +0.812, or LAP 34 for the leader.
+
+    Returns
+    -------
+    float
+        Seconds, 0 for the leader, or None for lapped cars ('1 L') and
+        missing gaps.
+
+    """
+    if not value:
+        return None
+
+    value = str(value)
+
+    if value.startswith("LAP"):
+        return 0.0
+
+    try:
+        return float(value.lstrip("+"))
+    except ValueError:
+        return None
+
+
+def _items(value):
+    """
+    Returns the index and item pairs of a list, or of a dict keyed by
+    index as live timing sends partial list updates.
+    """
+    if isinstance(value, dict):
+        return [(int(key), item) for key, item in value.items()
+                if key not in (APPEND, DELETED)]
+
+    return list(enumerate(value or []))
+
+
+class LapTime(object):
+    """
+    A lap time of a driver.
+
+    Attributes
+    ----------
+    value: str
+        Time as sent by live timing (e.g. '1:21.456').
+    seconds: float
+        Time in seconds or None.
+    lap: int
+        Lap of the time, for best laps.
+    personal_fastest: bool
+        Whether it is the personal best of the driver.
+    """
+
+    __slots__ = ("value", "seconds", "lap", "personal_fastest")
+
+    def __init__(self):
+        self.value = None
+        self.seconds = None
+        self.lap = None
+        self.personal_fastest = False
+
+    def __repr__(self) -> str:
+        return f"{self.value}"
+
+    def update(self, data):
+        if not isinstance(data, dict):
+            data = {"Value": data}
+
+        if "Value" in data:
+            self.value = data["Value"]
+            self.seconds = lap_seconds(self.value)
+        if "Lap" in data:
+            self.lap = data["Lap"]
+        if "PersonalFastest" in data:
+            self.personal_fastest = bool(data["PersonalFastest"])
+
+
+class Sector(object):
+    """
+    A sector of the current lap of a driver.
+
+    Attributes
+    ----------
+    value: str
+        Sector time as sent by live timing.
+    seconds: float
+        Sector time in seconds or None.
+    personal_fastest: bool
+        Whether it is the personal best sector of the driver.
+    overall_fastest: bool
+        Whether it is the fastest sector of the session.
+    segments: list
+        Status code of each mini sector.
+    """
+
+    __slots__ = ("value", "seconds", "personal_fastest", "overall_fastest",
+                 "segments")
+
+    def __init__(self):
+        self.value = None
+        self.seconds = None
+        self.personal_fastest = False
+        self.overall_fastest = False
+        self.segments = []
+
+    def __repr__(self) -> str:
+        return f"{self.value}"
+
+    def update(self, data: dict):
+        if "Value" in data:
+            self.value = data["Value"]
+            self.seconds = lap_seconds(self.value)
+        if "PersonalFastest" in data:
+            self.personal_fastest = bool(data["PersonalFastest"])
+        if "OverallFastest" in data:
+            self.overall_fastest = bool(data["OverallFastest"])
+        if "Segments" in data:
+            segments = data["Segments"]
+
+            if isinstance(segments, list):
+                self.segments = [None] * len(segments)
+
+            for index, segment in _items(segments):
+                self.segments.extend([None] * (index + 1
+                                               - len(self.segments)))
+                self.segments[index] = (segment.get("Status")
+                                        if isinstance(segment, dict)
+                                        else segment)
+
+            if isinstance(segments, dict) and APPEND in segments:
+                self.segments.extend(segment.get("Status")
+                                     for segment in segments[APPEND])
+
+
+class Line(object):
+    """
+    The timing line of a driver.
+
+    Attributes
+    ----------
+    number: str
+        Racing number.
+    tla: str
+        Three letter acronym.
+    team: str
+        Team name.
+    position: int
+        Position or None.
+    gap: str
+        Gap to the leader as sent by live timing.
+    gap_seconds: float
+        Gap to the leader in seconds, None for lapped cars.
+    interval: str
+        Interval to the car ahead as sent by live timing.
+    interval_seconds: float
+        Interval in seconds, None for lapped cars.
+    catching: bool
+        Whether the driver is catching the car ahead.
+    laps: int
+        Completed laps.
+    pit_stops: int
+        Number of pit stops.
+    in_pit: bool
+        Whether the driver is in the pit lane.
+    pit_out: bool
+        Whether the driver just left the pit lane.
+    retired: bool
+        Whether the driver retired.
+    stopped: bool
+        Whether the car stopped.
+    last_lap: LapTime
+        Last lap time.
+    best_lap: LapTime
+        Best lap time.
+    sectors: list
+        Sectors of the current lap.
+    """
+
+    __slots__ = ("number", "tla", "team", "position", "gap", "gap_seconds",
+                 "interval", "interval_seconds", "catching", "laps",
+                 "pit_stops", "in_pit", "pit_out", "retired", "stopped",
+                 "last_lap", "best_lap", "sectors")
+
+    def __init__(self, number: str):
+        self.number = number
+        self.tla = None
+        self.team = None
+        self.position = None
+        self.gap = None
+        self.gap_seconds = None
+        self.interval = None
+        self.interval_seconds = None
+        self.catching = False
+        self.laps = None
+        self.pit_stops = 0
+        self.in_pit = False
+        self.pit_out = False
+        self.retired = False
+        self.stopped = False
+        self.last_lap = LapTime()
+        self.best_lap = LapTime()
+        self.sectors = []
+
+    def __repr__(self) -> str:
+        return f"P{self.position} {self.tla or self.number}"
+
+    def update(self, data: dict):
+        """
+        Applies a TimingData line or a patch of one.
+
+        Parameters
+        ----------
+        data: dict
+            Full line or changed fields only.
+
+        """
+        if "Position" in data:
+            try:
+                self.position = int(data["Position"])
+            except (TypeError, ValueError):
+                self.position = None
+        if "GapToLeader" in data:
+            self.gap = data["GapToLeader"]
+            self.gap_seconds = gap_seconds(self.gap)
+        if "IntervalToPositionAhead" in data:
+            interval = data["IntervalToPositionAhead"]
+
+            if not isinstance(interval, dict):
+                interval = {"Value": interval}
+            if "Value" in interval:
+                self.interval = interval["Value"]
+                self.interval_seconds = gap_seconds(self.interval)
+            if "Catching" in interval:
+                self.catching = bool(interval["Catching"])
+        if "NumberOfLaps" in data:
+            self.laps = data["NumberOfLaps"]
+        if "NumberOfPitStops" in data:
+            self.pit_stops = data["NumberOfPitStops"] or 0
+        if "InPit" in data:
+            self.in_pit = bool(data["InPit"])
+        if "PitOut" in data:
+            self.pit_out = bool(data["PitOut"])
+        if "Retired" in data:
+            self.retired = bool(data["Retired"])
+        if "Stopped" in data:
+            self.stopped = bool(data["Stopped"])
+        if "LastLapTime" in data:
+            self.last_lap.update(data["LastLapTime"])
+        if "BestLapTime" in data:
+            self.best_lap.update(data["BestLapTime"])
+        if "Sectors" in data:
+            sectors = data["Sectors"]
+
+            if isinstance(sectors, list):
+                del self.sectors[len(sectors):]
+
+            for index, sector in _items(sectors):
+                while len(self.sectors) <= index:
+                    self.sectors.append(Sector())
+
+                self.sectors[index].update(sector)
+
+            if isinstance(sectors, dict) and APPEND in sectors:
+                for sector in sectors[APPEND]:
+                    self.sectors.append(Sector())
+                    self.sectors[-1].update(sector)
+
+
+class RaceModel(F1Listener):
+    """
+    Typed model of the running order, kept current from live timing.
+
+    The model keeps a Line per driver, indexed by racing number and three
+    letter acronym, and applies only what changed: `apply` takes a patch
+    from `delta.diff` (for example from a DeltaLog) and `ingest` diffs a
+    full state against the previous one. Either way, fields that did not
+    change are not parsed again.
+
+    Attributes
+    ----------
+    lines: dict
+        Line of each driver keyed by racing number.
+    tlas: dict
+        Line of each driver keyed by three letter acronym.
+    state: dict
+        TimingData and DriverList of the latest ingested state.
+    """
+
+    def __init__(self):
+        self.lines = {}
+        self.tlas = {}
+        self.state = {}
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __getitem__(self, key) -> Line:
+        line = self.driver(key)
+
+        if line is None:
+            raise KeyError(key)
+
+        return line
+
+    def driver(self, key) -> Optional[Line]:
+        """
+        Returns the line of a driver.
+
+        Parameters
+        ----------
+        key: int or str
+            Racing number or three letter acronym.
+
+        Returns
+        -------
+        Line
+            Line or None if unknown.
+
+        """
+        key = str(key)
+
+        return self.lines.get(key) or self.tlas.get(key.upper())
+
+    @property
+    def order(self) -> list:
+        """
+        Returns the lines in position order, unknown positions last.
+        """
+        last = len(self.lines) + 1
+
+        return sorted(self.lines.values(),
+                      key=lambda line: line.position or last)
+
+    @property
+    def leader(self) -> Optional[Line]:
+        order = self.order
+
+        return order[0] if order else None
+
+    @property
+    def fastest_lap(self) -> Optional[Line]:
+        """
+        Returns the line with the fastest best lap.
+        """
+        timed = [line for line in self.lines.values()
+                 if line.best_lap.seconds is not None]
+
+        return min(timed, key=lambda line: line.best_lap.seconds,
+                   default=None)
+
+    def line(self, number: str) -> Line:
+        if number not in self.lines:
+            self.lines[number] = Line(number)
+
+        return self.lines[number]
+
+    def apply(self, patch: dict):
+        """
+        Applies a patch of the F1 live timing state.
+
+        Parameters
+        ----------
+        patch: dict
+            Patch from `delta.diff`, or a full state.
+
+        """
+        for number, driver in ((patch.get("DriverList") or {}).items()):
+            if number == DELETED or not isinstance(driver, dict):
+                continue
+
+            line = self.line(number)
+
+            if "Tla" in driver:
+                self.tlas.pop(line.tla, None)
+                line.tla = driver["Tla"]
+                self.tlas[line.tla] = line
+            if "TeamName" in driver:
+                line.team = driver["TeamName"]
+
+        lines = (patch.get("TimingData") or {}).get("Lines") or {}
+
+        for number, data in lines.items():
+            if number == DELETED:
+                for removed in data:
+                    line = self.lines.pop(removed, None)
+
+                    if line is not None:
+                        self.tlas.pop(line.tla, None)
+            else:
+                self.line(number).update(data)
+
+    def ingest(self, state: dict) -> dict:
+        """
+        Updates the model from a full F1 live timing state.
+
+        Parameters
+        ----------
+        state: dict
+            F1 live timing state.
+
+        Returns
+        -------
+        dict
+            Patch applied, empty if nothing the model reads changed.
+
+        """
+        current = {topic: state.get(topic) or {} for topic in TOPICS}
+        patch = diff(self.state, current)
+        self.state = current
+
+        if patch:
+            self.apply(patch)
+
+        return patch
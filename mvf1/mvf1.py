@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+
 from typing import Optional
 
 from sgqlc.operation import Operation
@@ -8,6 +11,31 @@ from .mvf1_schema import mvf1_schema as schema
 from .mvf1_schema import PlayerCreateInput
 from .mvf1_schema import RectangleInput
 
+# Schema field names of the F1 live timing topics, keyed by topic name.
+F1_TOPICS = {
+    getattr(schema.F1LiveTimingState, field).graphql_name: field
+    for field in schema.F1LiveTimingState.__field_names__
+}
+
+# Seconds a players snapshot is trusted for lookups by default. Mutations
+# keep the snapshot current, so this only bounds how long players opened
+# or closed in the app itself go unnoticed.
+CACHE_TTL = 2.0
+
+
+def _field_name(type, name: str) -> str:
+    names = {getattr(type, field).graphql_name: field
+             for field in getattr(type, "__field_names__", ())}
+
+    if not names:
+        raise MultiViewerForF1Error(f"{type} has no field {name}.")
+
+    if name not in names:
+        raise MultiViewerForF1Error(f"Unknown field {name} of {type} - can "
+                                    f"be {', '.join(names)}.")
+
+    return names[name]
+
 
 class MultiViewerForF1(object):
     """
@@ -22,15 +50,29 @@ class MultiViewerForF1(object):
     Uri to control the MultiViewerForF1 install.
     Defaults to http://localhost:101010/api/graphql
 
+    cache_ttl: float, optional
+    Seconds a players snapshot is trusted for lookups before it is
+    refetched. Defaults to CACHE_TTL; 0 always refetches.
+
     Attributes
     ----------
     endpoint: HTTPEndpoint
         GraphQL API Endpoint of MultiViewerForF1.
+    index: PlayerIndex
+        Players from the latest snapshot, kept current by mutations.
+    seek_index: SeekIndex
+        Track times of laps and events for `seek_all_to_lap`,
+        `seek_all_to_event` and `Player.seek_to_lap`. None until set.
 
     """
 
-    def __init__(self, uri="http://localhost:10101/api/graphql"):
+    def __init__(self, uri="http://localhost:10101/api/graphql",
+                 cache_ttl: float = CACHE_TTL):
+        self.uri = uri
         self.endpoint = HTTPEndpoint(uri)
+        self.index = PlayerIndex()
+        self.cache_ttl = cache_ttl
+        self.seek_index = None
 
     def perform_operation(self,
                           operation: Operation) -> dict:
@@ -56,6 +98,38 @@ class MultiViewerForF1(object):
         else:
             return response
 
+    def perform_mutation(self,
+                         operation: Operation,
+                         mutation: str,
+                         id: Optional[int] = None) -> dict:
+        """
+        Performs a GraphQL mutation and applies its result to the player
+        index.
+
+        Parameters
+        ----------
+        operation: Operation
+            GraphQL Operation.
+
+        mutation: str
+            Name of the mutation on the schema (e.g. 'player_set_volume').
+
+        id: int, optional
+            Id of the mutated player.
+
+        Returns
+        -------
+        dict
+            MultiViewerForF1 API Response.
+
+        """
+        response = self.perform_operation(operation)
+
+        field = getattr(schema.Mutation, mutation).graphql_name
+        self.index.apply(mutation, id, (response.get("data") or {}).get(field))
+
+        return response
+
     @property
     def live_timing_clock(self) -> dict:
         """
@@ -120,6 +194,35 @@ class MultiViewerForF1(object):
 
         return self.perform_operation(operation)
 
+    def f1_live_timing_topics(self, topics: list) -> dict:
+        """
+        Returns only the requested topics of the F1 live timing state.
+
+        Parameters
+        ----------
+        topics: list
+            Topic names as sent by live timing (e.g. 'TimingData' or
+            'TrackStatus').
+
+        Returns
+        -------
+        dict
+            Current state of the requested topics.
+
+        """
+        fields = []
+
+        for topic in topics:
+            if topic not in F1_TOPICS:
+                raise MultiViewerForF1Error(f"Unknown live timing topic "
+                                            f"{topic}.")
+            fields.append(F1_TOPICS[topic])
+
+        operation = Operation(schema.Query)
+        operation.f1_live_timing_state().__fields__(*fields)
+
+        return self.perform_operation(operation)
+
     @property
     def fiawec_live_timing_state(self) -> dict:
         """
@@ -155,10 +258,57 @@ class MultiViewerForF1(object):
         players = []
 
         for player_data in players_data["data"]["players"]:
-            players.append(Player(player_data))
+            players.append(Player(player_data, remote=self))
+
+        self.index.replace(players)
 
         return players
 
+    def players_data(self, fields: Optional[list] = None) -> list:
+        """
+        Returns the data of active MultiViewerForF1 players, projected on
+        some fields, in one request.
+
+        Parameters
+        ----------
+        fields: list, optional
+            Fields to fetch as named by the API (e.g. 'bounds', 'state' or
+            'streamData'). A dotted name like 'state.volume' only fetches
+            part of a field. The id is always fetched. Defaults to all
+            fields.
+
+        Returns
+        -------
+        list
+            Dict of each player keyed by field name.
+
+        """
+        operation = Operation(schema.Query)
+        selection = operation.players()
+
+        if fields:
+            names = ["id"]
+            subfields = {}
+
+            for field in fields:
+                name, _, subfield = field.partition(".")
+                name = _field_name(schema.Player, name)
+
+                if not subfield:
+                    names.append(name)
+                elif name not in names:
+                    subfields.setdefault(name, []).append(_field_name(
+                        getattr(schema.Player, name).type, subfield
+                    ))
+
+            selection.__fields__(*dict.fromkeys(names))
+
+            for name, selected in subfields.items():
+                if name not in names:
+                    getattr(selection, name).__fields__(*selected)
+
+        return self.perform_operation(operation)["data"]["players"]
+
     @property
     def system_info(self) -> dict:
         """
@@ -210,7 +360,80 @@ class MultiViewerForF1(object):
         operation.player(id=id)
 
         player_data = self.perform_operation(operation)
-        return Player(player_data["data"]["player"])
+
+        player = Player(player_data["data"]["player"], remote=self)
+        self.index.add(player)
+
+        return player
+
+    def player_index(self, max_age: Optional[float] = None) -> "PlayerIndex":
+        """
+        Returns the player index, refetching the players only when the
+        cached snapshot is older than `max_age`.
+
+        Parameters
+        ----------
+        max_age: float, optional
+            Maximum age of the snapshot in seconds. Defaults to `cache_ttl`.
+
+        Returns
+        -------
+        PlayerIndex
+            Current player index.
+
+        """
+        if max_age is None:
+            max_age = self.cache_ttl
+
+        age = self.index.age
+
+        if age is None or age > max_age:
+            self.players
+
+        return self.index
+
+    def find_player(self,
+                    title: Optional[str] = None,
+                    driver_tla: Optional[str] = None,
+                    driver_number: Optional[int] = None,
+                    type: Optional[str] = None,
+                    content_id: Optional[str] = None,
+                    session_key: Optional[str] = None) -> Optional["Player"]:
+        """
+        Returns the first player matching every given key.
+
+        Parameters
+        ----------
+        title: str, optional
+            Title of stream (e.g. 'INTERNATIONAL' or 'PER').
+
+        driver_tla: str, optional
+            Driver three letter acronym (e.g. 'PER' or 'HAM').
+
+        driver_number: int, optional
+            Driver Number.
+
+        type: str, optional
+            Player type - can be OBC or ADDITIONAL.
+
+        content_id: str, optional
+            F1TV Content ID.
+
+        session_key: str, optional
+            Session key of the stream.
+
+        Returns
+        -------
+        Player
+            Matching player or None.
+
+        """
+        return self.player_index().find(title=title,
+                                        driver_tla=driver_tla,
+                                        driver_number=driver_number,
+                                        type=type,
+                                        content_id=content_id,
+                                        session_key=session_key)
 
     def player_create(
         self,
@@ -300,7 +523,7 @@ class MultiViewerForF1(object):
 
         operation.player_create(input=player)
 
-        player_data = self.perform_operation(operation)
+        player_data = self.perform_mutation(operation, "player_create")
 
         return player_data
 
@@ -322,7 +545,7 @@ class MultiViewerForF1(object):
         operation = Operation(schema.Mutation)
         operation.player_delete(id=id)
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_delete", id)
 
     def player_seek_to(
         self, id: int, absolute: Optional[int] = None, relative: Optional[int] = None
@@ -350,7 +573,7 @@ class MultiViewerForF1(object):
         operation = Operation(schema.Mutation)
         operation.player_seek_to(id=id, absolute=absolute, relative=relative)
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_seek_to", id)
 
     def player_set_bounds(
         self,
@@ -392,7 +615,7 @@ class MultiViewerForF1(object):
 
         operation.player_set_bounds(id=id, bounds=bounds)
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_set_bounds", id)
 
     def player_set_volume(self, id: int, volume: int) -> dict:
         """
@@ -415,7 +638,7 @@ class MultiViewerForF1(object):
         operation = Operation(schema.Mutation)
         operation.player_set_volume(id=id, volume=volume)
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_set_volume", id)
 
     def player_set_paused(self, id: int, paused: Optional[bool] = None) -> dict:
         """
@@ -438,7 +661,7 @@ class MultiViewerForF1(object):
         operation = Operation(schema.Mutation)
         operation.player_set_paused(id=id, paused=paused)
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_set_paused", id)
 
     def player_set_fullscreen(self, id: int, fullscreen: Optional[bool] = None) -> dict:
         """
@@ -462,7 +685,7 @@ class MultiViewerForF1(object):
         operation = Operation(schema.Mutation)
         operation.player_set_fullscreen(id=id, fullscreen=fullscreen)
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_set_fullscreen", id)
 
     def player_set_muted(self, id: int, muted: Optional[bool] = None) -> dict:
         """
@@ -485,7 +708,7 @@ class MultiViewerForF1(object):
         operation = Operation(schema.Mutation)
         operation.player_set_muted(id=id, muted=muted)
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_set_muted", id)
 
     def player_set_speedometer_visibility(
         self, id: int, visible: Optional[bool] = None
@@ -511,7 +734,7 @@ class MultiViewerForF1(object):
         operation = Operation(schema.Mutation)
         operation.player_set_speedometer_visibility(id=id, visible=visible)
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_set_speedometer_visibility", id)
 
     def player_set_driver_header_mode(self,
                                       id: int,
@@ -540,7 +763,8 @@ class MultiViewerForF1(object):
         operation.player_set_driver_header_mode(id=id, mode=mode)
 
         try:
-            return self.perform_operation(operation)
+            return self.perform_mutation(operation,
+                                         "player_set_driver_header_mode", id)
         except ValueError as e:
             raise MultiViewerForF1Error(f"{e} - can be DRIVER_HEADER, NONE"
                                          " or OBC_LIVE_TIMING.")
@@ -568,7 +792,7 @@ class MultiViewerForF1(object):
         operation = Operation(schema.Mutation)
         operation.player_set_always_on_top(id=id, always_on_top=always_on_top) 
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_set_always_on_top", id)
 
     def player_sync(self, id: int) -> dict:
         """
@@ -588,7 +812,20 @@ class MultiViewerForF1(object):
         operation = Operation(schema.Mutation)
         operation.player_sync(id=id)
 
-        return self.perform_operation(operation)
+        return self.perform_mutation(operation, "player_sync", id)
+
+    def batch(self) -> "MutationBatch":
+        """
+        Returns a batch that sends several player mutations in a single
+        GraphQL request.
+
+        Returns
+        -------
+        MutationBatch
+            Empty mutation batch bound to this MultiViewerForF1.
+
+        """
+        return MutationBatch(self)
 
     def player_sync_to_commentary(self) -> dict:
         """
@@ -600,15 +837,143 @@ class MultiViewerForF1(object):
             True if operation is successful.
 
         """
-        for player in self.players:
-            if (
-                player.stream_data["title"] == "INTERNATIONAL"
-                or player.stream_data["title"] == "F1 LIVE"
-            ):
+        index = self.player_index()
+
+        for title in ("INTERNATIONAL", "F1 LIVE"):
+            player = index.find(title=title)
+
+            if player is not None:
                 return player.sync()
 
         return {"data": "No player has commentary."}
 
+    def lap_position(self, lap: int, driver=None,
+                     lead: float = 0.0) -> float:
+        """
+        Returns the player position at which a lap starts, from
+        `seek_index`.
+
+        Parameters
+        ----------
+        lap: int
+            Lap number.
+        driver: int or str, optional
+            Racing number. Defaults to the lap of the leader.
+        lead: float, optional
+            Seconds to start before the lap. Defaults to 0.
+
+        Returns
+        -------
+        float
+            Position in seconds.
+
+        """
+        index = self._seek_index()
+
+        return index.position(index.lap_track(lap, driver), lead)
+
+    def event_position(self, event, occurrence: int = 1,
+                       lead: float = 0.0) -> float:
+        """
+        Returns the player position of an event, from `seek_index`.
+
+        Parameters
+        ----------
+        event: str or dict
+            Flag (e.g. 'RED'), text of a race control message (e.g.
+            'SAFETY CAR DEPLOYED'), or an event of `seek_index.events`.
+        occurrence: int, optional
+            Which matching event, 1 for the first, -1 for the latest.
+            Defaults to 1.
+        lead: float, optional
+            Seconds to start before the event. Defaults to 0.
+
+        Returns
+        -------
+        float
+            Position in seconds.
+
+        """
+        index = self._seek_index()
+
+        return index.position(index.event_track(event, occurrence), lead)
+
+    def seek_all_to(self, absolute: float) -> list:
+        """
+        Seeks every player to the same position in a single request.
+
+        Parameters
+        ----------
+        absolute: float
+            Position in seconds.
+
+        Returns
+        -------
+        list
+            Results of the seek of each player, see `MutationBatch.execute`.
+
+        """
+        batch = self.batch()
+
+        for player in self.player_index():
+            batch.player_seek_to(player.id, absolute=absolute)
+
+        return batch.execute() if len(batch) else []
+
+    def seek_all_to_lap(self, lap: int, driver=None,
+                        lead: float = 0.0) -> list:
+        """
+        Seeks every player to the start of a lap in a single request.
+
+        Parameters
+        ----------
+        lap: int
+            Lap number.
+        driver: int or str, optional
+            Racing number. Defaults to the lap of the leader.
+        lead: float, optional
+            Seconds to start before the lap. Defaults to 0.
+
+        Returns
+        -------
+        list
+            Results of the seek of each player, see `MutationBatch.execute`.
+
+        """
+        return self.seek_all_to(self.lap_position(lap, driver, lead))
+
+    def seek_all_to_event(self, event, occurrence: int = 1,
+                          lead: float = 0.0) -> list:
+        """
+        Seeks every player to an event in a single request, e.g. the red
+        flag with seek_all_to_event('RED').
+
+        Parameters
+        ----------
+        event: str or dict
+            Flag, text of a race control message, or an event of
+            `seek_index.events`.
+        occurrence: int, optional
+            Which matching event, 1 for the first, -1 for the latest.
+            Defaults to 1.
+        lead: float, optional
+            Seconds to start before the event. Defaults to 0.
+
+        Returns
+        -------
+        list
+            Results of the seek of each player, see `MutationBatch.execute`.
+
+        """
+        return self.seek_all_to(self.event_position(event, occurrence, lead))
+
+    def _seek_index(self):
+        if self.seek_index is None:
+            raise MultiViewerForF1Error("No seek index - set seek_index to a "
+                                        "SeekIndex.")
+
+        return self.seek_index
+
 
 class Player(object):
     """
@@ -646,12 +1011,16 @@ class Player(object):
         Is player always on top?
     maintain_aspect_ratio: bool
         Does player maintain aspect ratio?
+    type: str
+        Player type - OBC or ADDITIONAL.
     remote: MultiViewerForF1
         Interface to control MultiViewerForF1.
     """
 
-    def __init__(self, player_dict: dict):
+    def __init__(self, player_dict: dict,
+                 remote: Optional[MultiViewerForF1] = None):
         self.id = player_dict["id"]
+        self.type = player_dict.get("type")
         self.state = player_dict["state"]
         self.driver_data = player_dict["driverData"]
         self.stream_data = player_dict["streamData"]
@@ -666,7 +1035,7 @@ class Player(object):
         self.fullscreen = player_dict["fullscreen"]
         self.always_on_top = player_dict["alwaysOnTop"]
         self.maintain_aspect_ratio = player_dict["maintainAspectRatio"]
-        self.remote = MultiViewerForF1()
+        self.remote = remote if remote is not None else MultiViewerForF1()
 
     def __repr__(self) -> str:
         """
@@ -712,6 +1081,55 @@ class Player(object):
         """
         return self.remote.player_seek_to(self.id, absolute=absolute, relative=relative)
 
+    def seek_to_lap(self, lap: int, driver=None, lead: float = 0.0) -> dict:
+        """
+        Seeks this player to the start of a lap, from the seek index of
+        its MultiViewerForF1.
+
+        Parameters
+        ----------
+        lap: int
+            Lap number.
+        driver: int or str, optional
+            Racing number. Defaults to the lap of the leader.
+        lead: float, optional
+            Seconds to start before the lap. Defaults to 0.
+
+        Returns
+        -------
+        dict
+            Server response of this player's seek operation.
+
+        """
+        return self.seek(absolute=self.remote.lap_position(lap, driver, lead))
+
+    def seek_to_event(self, event, occurrence: int = 1,
+                      lead: float = 0.0) -> dict:
+        """
+        Seeks this player to an event, from the seek index of its
+        MultiViewerForF1.
+
+        Parameters
+        ----------
+        event: str or dict
+            Flag, text of a race control message, or an event of the seek
+            index.
+        occurrence: int, optional
+            Which matching event, 1 for the first, -1 for the latest.
+            Defaults to 1.
+        lead: float, optional
+            Seconds to start before the event. Defaults to 0.
+
+        Returns
+        -------
+        dict
+            Server response of this player's seek operation.
+
+        """
+        return self.seek(absolute=self.remote.event_position(event,
+                                                             occurrence,
+                                                             lead))
+
     def set_bounds(
         self,
         x: Optional[int] = None,
@@ -922,6 +1340,513 @@ class Player(object):
         )
 
 
+class PlayerIndex(object):
+    """
+    Index of MultiViewerForF1 players for lookups without a refetch.
+
+    Players are keyed by id, title, driver TLA, driver number, type and
+    content/session key. The index is replaced by each players snapshot
+    and updated in place by the results of mutations, so a lookup costs a
+    dict access instead of a query.
+
+    Attributes
+    ----------
+    players: dict
+        Player objects keyed by id, in snapshot order.
+    updated: float
+        Monotonic time of the latest snapshot or None if never fetched.
+    """
+
+    KEYS = ("title", "driver_tla", "driver_number", "type", "content_id",
+            "session_key")
+
+    def __init__(self):
+        self.players = {}
+        self.keys = {key: {} for key in self.KEYS}
+        self.updated = None
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.players)
+
+    def __iter__(self):
+        with self.lock:
+            return iter(list(self.players.values()))
+
+    def __contains__(self, id) -> bool:
+        with self.lock:
+            return str(id) in self.players
+
+    @property
+    def age(self) -> Optional[float]:
+        """
+        Returns the age of the latest snapshot.
+
+        Returns
+        -------
+        float
+            Seconds since the latest snapshot or None if never fetched.
+
+        """
+        if self.updated is None:
+            return None
+
+        return time.monotonic() - self.updated
+
+    def invalidate(self):
+        """
+        Marks the snapshot stale, so the next lookup refetches.
+        """
+        with self.lock:
+            self.updated = None
+
+    @staticmethod
+    def key_values(player: "Player") -> dict:
+        """
+        Returns the values a player is indexed under.
+
+        Parameters
+        ----------
+        player: Player
+            Player to index.
+
+        Returns
+        -------
+        dict
+            Normalized values keyed by index key.
+
+        """
+        driver_data = player.driver_data or {}
+        stream_data = player.stream_data or {}
+
+        values = {
+            "title": player.title,
+            "driver_tla": driver_data.get("tla"),
+            "driver_number": driver_data.get("driverNumber"),
+            "type": player.type,
+            "content_id": player.content_id,
+            "session_key": stream_data.get("sessionKey"),
+        }
+
+        return {key: str(value) for key, value in values.items()
+                if value is not None}
+
+    def replace(self, players: list):
+        """
+        Replaces the index with a snapshot of the players.
+
+        Parameters
+        ----------
+        players: list
+            List of Player objects.
+
+        """
+        # Build the new index aside and swap it in, so concurrent lookups
+        # see either the previous snapshot or this one, never a partial one.
+        indexed = {}
+        keys = {key: {} for key in self.KEYS}
+
+        for player in players:
+            indexed[str(player.id)] = player
+
+            for key, value in self.key_values(player).items():
+                keys[key].setdefault(value, {})[str(player.id)] = player
+
+        with self.lock:
+            self.players = indexed
+            self.keys = keys
+            self.updated = time.monotonic()
+
+    def add(self, player: "Player"):
+        """
+        Adds or refreshes a single player.
+
+        Parameters
+        ----------
+        player: Player
+            Player to index.
+
+        """
+        with self.lock:
+            self.remove(player.id)
+
+            self.players[str(player.id)] = player
+
+            for key, value in self.key_values(player).items():
+                self.keys[key].setdefault(value, {})[str(player.id)] = player
+
+    def remove(self, id) -> Optional["Player"]:
+        """
+        Removes a player.
+
+        Parameters
+        ----------
+        id: int
+            Id of player.
+
+        Returns
+        -------
+        Player
+            Removed player or None if it was not indexed.
+
+        """
+        with self.lock:
+            player = self.players.pop(str(id), None)
+
+            if player is None:
+                return None
+
+            for key, value in self.key_values(player).items():
+                bucket = self.keys[key].get(value, {})
+                bucket.pop(str(id), None)
+
+                if not bucket:
+                    self.keys[key].pop(value, None)
+
+            return player
+
+    def get(self, id) -> Optional["Player"]:
+        """
+        Returns the player with specific id.
+
+        Parameters
+        ----------
+        id: int
+            Id of player.
+
+        Returns
+        -------
+        Player
+            Player or None.
+
+        """
+        with self.lock:
+            return self.players.get(str(id))
+
+    def find_all(self, **keys) -> list:
+        """
+        Returns every player matching all the given keys.
+
+        Parameters
+        ----------
+        **keys
+            Values by index key (e.g. title='INTERNATIONAL'). Keys set to
+            None are ignored.
+
+        Returns
+        -------
+        list
+            Matching Player objects in snapshot order.
+
+        """
+        keys = {key: str(value) for key, value in keys.items()
+                if value is not None}
+
+        if not keys:
+            return list(self)
+
+        unknown = set(keys) - set(self.KEYS)
+
+        if unknown:
+            raise MultiViewerForF1Error(f"Unknown index keys: "
+                                        f"{', '.join(sorted(unknown))}")
+
+        with self.lock:
+            buckets = sorted((self.keys[key].get(value, {})
+                              for key, value in keys.items()), key=len)
+
+            return [player for id, player in buckets[0].items()
+                    if all(id in bucket for bucket in buckets[1:])]
+
+    def find(self, **keys) -> Optional["Player"]:
+        """
+        Returns the first player matching all the given keys.
+
+        Parameters
+        ----------
+        **keys
+            Values by index key (e.g. driver_tla='PER').
+
+        Returns
+        -------
+        Player
+            Matching player or None.
+
+        """
+        players = self.find_all(**keys)
+
+        return players[0] if players else None
+
+    def apply(self, mutation: str, id, result):
+        """
+        Applies the result of a mutation to the indexed player.
+
+        Parameters
+        ----------
+        mutation: str
+            Name of the mutation on the schema (e.g. 'player_set_volume').
+
+        id: int
+            Id of the mutated player.
+
+        result: object
+            Value the mutation returned.
+
+        """
+        if mutation == "player_create":
+            # New players take a moment to appear, so the next lookup
+            # has to refetch.
+            self.invalidate()
+            return
+
+        player = self.get(id)
+
+        if player is None or result is None:
+            return
+
+        with self.lock:
+            if mutation == "player_delete":
+                if result:
+                    self.remove(id)
+            elif mutation == "player_set_bounds" and isinstance(result, dict):
+                player.bounds = dict(player.bounds, **result)
+                player.x = player.bounds["x"]
+                player.y = player.bounds["y"]
+                player.width = player.bounds["width"]
+                player.height = player.bounds["height"]
+            elif mutation in STATE_MUTATIONS and player.state is not None:
+                player.state[STATE_MUTATIONS[mutation]] = result
+            elif mutation == "player_set_fullscreen":
+                player.fullscreen = result
+            elif mutation == "player_set_always_on_top":
+                player.always_on_top = result
+
+
+STATE_MUTATIONS = {
+    "player_set_volume": "volume",
+    "player_set_muted": "muted",
+    "player_set_paused": "paused",
+}
+
+
+class MutationBatch(object):
+    """
+    Collects player mutations and sends them to MultiViewerForF1 as a single
+    GraphQL request.
+
+    Each mutation is added under its own alias, so one HTTP round trip
+    carries the whole batch. GraphQL executes top-level mutation fields
+    serially, which preserves the order in which mutations were added.
+
+    Attributes
+    ----------
+    remote: MultiViewerForF1
+        Interface to control MultiViewerForF1.
+    operation: Operation
+        GraphQL mutation being built.
+    mutations: list
+        Tuples of alias, mutation name and arguments in execution order.
+    """
+
+    def __init__(self, remote: MultiViewerForF1):
+        self.remote = remote
+        self.operation = Operation(schema.Mutation)
+        self.mutations = []
+
+    def __len__(self) -> int:
+        return len(self.mutations)
+
+    def add(self, mutation: str, **kwargs) -> str:
+        """
+        Adds a mutation to the batch.
+
+        Parameters
+        ----------
+        mutation: str
+            Name of the mutation on the schema (e.g. 'player_set_volume').
+
+        **kwargs
+            Arguments of the mutation.
+
+        Returns
+        -------
+        str
+            Alias of the mutation in the batched request.
+
+        """
+        alias = f"m{len(self.mutations)}"
+
+        getattr(self.operation, mutation)(__alias__=alias, **kwargs)
+        self.mutations.append((alias, mutation, kwargs))
+
+        return alias
+
+    def player_create(
+        self,
+        content_id: int,
+        driver_tla: Optional[str] = None,
+        driver_number: Optional[int] = None,
+        stream_title: Optional[str] = None,
+        x: Optional[int] = None,
+        y: Optional[int] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        fullscreen: Optional[bool] = False,
+        always_on_top: Optional[bool] = False,
+        maintain_aspect_ratio: Optional[bool] = True,
+    ) -> str:
+        """
+        Adds creation of a new player to the batch.
+
+        See `MultiViewerForF1.player_create` for parameters.
+
+        Returns
+        -------
+        str
+            Alias of the mutation in the batched request.
+
+        """
+        if x or y or width or height:
+            bounds = RectangleInput(x=x, y=y, width=width, height=height)
+        else:
+            bounds = None
+
+        player = PlayerCreateInput(
+            content_id=content_id,
+            driver_tla=driver_tla,
+            driver_number=driver_number,
+            stream_title=stream_title,
+            bounds=bounds,
+            fullscreen=fullscreen,
+            always_on_top=always_on_top,
+            maintain_aspect_ratio=maintain_aspect_ratio,
+        )
+
+        return self.add("player_create", input=player)
+
+    def player_delete(self, id: int) -> str:
+        return self.add("player_delete", id=id)
+
+    def player_seek_to(
+        self, id: int, absolute: Optional[int] = None, relative: Optional[int] = None
+    ) -> str:
+        return self.add("player_seek_to", id=id, absolute=absolute,
+                        relative=relative)
+
+    def player_set_bounds(
+        self,
+        id: int,
+        x: Optional[int] = None,
+        y: Optional[int] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> str:
+        bounds = RectangleInput(x=x, y=y, width=width, height=height)
+
+        return self.add("player_set_bounds", id=id, bounds=bounds)
+
+    def player_set_volume(self, id: int, volume: int) -> str:
+        return self.add("player_set_volume", id=id, volume=volume)
+
+    def player_set_paused(self, id: int, paused: Optional[bool] = None) -> str:
+        return self.add("player_set_paused", id=id, paused=paused)
+
+    def player_set_fullscreen(self, id: int, fullscreen: Optional[bool] = None) -> str:
+        return self.add("player_set_fullscreen", id=id, fullscreen=fullscreen)
+
+    def player_set_muted(self, id: int, muted: Optional[bool] = None) -> str:
+        return self.add("player_set_muted", id=id, muted=muted)
+
+    def player_set_speedometer_visibility(
+        self, id: int, visible: Optional[bool] = None
+    ) -> str:
+        return self.add("player_set_speedometer_visibility", id=id,
+                        visible=visible)
+
+    def player_set_driver_header_mode(self,
+                                      id: int,
+                                      mode: Optional[str] = None) -> str:
+        try:
+            return self.add("player_set_driver_header_mode", id=id, mode=mode)
+        except ValueError as e:
+            raise MultiViewerForF1Error(f"{e} - can be DRIVER_HEADER, NONE"
+                                         " or OBC_LIVE_TIMING.")
+
+    def player_set_always_on_top(
+        self, id: int, always_on_top: Optional[bool] = None
+    ) -> str:
+        return self.add("player_set_always_on_top", id=id,
+                        always_on_top=always_on_top)
+
+    def player_sync(self, id: int) -> str:
+        return self.add("player_sync", id=id)
+
+    def execute(self) -> list:
+        """
+        Sends every mutation in the batch in one request.
+
+        Unlike `MultiViewerForF1.perform_operation`, a failing mutation does
+        not raise; its error is reported alongside the results of the
+        mutations that succeeded.
+
+        Mutations are non-null, so when one fails MultiViewerForF1 nulls the
+        whole response: the mutations before it were applied but their
+        results are lost, and the mutations after it were never run.
+
+        Returns
+        -------
+        list
+            One dict per mutation, in order, with the `mutation` name,
+            whether it was `applied`, its `result` (None if unknown) and an
+            `error` message if it failed.
+
+        """
+        if not self.mutations:
+            return []
+
+        response = self.remote.endpoint(self.operation)
+
+        data = response.get("data")
+        errors = {}
+
+        for error in response.get("errors", []):
+            path = error.get("path") or [None]
+            errors[path[0]] = error["message"]
+
+        if None in errors:
+            raise MultiViewerForF1Error(errors[None])
+
+        aliases = [alias for alias, _, _ in self.mutations]
+        failed = min((aliases.index(alias) for alias in errors
+                      if alias in aliases), default=len(aliases))
+
+        if data is None and errors:
+            # The results of the applied mutations are lost, so the index
+            # has to refetch.
+            self.remote.index.invalidate()
+
+        results = []
+
+        for position, (alias, mutation, kwargs) in enumerate(self.mutations):
+            error = errors.get(alias)
+
+            if error is None and position > failed and data is None:
+                error = "Not applied: batch aborted by an earlier error."
+
+            if error is None and data is not None:
+                self.remote.index.apply(mutation, kwargs.get("id"),
+                                        data.get(alias))
+
+            results.append({"mutation": mutation,
+                            "id": kwargs.get("id"),
+                            "applied": error is None,
+                            "result": (data or {}).get(alias),
+                            "error": error})
+
+        return results
+
+
 class MultiViewerForF1Error(Exception):
     """
     Wrap errors from MultiViewerForF1 API.
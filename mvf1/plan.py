@@ -0,0 +1,440 @@
+import json
+import time
+
+from typing import Optional
+
+from .mvf1 import MultiViewerForF1
+from .mvf1 import MultiViewerForF1Error
+
+
+ACTIONS = {
+    "create": ("player_create",
+               ("content_id", "driver_tla", "driver_number", "stream_title",
+                "x", "y", "width", "height", "fullscreen", "always_on_top",
+                "maintain_aspect_ratio")),
+    "set-bounds": ("player_set_bounds", ("x", "y", "width", "height")),
+    "volume": ("player_set_volume", ("volume",)),
+    "mute": ("player_set_muted", ("muted",)),
+    "pause": ("player_set_paused", ("paused",)),
+    "fullscreen": ("player_set_fullscreen", ("fullscreen",)),
+    "seek": ("player_seek_to", ("absolute", "relative")),
+    "sync": ("player_sync", ()),
+    "close": ("player_delete", ()),
+    "wait": (None, ("seconds",)),
+}
+
+
+class PlanStep(object):
+    """
+    A single action of a plan.
+
+    Attributes
+    ----------
+    number: int
+        Position of the step in the plan, starting at 1.
+    action: str
+        Name of the action (e.g. 'create' or 'volume').
+    mutation: str
+        Name of the MultiViewerForF1 mutation the action maps to.
+    params: dict
+        Arguments of the mutation, without the target player.
+    id: str
+        Id of the target player, if given.
+    title: str
+        Title of the target player, if given.
+    name: str
+        Name other steps can use as title to target a player created by
+        this step.
+    """
+
+    def __init__(self, number: int, step: dict):
+        if not isinstance(step, dict) or "action" not in step:
+            raise MultiViewerForF1Error(f"Step {number} needs an action.")
+
+        step = dict(step)
+
+        self.number = number
+        self.action = step.pop("action")
+
+        if self.action not in ACTIONS:
+            raise MultiViewerForF1Error(
+                f"Step {number}: unknown action {self.action} - can be "
+                f"{', '.join(ACTIONS)}."
+            )
+
+        self.mutation, allowed = ACTIONS[self.action]
+
+        self.id = step.pop("id", None)
+        self.title = step.pop("title", None)
+        self.name = step.pop("name", None)
+
+        unknown = set(step) - set(allowed)
+
+        if unknown:
+            raise MultiViewerForF1Error(
+                f"Step {number}: unknown parameters for {self.action}: "
+                f"{', '.join(sorted(unknown))}."
+            )
+
+        self.params = step
+
+        if self.action == "create":
+            if self.name is None:
+                self.name = self.params.get("stream_title")
+        elif self.action != "wait" and self.id is None and self.title is None:
+            raise MultiViewerForF1Error(
+                f"Step {number}: {self.action} needs an id or title."
+            )
+
+    def __repr__(self) -> str:
+        target = self.id or self.title or self.name or ""
+
+        return f"{self.number}: {self.action} {target}".strip()
+
+
+class Plan(object):
+    """
+    An ordered list of player actions loaded from YAML or JSON.
+
+    A plan is either a list of steps or a mapping with a `steps` list and
+    an optional `settle` time. Each step is a mapping with an `action`, a
+    target player (`id` or `title`) and the arguments of the action:
+
+    .. code-block:: yaml
+
+        settle: 0.8
+        steps:
+          - action: create
+            stream_title: INTERNATIONAL
+            fullscreen: true
+          - action: create
+            driver_tla: PER
+            name: checo
+            x: 0
+            y: 0
+            width: 384
+            height: 216
+          - action: volume
+            title: checo
+            volume: 30
+
+    Attributes
+    ----------
+    steps: list
+        PlanStep objects in order.
+    settle: float
+        Seconds to wait after creating a player before mutating it.
+    """
+
+    def __init__(self, steps: list, settle: float = 0.8):
+        self.steps = [PlanStep(number, step)
+                      for number, step in enumerate(steps, start=1)]
+        self.settle = settle
+
+    @classmethod
+    def from_data(cls, data) -> "Plan":
+        """
+        Builds a plan from decoded YAML or JSON.
+
+        Parameters
+        ----------
+        data: list or dict
+            List of steps or mapping with `steps` and optional `settle`.
+
+        Returns
+        -------
+        Plan
+            Validated plan.
+
+        """
+        if isinstance(data, list):
+            return cls(data)
+
+        if isinstance(data, dict) and isinstance(data.get("steps"), list):
+            return cls(data["steps"], settle=float(data.get("settle", 0.8)))
+
+        raise MultiViewerForF1Error("A plan must be a list of steps or a "
+                                    "mapping with a list of steps.")
+
+    @classmethod
+    def load(cls, path: str) -> "Plan":
+        """
+        Loads a plan from a YAML or JSON file.
+
+        Parameters
+        ----------
+        path: str
+            Path to a .yaml, .yml or .json file.
+
+        Returns
+        -------
+        Plan
+            Validated plan.
+
+        """
+        with open(path) as f:
+            text = f.read()
+
+        if path.endswith(".json"):
+            return cls.from_data(json.loads(text))
+
+        try:
+            import yaml
+        except ImportError:
+            if path.endswith((".yaml", ".yml")):
+                raise MultiViewerForF1Error("PyYAML is required for YAML "
+                                            "plans - pip install mvf1[yaml]")
+
+            return cls.from_data(json.loads(text))
+
+        return cls.from_data(yaml.safe_load(text))
+
+
+class PlanBatch(object):
+    """
+    Steps of a plan sent to MultiViewerForF1 in one request.
+
+    Attributes
+    ----------
+    number: int
+        Position of the batch in the compiled plan, starting at 1.
+    steps: list
+        PlanStep objects of the batch in order.
+    wait: float
+        Seconds to sleep before sending the batch.
+    settle: bool
+        Does the batch target players created by an earlier batch?
+    """
+
+    def __init__(self, number: int, wait: float = 0.0, settle: bool = False):
+        self.number = number
+        self.steps = []
+        self.wait = wait
+        self.settle = settle
+
+    def __repr__(self) -> str:
+        return f"Batch {self.number}: {self.steps}"
+
+
+class PlanRunner(object):
+    """
+    Runs plans against MultiViewerForF1.
+
+    Titles are resolved to player ids once, through the player index of
+    the remote. Steps are then compiled into as few batched requests as
+    possible: a new batch only starts at a `wait` step or when a step
+    targets a player created by the current batch, since new players need
+    time to settle before they accept mutations.
+
+    Attributes
+    ----------
+    remote: MultiViewerForF1
+        Interface to control MultiViewerForF1.
+    """
+
+    def __init__(self, remote: Optional[MultiViewerForF1] = None,
+                 sleep=time.sleep):
+        self.remote = remote if remote is not None else MultiViewerForF1()
+        self.sleep = sleep
+
+    def resolve(self, plan: Plan) -> dict:
+        """
+        Maps every title targeted by the plan to the id of an existing
+        player.
+
+        Titles of players created by the plan are left out, since their
+        ids are only known once they are created.
+
+        Parameters
+        ----------
+        plan: Plan
+            Plan to resolve.
+
+        Returns
+        -------
+        dict
+            Player ids keyed by title.
+
+        """
+        created = {step.name for step in plan.steps if step.action == "create"}
+        titles = {step.title for step in plan.steps
+                  if step.title and step.title not in created}
+        needs_content = any(step.action == "create"
+                            and "content_id" not in step.params
+                            for step in plan.steps)
+
+        if not titles and not needs_content:
+            return {}
+
+        index = self.remote.player_index()
+        resolved = {}
+
+        for title in titles:
+            player = index.find(title=title)
+
+            if player is not None:
+                resolved[title] = player.id
+
+        missing = titles - set(resolved)
+
+        if missing:
+            raise MultiViewerForF1Error(
+                f"No player found with title {', '.join(sorted(missing))}"
+            )
+
+        if needs_content:
+            player = next(iter(index), None)
+
+            if player is None:
+                raise MultiViewerForF1Error("A create step needs a "
+                                            "content_id when no player is "
+                                            "active.")
+            resolved[None] = player.content_id
+
+        return resolved
+
+    def compile(self, plan: Plan) -> list:
+        """
+        Groups the steps of a plan into batches.
+
+        Parameters
+        ----------
+        plan: Plan
+            Plan to compile.
+
+        Returns
+        -------
+        list
+            PlanBatch objects in execution order.
+
+        """
+        batches = []
+        batch = PlanBatch(1)
+        pending = set()
+
+        for step in plan.steps:
+            if step.action == "wait":
+                if batch.steps:
+                    batches.append(batch)
+                    batch = PlanBatch(len(batches) + 1)
+                batch.wait += float(step.params.get("seconds", 0))
+                batch.steps.append(step)
+                batches.append(batch)
+                batch = PlanBatch(len(batches) + 1)
+                pending = set()
+                continue
+
+            if step.id is None and step.title in pending:
+                batches.append(batch)
+                batch = PlanBatch(len(batches) + 1, settle=True)
+                pending = set()
+
+            batch.steps.append(step)
+
+            if step.action == "create" and step.name:
+                pending.add(step.name)
+
+        if batch.steps:
+            batches.append(batch)
+
+        return batches
+
+    def run(self, plan: Plan) -> list:
+        """
+        Runs a plan.
+
+        Parameters
+        ----------
+        plan: Plan
+            Plan to run.
+
+        Returns
+        -------
+        list
+            One dict per step with its `step`, `action`, `batch`, the id of
+            the targeted player, the `elapsed` round trip of its whole
+            batch and the time `waited` in seconds, and the `result` or
+            `error` of the step. Steps of a batch share one request, so
+            they share its round trip.
+
+        """
+        resolved = self.resolve(plan)
+        created = {}
+        created_at = None
+        report = []
+
+        for batch in self.compile(plan):
+            waited = batch.wait
+
+            if batch.settle and created_at is not None:
+                waited += max(0.0, plan.settle
+                              - (time.monotonic() - created_at))
+
+            if waited:
+                self.sleep(waited)
+
+            mutations = self.remote.batch()
+            targets = []
+            skipped = {}
+
+            for step in batch.steps:
+                if step.action == "wait":
+                    targets.append(None)
+                    continue
+
+                if (step.id is None and step.title not in created
+                        and step.title not in resolved):
+                    targets.append(None)
+                    skipped[step.number] = (f"Player {step.title} was not "
+                                            "created.")
+                    continue
+
+                params = dict(step.params)
+
+                if step.action == "create":
+                    params.setdefault("content_id", resolved.get(None))
+                    targets.append(None)
+                    getattr(mutations, step.mutation)(**params)
+                    continue
+
+                if step.id is not None:
+                    id = step.id
+                elif step.title in created:
+                    id = created[step.title]
+                else:
+                    id = resolved[step.title]
+
+                targets.append(id)
+                getattr(mutations, step.mutation)(id, **params)
+
+            start = time.monotonic()
+            results = iter(mutations.execute())
+            elapsed = time.monotonic() - start
+
+            for step, id in zip(batch.steps, targets):
+                entry = {"step": step.number,
+                         "action": step.action,
+                         "batch": batch.number,
+                         "id": id,
+                         "elapsed": elapsed,
+                         "waited": waited,
+                         "result": None,
+                         "error": None}
+
+                if step.number in skipped:
+                    entry["error"] = skipped[step.number]
+                elif step.action != "wait":
+                    result = next(results)
+                    entry["result"] = result["result"]
+                    entry["error"] = result["error"]
+
+                    if step.action == "create" and result["result"]:
+                        entry["id"] = result["result"]
+                        created_at = time.monotonic()
+
+                        if step.name:
+                            created[step.name] = result["result"]
+
+                report.append(entry)
+
+        return report
@@ -0,0 +1,271 @@
+import logging
+import threading
+import time
+
+from typing import Optional
+
+from .mvf1 import MultiViewerForF1
+from .timing import f1_state
+
+
+# Queries the poller can keep current, keyed by series name.
+SERIES = {
+    "f1": "f1_live_timing_state",
+    "fiawec": "fiawec_live_timing_state",
+    "clock": "f1_live_timing_clock",
+}
+
+
+class Snapshot(object):
+    """
+    A versioned copy of a live timing response.
+
+    Attributes
+    ----------
+    series: str
+        Name of the polled series (e.g. 'f1').
+    version: int
+        Incremented each time the response changes, starting at 1.
+    response: dict
+        MultiViewerForF1 API Response.
+    fetched_at: float
+        Monotonic time the response was last fetched.
+    """
+
+    __slots__ = ("series", "version", "response", "fetched_at")
+
+    def __init__(self, series: str, version: int, response: dict,
+                 fetched_at: float):
+        self.series = series
+        self.version = version
+        self.response = response
+        self.fetched_at = fetched_at
+
+    def __repr__(self) -> str:
+        return f"{self.series} v{self.version}"
+
+    @property
+    def age(self) -> float:
+        """
+        Returns the age of the snapshot.
+
+        Returns
+        -------
+        float
+            Seconds since the response was fetched.
+
+        """
+        return time.monotonic() - self.fetched_at
+
+
+class F1Listener(object):
+    """
+    Base of the components fed F1 live timing states through their
+    `ingest(state)` method, which can listen to a LiveTimingPoller.
+    """
+
+    def update(self, snapshot, previous):
+        """
+        Ingests F1 snapshots. Register with LiveTimingPoller.add_listener.
+        """
+        if snapshot.series == "f1":
+            self.ingest(f1_state(snapshot.response))
+
+
+class LiveTimingPoller(object):
+    """
+    Polls MultiViewerForF1 live timing in a background thread and keeps the
+    latest state of each series in memory.
+
+    Readers get the latest Snapshot without a request, and listeners are
+    called from the polling thread whenever a series changes.
+
+    Parameters
+    ----------
+    remote: MultiViewerForF1, optional
+        Interface to control MultiViewerForF1.
+    interval: float, optional
+        Seconds between polls. Defaults to 1.
+    series: tuple, optional
+        Series to poll - can include f1, fiawec and clock. Defaults to f1.
+
+    Attributes
+    ----------
+    snapshots: dict
+        Latest Snapshot keyed by series.
+    listeners: list
+        Callables invoked with the new and previous Snapshot when a series
+        changes.
+    error: Exception
+        Error of the latest failed poll, or None.
+    """
+
+    def __init__(self,
+                 remote: Optional[MultiViewerForF1] = None,
+                 interval: float = 1.0,
+                 series: tuple = ("f1",)):
+        unknown = set(series) - set(SERIES)
+
+        if unknown:
+            raise ValueError(f"Unknown series {', '.join(sorted(unknown))} "
+                             f"- can be {', '.join(SERIES)}.")
+
+        self.remote = remote if remote is not None else MultiViewerForF1()
+        self.interval = interval
+        self.series = tuple(series)
+        self.snapshots = {}
+        self.listeners = []
+        self.error = None
+
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.users = 0
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def snapshot(self, series: str = "f1") -> Optional[Snapshot]:
+        """
+        Returns the latest snapshot of a series.
+
+        Parameters
+        ----------
+        series: str, optional
+            Name of the series. Defaults to f1.
+
+        Returns
+        -------
+        Snapshot
+            Latest snapshot or None if the series was never polled.
+
+        """
+        return self.snapshots.get(series)
+
+    def add_listener(self, listener):
+        """
+        Registers a callable invoked with the new and previous Snapshot
+        each time a series changes.
+
+        Parameters
+        ----------
+        listener: callable
+            Called as listener(snapshot, previous) from the polling thread.
+
+        """
+        self.listeners.append(listener)
+
+    def add_series(self, series: str):
+        """
+        Starts polling another series from the next poll.
+
+        Parameters
+        ----------
+        series: str
+            Name of the series - f1, fiawec or clock.
+
+        """
+        if series not in SERIES:
+            raise ValueError(f"Unknown series {series} - can be "
+                             f"{', '.join(SERIES)}.")
+
+        with self.lock:
+            if series not in self.series:
+                self.series = self.series + (series,)
+
+    def poll_once(self) -> list:
+        """
+        Polls every series once.
+
+        Returns
+        -------
+        list
+            Snapshots of the series that changed.
+
+        """
+        changed = []
+
+        for series in self.series:
+            response = getattr(self.remote, SERIES[series])
+            now = time.monotonic()
+
+            with self.lock:
+                previous = self.snapshots.get(series)
+
+                if previous is not None and previous.response == response:
+                    previous.fetched_at = now
+                    continue
+
+                version = previous.version + 1 if previous else 1
+                snapshot = Snapshot(series, version, response, now)
+                self.snapshots[series] = snapshot
+
+            changed.append(snapshot)
+
+            for listener in self.listeners:
+                try:
+                    listener(snapshot, previous)
+                except Exception:
+                    logging.exception(f"Live timing listener failed on "
+                                      f"{snapshot}")
+
+        return changed
+
+    def run(self):
+        """
+        Polls until stopped. This is the body of the polling thread.
+        """
+        while not self.stopped.is_set():
+            started = time.monotonic()
+
+            try:
+                self.poll_once()
+                self.error = None
+            except Exception as e:
+                self.error = e
+                logging.warning(f"Live timing poll failed: {e}")
+
+            elapsed = time.monotonic() - started
+            self.stopped.wait(max(0.0, self.interval - elapsed))
+
+    def start(self):
+        """
+        Starts the polling thread if it is not already running.
+
+        Starts are counted, so the thread keeps running until every caller
+        of start has called stop.
+        """
+        with self.lock:
+            self.users += 1
+
+            if self.running:
+                return
+
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.run,
+                                           name="mvf1-live-timing-poller",
+                                           daemon=True)
+            self.thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stops the polling thread once its last user stops.
+
+        Parameters
+        ----------
+        timeout: float, optional
+            Seconds to wait for the thread to finish.
+
+        """
+        with self.lock:
+            self.users = max(0, self.users - 1)
+
+            if self.users or self.thread is None:
+                return
+
+            thread = self.thread
+            self.thread = None
+            self.stopped.set()
+
+        thread.join(timeout)
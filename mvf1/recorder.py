@@ -0,0 +1,135 @@
+import logging
+import queue
+import threading
+import time
+
+from typing import Optional
+
+from .archive import ArchiveWriter
+from .mvf1 import MultiViewerForF1
+from .poller import LiveTimingPoller
+from .timing import response_state
+from .timing import track_time
+
+
+class Recorder(object):
+    """
+    Records live timing to an archive.
+
+    A LiveTimingPoller polls the clock and the recorded series, and hands
+    each changed state to a writer thread through a bounded queue, so
+    compressing and writing never hold up polling. States are stamped with
+    the track time from the latest clock. If the writer falls behind by
+    `queue_size` states, new states are dropped (and counted) rather than
+    blocking the poller; the next written state is diffed against the last
+    written one, so the archive stays consistent.
+
+    Parameters
+    ----------
+    path: str
+        Directory of the archive.
+    remote: MultiViewerForF1, optional
+        Interface to control MultiViewerForF1.
+    interval: float, optional
+        Seconds between polls. Defaults to 1.
+    series: tuple, optional
+        Series to record - f1 and/or fiawec. Defaults to f1.
+    segment_seconds: float, optional
+        Seconds covered by each archive segment. Defaults to 300.
+    compression: str, optional
+        gzip or zstd. Defaults to zstd when zstandard is installed.
+    queue_size: int, optional
+        States waiting to be written before new ones are dropped.
+
+    Attributes
+    ----------
+    poller: LiveTimingPoller
+        Poller of the clock and the series.
+    writer: ArchiveWriter
+        Writer of the archive.
+    records: int
+        States handed to the writer.
+    dropped: int
+        States dropped because the writer fell behind.
+    """
+
+    def __init__(self, path: str,
+                 remote: Optional[MultiViewerForF1] = None,
+                 interval: float = 1.0,
+                 series: tuple = ("f1",),
+                 segment_seconds: float = 300.0,
+                 compression: Optional[str] = None,
+                 queue_size: int = 1000):
+        self.poller = LiveTimingPoller(remote, interval=interval,
+                                       series=("clock",) + tuple(series))
+        self.writer = ArchiveWriter(path, segment_seconds=segment_seconds,
+                                    compression=compression)
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.clock = None
+        self.records = 0
+        self.dropped = 0
+        self.thread = None
+
+        self.poller.add_listener(self.enqueue)
+
+    def __enter__(self) -> "Recorder":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def enqueue(self, snapshot, previous):
+        now = time.time()
+        state = response_state(snapshot.response)
+
+        if snapshot.series == "clock":
+            self.clock = state
+            return
+
+        try:
+            self.queue.put_nowait((snapshot.series, state, now,
+                                   track_time(self.clock, now)))
+            self.records += 1
+        except queue.Full:
+            self.dropped += 1
+            logging.warning(f"Recorder is behind, dropped {snapshot}")
+
+    def run(self):
+        """
+        Writes queued states until stopped. This is the body of the writer
+        thread.
+        """
+        while True:
+            item = self.queue.get()
+
+            if item is None:
+                break
+
+            try:
+                self.writer.write(*item)
+            except Exception:
+                logging.exception("Recorder failed to write a state")
+
+    def start(self):
+        """
+        Starts the writer thread and polling.
+        """
+        self.thread = threading.Thread(target=self.run,
+                                       name="mvf1-recorder-writer",
+                                       daemon=True)
+        self.thread.start()
+        self.poller.start()
+
+    def stop(self):
+        """
+        Stops polling, writes the queued states and closes the archive.
+        """
+        self.poller.stop()
+
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+        self.writer.close()
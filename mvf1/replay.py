@@ -0,0 +1,669 @@
+import json
+import logging
+import platform
+import re
+import sys
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Optional
+
+import graphql
+
+from . import __version__
+from .archive import ArchiveReader
+from .archive import apply_record
+from .mvf1 import MultiViewerForF1Error
+from .mvf1_schema import mvf1_schema
+
+
+# Scalars graphql-core defines itself.
+BUILTIN_SCALARS = ("Int", "Float", "String", "Boolean", "ID")
+
+
+def build_schema() -> graphql.GraphQLSchema:
+    """
+    Builds an executable schema from the MultiViewerForF1 schema.
+
+    Returns
+    -------
+    GraphQLSchema
+        Schema without resolvers.
+
+    """
+    sdl = "\n".join(type.__to_graphql__() for type in mvf1_schema
+                    if type.__name__ not in BUILTIN_SCALARS)
+
+    return graphql.build_schema(sdl)
+
+
+def snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+class ArchivePlayback(object):
+    """
+    Plays back the live timing of an archive.
+
+    Records are applied lazily as the playback time passes them, so each
+    query costs the records since the previous one. The playback time
+    starts at the beginning of the archive and runs `speed` times faster
+    than the wall clock; track time is extrapolated from the latest record,
+    and the clock pauses at the end of the archive.
+
+    Parameters
+    ----------
+    reader: ArchiveReader
+        Archive to play.
+    speed: float, optional
+        Playback speed. Defaults to 1, real time.
+    clock: callable, optional
+        Wall clock in seconds. Defaults to time.time.
+
+    Attributes
+    ----------
+    states: dict
+        Live timing state of each series at the playback time.
+    """
+
+    def __init__(self, reader: ArchiveReader, speed: float = 1.0,
+                 clock=time.time):
+        if speed <= 0:
+            raise MultiViewerForF1Error("Playback speed must be positive.")
+
+        self.reader = reader
+        self.speed = speed
+        self.clock = clock
+        self.started = clock()
+        self.states = {}
+        self.record = None
+        self.records = reader.records()
+        self.pending = next(self.records, None)
+        self.lock = threading.Lock()
+
+        segments = [segment for segment in reader.segments
+                    if segment["track_start"] is not None]
+        self.track_start = segments[0]["track_start"] if segments else None
+
+    @property
+    def position(self) -> float:
+        """
+        Returns the playback time.
+
+        Returns
+        -------
+        float
+            Archive wall time in seconds.
+
+        """
+        start = self.reader.start or 0.0
+        position = start + (self.clock() - self.started) * self.speed
+
+        return min(position, self.reader.end or start)
+
+    @property
+    def finished(self) -> bool:
+        return self.pending is None
+
+    def advance(self) -> float:
+        with self.lock:
+            position = self.position
+
+            while self.pending is not None and self.pending["t"] <= position:
+                apply_record(self.states, self.pending)
+
+                if self.pending["track"] is not None:
+                    self.record = self.pending
+
+                self.pending = next(self.records, None)
+
+            return position
+
+    def state(self, series: str) -> Optional[dict]:
+        """
+        Returns the live timing state of a series at the playback time.
+
+        Parameters
+        ----------
+        series: str
+            f1 or fiawec.
+
+        Returns
+        -------
+        dict
+            Live timing state or None if not recorded yet.
+
+        """
+        self.advance()
+
+        return self.states.get(series)
+
+    def live_timing_clock(self) -> Optional[dict]:
+        """
+        Returns the live timing clock at the playback time.
+
+        Returns
+        -------
+        dict
+            Clock with paused, systemTime, trackTime and liveTimingStartTime,
+            or None if the archive has no track time yet.
+
+        """
+        position = self.advance()
+
+        if self.record is None:
+            return None
+
+        elapsed = 0 if self.finished else position - self.record["t"]
+
+        return {"paused": self.finished,
+                "systemTime": int(self.clock() * 1000),
+                "trackTime": int(self.record["track"] + elapsed * 1000),
+                "liveTimingStartTime": self.track_start}
+
+
+class SimulatedPlayer(object):
+    """
+    A player of SimulatedPlayers.
+
+    Parameters
+    ----------
+    id: str
+        Id of the player.
+    input: dict
+        PlayerCreateInput of the player.
+    driver_data: dict, optional
+        Driver data of onboard players.
+    ready: float
+        Monotonic time from which the player is visible.
+    clock: callable, optional
+        Wall clock of the host in seconds, for state.ts. Defaults to
+        time.time.
+    """
+
+    def __init__(self, id: str, input: dict,
+                 driver_data: Optional[dict] = None, ready: float = 0.0,
+                 clock=time.time):
+        bounds = input.get("bounds") or {}
+
+        self.id = id
+        self.driver_data = driver_data
+        self.ready = ready
+        self.clock = clock
+        self.stream_data = {"contentId": str(input["contentId"]),
+                            "meetingKey": None,
+                            "sessionKey": None,
+                            "channelId": input.get("channelId"),
+                            "title": (input.get("streamTitle")
+                                      or (driver_data or {}).get("tla")
+                                      or "INTERNATIONAL")}
+        self.bounds = {"x": bounds.get("x") or 0,
+                       "y": bounds.get("y") or 0,
+                       "width": bounds.get("width") or 1280,
+                       "height": bounds.get("height") or 720}
+        self.fullscreen = bool(input.get("fullscreen"))
+        self.always_on_top = bool(input.get("alwaysOnTop"))
+        self.maintain_aspect_ratio = (input.get("maintainAspectRatio")
+                                      is not False)
+        self.paused = False
+        self.muted = False
+        self.volume = 100.0
+        self.speedometer = True
+        self.driver_header_mode = "DRIVER_HEADER"
+        self.position = 0.0
+        self.since = time.monotonic()
+
+    @property
+    def current_time(self) -> float:
+        if self.paused:
+            return self.position
+
+        return self.position + time.monotonic() - self.since
+
+    def seek(self, position: float):
+        self.position = max(position, 0.0)
+        self.since = time.monotonic()
+
+    def set_paused(self, paused: bool):
+        self.seek(self.current_time)
+        self.paused = paused
+
+    def data(self) -> dict:
+        """
+        Returns the player as the GraphQL API does.
+
+        Returns
+        -------
+        dict
+            Player.
+
+        """
+        # ts is when the state was sampled, with currentTime at that time.
+        current_time = self.current_time
+
+        return {"id": self.id,
+                "type": "OBC" if self.driver_data else "ADDITIONAL",
+                "state": {"ts": self.clock(),
+                          "paused": self.paused,
+                          "muted": self.muted,
+                          "volume": self.volume,
+                          "live": False,
+                          "currentTime": current_time,
+                          "interpolatedCurrentTime": current_time},
+                "driverData": self.driver_data,
+                "streamData": self.stream_data,
+                "bounds": self.bounds,
+                "fullscreen": self.fullscreen,
+                "alwaysOnTop": self.always_on_top,
+                "maintainAspectRatio": self.maintain_aspect_ratio}
+
+
+class SimulatedPlayers(object):
+    """
+    Simulates the players of MultiViewerForF1.
+
+    Like the app, a created player only becomes visible to queries and
+    mutations `create_lag` seconds after playerCreate returns its id.
+
+    Parameters
+    ----------
+    create_lag: float, optional
+        Seconds before a created player is visible. Defaults to 0.5.
+    drivers: callable, optional
+        Returns the DriverList of the live timing, used for the driver data
+        of onboard players.
+    clock: callable, optional
+        Wall clock of the host in seconds, for state.ts. Defaults to
+        time.time.
+
+    Attributes
+    ----------
+    players: dict
+        SimulatedPlayer objects keyed by id, including pending ones.
+    """
+
+    def __init__(self, create_lag: float = 0.5, drivers=None,
+                 clock=time.time):
+        self.create_lag = create_lag
+        self.drivers = drivers
+        self.clock = clock
+        self.players = {}
+        self.next_id = 1
+        self.lock = threading.Lock()
+
+    def visible(self) -> list:
+        now = time.monotonic()
+
+        with self.lock:
+            return [player for player in self.players.values()
+                    if player.ready <= now]
+
+    def get(self, id) -> SimulatedPlayer:
+        player = self.players.get(str(id))
+
+        if player is None or player.ready > time.monotonic():
+            raise MultiViewerForF1Error(f"Player {id} not found")
+
+        return player
+
+    def driver_data(self, tla: Optional[str],
+                    number: Optional[int]) -> Optional[dict]:
+        if tla is None and number is None:
+            return None
+
+        drivers = (self.drivers() if self.drivers else None) or {}
+
+        for driver in drivers.values():
+            if not isinstance(driver, dict):
+                continue
+
+            if (driver.get("Tla") == tla
+                    or (number is not None
+                        and str(driver.get("RacingNumber")) == str(number))):
+                return {"driverNumber": int(driver["RacingNumber"]),
+                        "tla": driver.get("Tla", ""),
+                        "firstName": driver.get("FirstName", ""),
+                        "lastName": driver.get("LastName", ""),
+                        "teamName": driver.get("TeamName", "")}
+
+        return {"driverNumber": number or 0, "tla": tla or "",
+                "firstName": "", "lastName": "", "teamName": ""}
+
+    def create(self, input: dict) -> str:
+        driver_data = self.driver_data(input.get("driverTla"),
+                                       input.get("driverNumber"))
+
+        with self.lock:
+            id = str(self.next_id)
+            self.next_id += 1
+            self.players[id] = SimulatedPlayer(
+                id, input, driver_data,
+                ready=time.monotonic() + self.create_lag,
+                clock=self.clock,
+            )
+
+        return id
+
+    def delete(self, id) -> bool:
+        self.get(id)
+
+        with self.lock:
+            del self.players[str(id)]
+
+        return True
+
+    def sync(self, id) -> bool:
+        position = self.get(id).current_time
+
+        for player in self.visible():
+            player.seek(position)
+
+        return True
+
+
+class ReplayServer(object):
+    """
+    Local stand-in for the MultiViewerForF1 GraphQL API.
+
+    Serves the subset of the API the client uses over HTTP: live timing
+    from a timing source such as ArchivePlayback, and players from
+    SimulatedPlayers. Requests are handled on their own threads, like the
+    app, so it can be used for integration tests and load tests without
+    MultiViewer or a live session.
+
+    Parameters
+    ----------
+    timing: object, optional
+        Source with `state(series)` and `live_timing_clock()` methods.
+        Without one, live timing queries return null.
+    players: SimulatedPlayers, optional
+        Simulated players. Defaults to new SimulatedPlayers reading drivers
+        from the timing.
+    create_lag: float, optional
+        Seconds before a created player is visible, without `players`.
+        Defaults to 0.5.
+    host: str, optional
+        Host to bind. Defaults to 127.0.0.1.
+    port: int, optional
+        Port to bind, 0 for any free port. Defaults to 10101.
+
+    Attributes
+    ----------
+    schema: GraphQLSchema
+        Executable schema.
+    httpd: ThreadingHTTPServer
+        HTTP server.
+    """
+
+    def __init__(self, timing=None,
+                 players: Optional[SimulatedPlayers] = None,
+                 create_lag: float = 0.5,
+                 host: str = "127.0.0.1", port: int = 10101):
+        self.timing = timing
+        self.players = players or SimulatedPlayers(create_lag=create_lag,
+                                                   drivers=self.drivers)
+        self.schema = build_schema()
+        self.thread = None
+
+        for type in (self.schema.query_type, self.schema.mutation_type):
+            prefix = ("query_" if type is self.schema.query_type
+                      else "mutate_")
+
+            for name, field in type.fields.items():
+                resolver = getattr(self, prefix + snake_case(name), None)
+
+                if resolver is not None:
+                    field.resolve = self.resolver(resolver)
+
+        self.httpd = ThreadingHTTPServer((host, port), ReplayRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.replay = self
+
+    def __enter__(self) -> "ReplayServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+
+        return f"http://{host}:{port}/api/graphql"
+
+    @staticmethod
+    def resolver(method):
+        def resolve(root, info, **kwargs):
+            return method(**{snake_case(key): value
+                             for key, value in kwargs.items()})
+
+        return resolve
+
+    def execute(self, query: str, variables: Optional[dict] = None,
+                operation_name: Optional[str] = None) -> dict:
+        """
+        Executes a GraphQL request.
+
+        Parameters
+        ----------
+        query: str
+            GraphQL document.
+
+        variables: dict, optional
+            Variables of the document.
+
+        operation_name: str, optional
+            Operation to execute.
+
+        Returns
+        -------
+        dict
+            GraphQL response with `data` and, if any, `errors`.
+
+        """
+        result = graphql.graphql_sync(self.schema, query,
+                                      variable_values=variables,
+                                      operation_name=operation_name)
+        response = {"data": result.data}
+
+        if result.errors:
+            response["errors"] = [error.formatted for error in result.errors]
+
+        return response
+
+    def respond(self, request: dict) -> tuple:
+        """
+        Answers a GraphQL request received over HTTP.
+
+        Parameters
+        ----------
+        request: dict
+            Body of the request with query, variables and operationName.
+
+        Returns
+        -------
+        tuple
+            HTTP status and GraphQL response.
+
+        """
+        return 200, self.execute(request.get("query", ""),
+                                 request.get("variables"),
+                                 request.get("operationName"))
+
+    def start(self):
+        """
+        Serves requests on a background thread.
+        """
+        self.thread = threading.Thread(target=self.httpd.serve_forever,
+                                       name="mvf1-replay", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stops serving and closes the socket.
+        """
+        if self.thread is not None:
+            self.httpd.shutdown()
+            self.thread.join()
+            self.thread = None
+
+        self.httpd.server_close()
+
+    def serve_forever(self):
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.httpd.server_close()
+
+    def timing_state(self, series: str) -> Optional[dict]:
+        return self.timing.state(series) if self.timing else None
+
+    def drivers(self) -> Optional[dict]:
+        return (self.timing_state("f1") or {}).get("DriverList")
+
+    def query_version(self) -> str:
+        return f"mvf1-replay {__version__}"
+
+    def query_system_info(self) -> dict:
+        return {"platform": sys.platform, "arch": platform.machine()}
+
+    def query_players(self) -> list:
+        return [player.data() for player in self.players.visible()]
+
+    def query_player(self, id: str) -> dict:
+        return self.players.get(id).data()
+
+    def query_live_timing_state(self) -> Optional[dict]:
+        return self.timing_state("f1")
+
+    def query_live_timing_clock(self) -> Optional[dict]:
+        return self.timing.live_timing_clock() if self.timing else None
+
+    def query_f1_live_timing_state(self) -> Optional[dict]:
+        return self.timing_state("f1")
+
+    def query_f1_live_timing_clock(self) -> Optional[dict]:
+        return self.query_live_timing_clock()
+
+    def query_fiawec_live_timing_state(self) -> Optional[dict]:
+        return self.timing_state("fiawec")
+
+    def query_active_subscriptions(self) -> list:
+        return []
+
+    def mutate_version(self) -> str:
+        return self.query_version()
+
+    def mutate_player_create(self, input: dict) -> str:
+        return self.players.create(input)
+
+    def mutate_player_delete(self, id: str) -> bool:
+        return self.players.delete(id)
+
+    def mutate_player_set_fullscreen(
+        self, id: str, fullscreen: Optional[bool] = None
+    ) -> bool:
+        player = self.players.get(id)
+        player.fullscreen = (not player.fullscreen if fullscreen is None
+                             else fullscreen)
+
+        return player.fullscreen
+
+    def mutate_player_set_always_on_top(self, id: str,
+                                        always_on_top: Optional[bool] = None,
+                                        level: Optional[str] = None) -> bool:
+        player = self.players.get(id)
+        player.always_on_top = (not player.always_on_top
+                                if always_on_top is None else always_on_top)
+
+        return player.always_on_top
+
+    def mutate_player_set_bounds(self, id: str, bounds: dict) -> dict:
+        player = self.players.get(id)
+        player.bounds = dict(player.bounds, **{
+            key: value for key, value in bounds.items() if value is not None
+        })
+
+        return player.bounds
+
+    def mutate_player_set_volume(self, id: str, volume: float) -> float:
+        player = self.players.get(id)
+        player.volume = volume
+
+        return player.volume
+
+    def mutate_player_set_paused(self, id: str,
+                                 paused: Optional[bool] = None) -> bool:
+        player = self.players.get(id)
+        player.set_paused(not player.paused if paused is None else paused)
+
+        return player.paused
+
+    def mutate_player_set_muted(self, id: str,
+                                muted: Optional[bool] = None) -> bool:
+        player = self.players.get(id)
+        player.muted = not player.muted if muted is None else muted
+
+        return player.muted
+
+    def mutate_player_seek_to(self, id: str, absolute: Optional[float] = None,
+                              relative: Optional[float] = None) -> float:
+        player = self.players.get(id)
+
+        if absolute is not None:
+            player.seek(absolute)
+        elif relative is not None:
+            player.seek(player.current_time + relative)
+
+        return player.current_time
+
+    def mutate_player_sync(self, id: str) -> bool:
+        return self.players.sync(id)
+
+    def mutate_player_set_speedometer_visibility(
+            self, id: str, visible: Optional[bool] = None) -> bool:
+        player = self.players.get(id)
+        player.speedometer = (not player.speedometer if visible is None
+                              else visible)
+
+        return player.speedometer
+
+    def mutate_player_set_driver_header_mode(self, id: str,
+                                             mode: str) -> str:
+        player = self.players.get(id)
+        player.driver_header_mode = mode
+
+        return player.driver_header_mode
+
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles GraphQL requests of a ReplayServer.
+    """
+
+    def do_POST(self):
+        if self.path.split("?")[0] != "/api/graphql":
+            self.send_error(404)
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self.send_error(400, "Request body is not JSON.")
+            return
+
+        status, response = self.server.replay.respond(request)
+        body = json.dumps(response).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug(f"{self.address_string()} {format % args}")
@@ -0,0 +1,273 @@
+import bisect
+import time
+
+from typing import Optional
+
+from .archive import ArchiveReader
+from .archive import apply_record
+from .mvf1 import MultiViewerForF1Error
+from .timing import TRACK_STATUS
+from .timing import response_state
+from .timing import track_time
+from .timing import values
+
+
+class SeekIndex(object):
+    """
+    Index of the track time of laps and race events, for seeking players.
+
+    F1 states are ingested with their track time, live from a
+    LiveTimingPoller or from an archive. A new lap in LapCount, a lap
+    completed by a driver in TimingData, a track status change and a new
+    race control message are each recorded at the track time of the first
+    state that shows them.
+
+    Player positions are seconds from `offset`, the track time at position
+    0 - by default `liveTimingStartTime` of the clock, or the start of the
+    archive.
+
+    Parameters
+    ----------
+    offset: int, optional
+        Track time in milliseconds at player position 0.
+
+    Attributes
+    ----------
+    laps: dict
+        Track time at which each lap of the leader started.
+    driver_laps: dict
+        Track time at which each driver completed each lap, keyed by
+        racing number then lap.
+    events: list
+        Flags and race control messages in time order, as dicts with
+        track, lap, flag, category and message.
+    """
+
+    def __init__(self, offset: Optional[int] = None):
+        self.offset = offset
+        self.laps = {}
+        self.driver_laps = {}
+        self.events = []
+        self.clock = None
+        self.status = None
+        self.messages = 0
+
+    @classmethod
+    def from_archive(cls, reader: ArchiveReader,
+                     offset: Optional[int] = None) -> "SeekIndex":
+        """
+        Builds an index from the F1 states of an archive.
+
+        Parameters
+        ----------
+        reader: ArchiveReader
+            Archive with track times.
+
+        offset: int, optional
+            Track time at player position 0. Defaults to the first track
+            time of the archive.
+
+        Returns
+        -------
+        SeekIndex
+            Index of the archive.
+
+        """
+        index = cls(offset)
+        states = {}
+
+        for record in reader.records():
+            apply_record(states, record)
+
+            if record["series"] == "f1" and record["track"] is not None:
+                if index.offset is None:
+                    index.offset = record["track"]
+
+                index.ingest(states["f1"], record["track"])
+
+        return index
+
+    def ingest(self, state: dict, track: int):
+        """
+        Records what a state shows for the first time.
+
+        Parameters
+        ----------
+        state: dict
+            F1 live timing state.
+
+        track: int
+            Track time of the state in milliseconds.
+
+        """
+        lap = (state.get("LapCount") or {}).get("CurrentLap")
+
+        if lap is not None and lap not in self.laps:
+            self.laps[lap] = track
+
+        lines = (state.get("TimingData") or {}).get("Lines") or {}
+
+        for number, line in lines.items():
+            laps = line.get("NumberOfLaps")
+
+            if laps is not None:
+                self.driver_laps.setdefault(number, {}).setdefault(laps,
+                                                                   track)
+
+        status = (state.get("TrackStatus") or {}).get("Status")
+
+        if status != self.status:
+            if status is not None:
+                self.events.append({"track": track, "lap": lap,
+                                    "flag": TRACK_STATUS.get(status, status),
+                                    "category": "TrackStatus",
+                                    "message": (state.get("TrackStatus")
+                                                or {}).get("Message")})
+            self.status = status
+
+        messages = values((state.get("RaceControlMessages") or {})
+                          .get("Messages"))
+
+        for message in messages[self.messages:]:
+            self.events.append({"track": track,
+                                "lap": message.get("Lap", lap),
+                                "flag": message.get("Flag"),
+                                "category": message.get("Category"),
+                                "message": message.get("Message")})
+
+        self.messages = len(messages)
+
+    def update(self, snapshot, previous):
+        """
+        Ingests clock and F1 snapshots. Register with
+        LiveTimingPoller.add_listener.
+        """
+        state = response_state(snapshot.response)
+
+        if snapshot.series == "clock":
+            self.clock = state
+
+            if self.offset is None:
+                self.offset = state.get("liveTimingStartTime")
+        elif snapshot.series == "f1":
+            track = track_time(self.clock, time.time())
+
+            if track is not None:
+                self.ingest(state, track)
+
+    def lap_track(self, lap: int, driver=None) -> int:
+        """
+        Returns the track time a lap started.
+
+        Parameters
+        ----------
+        lap: int
+            Lap number.
+
+        driver: int or str, optional
+            Racing number. Defaults to the lap of the leader.
+
+        Returns
+        -------
+        int
+            Track time in milliseconds.
+
+        """
+        if driver is None:
+            laps = self.laps
+        else:
+            # Lap n of a driver starts when lap n - 1 was completed.
+            laps = {completed + 1: track for completed, track
+                    in self.driver_laps.get(str(driver), {}).items()}
+
+        if lap not in laps:
+            raise MultiViewerForF1Error(f"Lap {lap} is not indexed.")
+
+        return laps[lap]
+
+    def event_track(self, event, occurrence: int = 1) -> int:
+        """
+        Returns the track time of an event.
+
+        Parameters
+        ----------
+        event: str, dict or RaceEvent
+            Flag (e.g. 'RED' or 'SC'), text of a race control message
+            (e.g. 'SAFETY CAR DEPLOYED'), an event of `events`, or a flag,
+            penalty or incident RaceEvent.
+
+        occurrence: int, optional
+            Which matching event, 1 for the first, -1 for the latest.
+            Defaults to 1.
+
+        Returns
+        -------
+        int
+            Track time in milliseconds.
+
+        """
+        if isinstance(event, dict):
+            return event["track"]
+
+        data = getattr(event, "data", None)
+
+        if data is not None:
+            event = data.get("flag") or data.get("message")
+
+        text = str(event).upper()
+        matches = [entry for entry in self.events
+                   if (entry["flag"] or "").upper() == text
+                   or text in (entry["message"] or "").upper()]
+
+        try:
+            return matches[occurrence - 1 if occurrence > 0
+                           else occurrence]["track"]
+        except IndexError:
+            raise MultiViewerForF1Error(f"Event {event} is not indexed.")
+
+    def events_between(self, start: int, end: int) -> list:
+        """
+        Returns the events between two track times.
+
+        Parameters
+        ----------
+        start: int
+            First track time in milliseconds, inclusive.
+
+        end: int
+            Last track time in milliseconds, inclusive.
+
+        Returns
+        -------
+        list
+            Events in time order.
+
+        """
+        tracks = [entry["track"] for entry in self.events]
+
+        return self.events[bisect.bisect_left(tracks, start):
+                           bisect.bisect_right(tracks, end)]
+
+    def position(self, track: int, lead: float = 0.0) -> float:
+        """
+        Returns the player position of a track time.
+
+        Parameters
+        ----------
+        track: int
+            Track time in milliseconds.
+
+        lead: float, optional
+            Seconds to start before. Defaults to 0.
+
+        Returns
+        -------
+        float
+            Position in seconds.
+
+        """
+        if self.offset is None:
+            raise MultiViewerForF1Error("Seek index has no offset yet - "
+                                        "poll the clock or pass one.")
+
+        return max((track - self.offset) / 1000 - lead, 0.0)
@@ -0,0 +1,315 @@
+import logging
+import statistics
+import threading
+import time
+
+from collections import deque
+from typing import Optional
+
+from .mvf1 import MultiViewerForF1
+from .mvf1 import MultiViewerForF1Error
+
+# Fields of a check, fetched for every player in one request.
+FIELDS = ["state.ts", "state.currentTime", "state.paused",
+          "streamData.title"]
+
+# Titles of the players with broadcast commentary, in order of preference.
+COMMENTARY = ("INTERNATIONAL", "F1 LIVE")
+
+
+def measurable(player: dict) -> bool:
+    """
+    Returns whether a player reports enough state to measure its drift.
+
+    The API leaves the state, its currentTime and the stream data of a
+    player null while it is loading.
+
+    Parameters
+    ----------
+    player: dict
+        Player from `MultiViewerForF1.players_data` with the FIELDS.
+
+    Returns
+    -------
+    bool
+        True if the player has a state with ts and currentTime, and stream
+        data.
+
+    """
+    state = player.get("state")
+
+    return (state is not None and state.get("ts") is not None
+            and state.get("currentTime") is not None
+            and player.get("streamData") is not None)
+
+
+def drift(player: dict, reference: dict) -> float:
+    """
+    Returns how far a player is ahead of a reference player.
+
+    Each position is extrapolated from the time its state was sampled
+    (`state.ts`) to a common time, so players sampled at slightly different
+    times compare exactly.
+
+    Parameters
+    ----------
+    player: dict
+        Player with state.ts, state.currentTime and state.paused.
+
+    reference: dict
+        Reference player with the same fields.
+
+    Returns
+    -------
+    float
+        Seconds the player is ahead, negative if behind.
+
+    """
+    at = max(player["state"]["ts"], reference["state"]["ts"])
+
+    def position(data):
+        state = data["state"]
+
+        if state["paused"]:
+            return state["currentTime"]
+
+        return state["currentTime"] + at - state["ts"]
+
+    return position(player) - position(reference)
+
+
+def find_reference(players: list, id=None) -> Optional[dict]:
+    """
+    Returns the reference player to sync to.
+
+    Parameters
+    ----------
+    players: list
+        Players from `MultiViewerForF1.players_data` with streamData.title.
+
+    id: str, optional
+        Id of the reference player. Defaults to the player with broadcast
+        commentary.
+
+    Returns
+    -------
+    dict
+        Reference player, or None if there is none. Players still loading
+        are never the reference.
+
+    """
+    players = [player for player in players if measurable(player)]
+
+    if id is not None:
+        return next((player for player in players
+                     if str(player["id"]) == str(id)), None)
+
+    for title in COMMENTARY:
+        for player in players:
+            if player["streamData"]["title"] == title:
+                return player
+
+    return None
+
+
+class SyncSupervisor(object):
+    """
+    Keeps every player in step with the commentary player.
+
+    Unlike `player_sync`, which is one-shot, each check reads the state of
+    every player in one projected query, computes the drift of each player
+    against the reference player and corrects it with a relative seek.
+
+    To avoid seek storms, a player is only corrected after its drift
+    exceeded `threshold` on `samples` consecutive checks, and is left alone
+    for `cooldown` seconds after each correction while the player buffers.
+    All corrections of a check are sent in one batched request.
+
+    Parameters
+    ----------
+    remote: MultiViewerForF1, optional
+        Interface to control MultiViewerForF1.
+    reference: str, optional
+        Id of the reference player. Defaults to the player with broadcast
+        commentary, as `player_sync_to_commentary`.
+    interval: float, optional
+        Seconds between checks. Defaults to 5.
+    threshold: float, optional
+        Drift in seconds over which a player is corrected. Defaults to 0.5.
+    samples: int, optional
+        Consecutive checks over the threshold before a correction.
+        Defaults to 2.
+    cooldown: float, optional
+        Seconds a player is not corrected again. Defaults to 10.
+
+    Attributes
+    ----------
+    drifts: dict
+        Recent drifts in seconds keyed by player id.
+    corrections: dict
+        Number of corrections keyed by player id.
+    error: Exception
+        Error of the latest failed check, or None.
+    """
+
+    def __init__(self, remote: Optional[MultiViewerForF1] = None,
+                 reference: Optional[str] = None,
+                 interval: float = 5.0,
+                 threshold: float = 0.5,
+                 samples: int = 2,
+                 cooldown: float = 10.0):
+        self.remote = remote if remote is not None else MultiViewerForF1()
+        self.reference = reference
+        self.interval = interval
+        self.threshold = threshold
+        self.samples = samples
+        self.cooldown = cooldown
+
+        self.drifts = {}
+        self.corrections = {}
+        self.over = {}
+        self.corrected = {}
+        self.checks = 0
+        self.error = None
+
+        self.stopped = threading.Event()
+        self.thread = None
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def check(self, now: Optional[float] = None) -> list:
+        """
+        Measures the drift of every player and corrects the players that
+        drifted.
+
+        Parameters
+        ----------
+        now: float, optional
+            Monotonic time of the check. Defaults to now.
+
+        Returns
+        -------
+        list
+            Results of the corrective seeks, see `MutationBatch.execute`.
+
+        """
+        now = time.monotonic() if now is None else now
+        players = self.remote.players_data(FIELDS)
+        reference = find_reference(players, self.reference)
+
+        if reference is None:
+            raise MultiViewerForF1Error("No reference player to sync to.")
+
+        self.checks += 1
+        batch = self.remote.batch()
+        ids = set()
+
+        for player in players:
+            id = str(player["id"])
+
+            if player is reference:
+                continue
+
+            ids.add(id)
+
+            # Loading players are measured once they report a position.
+            if not measurable(player):
+                continue
+
+            seconds = drift(player, reference)
+            self.drifts.setdefault(id, deque(maxlen=100)).append(seconds)
+
+            if abs(seconds) <= self.threshold:
+                self.over[id] = 0
+                continue
+
+            self.over[id] = self.over.get(id, 0) + 1
+
+            if (self.over[id] < self.samples
+                    or now - self.corrected.get(id, -self.cooldown)
+                    < self.cooldown):
+                continue
+
+            batch.player_seek_to(id, relative=-seconds)
+            self.over[id] = 0
+            self.corrected[id] = now
+            self.corrections[id] = self.corrections.get(id, 0) + 1
+
+        # Forget the players that were closed.
+        for closed in set(self.drifts) - ids:
+            for table in (self.drifts, self.over, self.corrected):
+                table.pop(closed, None)
+
+        return batch.execute() if len(batch) else []
+
+    def statistics(self) -> dict:
+        """
+        Returns the drift statistics of each player.
+
+        Returns
+        -------
+        dict
+            Number of checks and, keyed by player id, the latest, mean
+            absolute and maximum absolute drift in seconds and the number
+            of corrections.
+
+        """
+        players = {}
+
+        for id, drifts in self.drifts.items():
+            absolute = [abs(seconds) for seconds in drifts]
+            players[id] = {"drift": drifts[-1],
+                           "mean": statistics.fmean(absolute),
+                           "max": max(absolute),
+                           "corrections": self.corrections.get(id, 0)}
+
+        return {"checks": self.checks, "players": players}
+
+    def run(self):
+        """
+        Checks until stopped. This is the body of the supervisor thread.
+        """
+        while not self.stopped.is_set():
+            started = time.monotonic()
+
+            try:
+                self.check(started)
+                self.error = None
+            except Exception as e:
+                self.error = e
+                logging.warning(f"Player sync check failed: {e}")
+
+            elapsed = time.monotonic() - started
+            self.stopped.wait(max(0.0, self.interval - elapsed))
+
+    def start(self):
+        """
+        Starts the supervisor thread if it is not already running.
+        """
+        if self.running:
+            return
+
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run,
+                                       name="mvf1-sync-supervisor",
+                                       daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stops the supervisor thread.
+
+        Parameters
+        ----------
+        timeout: float, optional
+            Seconds to wait for the thread to finish.
+
+        """
+        thread = self.thread
+        self.thread = None
+        self.stopped.set()
+
+        if thread is not None:
+            thread.join(timeout)
@@ -0,0 +1,383 @@
+from typing import Optional
+
+from .mvf1 import MultiViewerForF1Error
+from .poller import F1Listener
+from .timing import values
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Column types of the car data, keyed by column, and the CarData channel
+# each column is read from.
+CAR_DATA = {
+    "t": "f8",
+    "rpm": "u2",
+    "speed": "u2",
+    "gear": "u1",
+    "throttle": "u1",
+    "brake": "u1",
+    "drs": "u1",
+}
+CHANNELS = {
+    "rpm": "0",
+    "speed": "2",
+    "gear": "3",
+    "throttle": "4",
+    "brake": "5",
+    "drs": "45",
+}
+
+# Column types of the positions, keyed by column.
+POSITION = {
+    "t": "f8",
+    "x": "i4",
+    "y": "i4",
+    "z": "i4",
+}
+
+
+def timestamp(utc: str) -> float:
+    """
+    Returns the UNIX time of a live timing timestamp.
+
+    Parameters
+    ----------
+    utc: str
+        ISO 8601 timestamp in UTC, e.g. 2023-10-29T20:41:10.1234567Z.
+
+    Returns
+    -------
+    float
+        Seconds since the epoch.
+
+    """
+    nanoseconds = numpy.datetime64(utc.rstrip("Z"), "ns").astype("i8")
+
+    return float(nanoseconds) / 1e9
+
+
+class ColumnRing(object):
+    """
+    Fixed size ring of typed columns.
+
+    Rows are written in place into preallocated NumPy arrays, overwriting
+    the oldest once `capacity` rows were appended. Rows must be appended in
+    time order (column `t`), so windows are found by bisection.
+
+    Parameters
+    ----------
+    columns: dict
+        NumPy type of each column, keyed by column.
+    capacity: int
+        Rows kept.
+
+    Attributes
+    ----------
+    count: int
+        Rows ever appended.
+    """
+
+    def __init__(self, columns: dict, capacity: int):
+        self.capacity = capacity
+        self.columns = {name: numpy.zeros(capacity, dtype=dtype)
+                        for name, dtype in columns.items()}
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    @property
+    def last(self) -> Optional[float]:
+        if not self.count:
+            return None
+
+        return float(self.columns["t"][(self.count - 1) % self.capacity])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def append(self, row: dict):
+        position = self.count % self.capacity
+
+        for name, column in self.columns.items():
+            column[position] = row.get(name) or 0
+
+        self.count += 1
+
+    def column(self, name: str) -> "numpy.ndarray":
+        """
+        Returns a column in time order.
+
+        Parameters
+        ----------
+        name: str
+            Column.
+
+        Returns
+        -------
+        numpy.ndarray
+            Copy of the column, oldest row first.
+
+        """
+        column = self.columns[name]
+
+        if self.count <= self.capacity:
+            return column[:self.count].copy()
+
+        position = self.count % self.capacity
+
+        return numpy.concatenate((column[position:], column[:position]))
+
+    def window(self, start: Optional[float] = None,
+               end: Optional[float] = None) -> dict:
+        """
+        Returns the rows between two times.
+
+        Parameters
+        ----------
+        start: float, optional
+            First time in seconds, inclusive. Defaults to the oldest row.
+
+        end: float, optional
+            Last time in seconds, inclusive. Defaults to the newest row.
+
+        Returns
+        -------
+        dict
+            Arrays keyed by column.
+
+        """
+        t = self.column("t")
+        first = 0 if start is None else numpy.searchsorted(t, start, "left")
+        last = len(t) if end is None else numpy.searchsorted(t, end, "right")
+
+        return {name: (t if name == "t" else self.column(name))[first:last]
+                for name in self.columns}
+
+
+class TelemetryStore(F1Listener):
+    """
+    Columnar store of the car data and positions of each driver.
+
+    The CarData and Position topics of the F1 live timing state hold the
+    latest samples of every car as nested JSON. Each ingested state
+    appends the samples newer than the last one of each driver to a
+    ColumnRing per driver, so a race of samples costs a few bytes per
+    sample instead of a dict each, and traces are sliced as arrays.
+
+    Requires numpy (pip install mvf1[telemetry]). Export to Arrow and
+    Parquet also requires pyarrow.
+
+    Parameters
+    ----------
+    capacity: int, optional
+        Samples kept per driver and kind. Defaults to 32768, more than
+        two hours of car data.
+
+    Attributes
+    ----------
+    car_data_rings: dict
+        ColumnRing of the car data of each driver, keyed by racing number.
+    position_rings: dict
+        ColumnRing of the positions of each driver, keyed by racing number.
+    """
+
+    def __init__(self, capacity: int = 32768):
+        if numpy is None:
+            raise MultiViewerForF1Error("numpy is required for telemetry - "
+                                        "pip install mvf1[telemetry]")
+
+        self.capacity = capacity
+        self.car_data_rings = {}
+        self.position_rings = {}
+
+    @property
+    def drivers(self) -> list:
+        numbers = set(self.car_data_rings) | set(self.position_rings)
+
+        return sorted(numbers, key=int)
+
+    @property
+    def nbytes(self) -> int:
+        rings = list(self.car_data_rings.values())
+        rings += list(self.position_rings.values())
+
+        return sum(ring.nbytes for ring in rings)
+
+    def ring(self, rings: dict, columns: dict, driver: str) -> ColumnRing:
+        if driver not in rings:
+            rings[driver] = ColumnRing(columns, self.capacity)
+
+        return rings[driver]
+
+    def ingest(self, state: dict) -> int:
+        """
+        Appends the new samples of an F1 live timing state.
+
+        Parameters
+        ----------
+        state: dict
+            F1 live timing state with CarData and/or Position.
+
+        Returns
+        -------
+        int
+            Samples appended.
+
+        """
+        appended = 0
+        car_data = (state.get("CarData") or {}).get("Entries")
+        position = (state.get("Position") or {}).get("Position")
+
+        for entry in values(car_data):
+            t = timestamp(entry["Utc"])
+
+            for driver, car in (entry.get("Cars") or {}).items():
+                ring = self.ring(self.car_data_rings, CAR_DATA, driver)
+
+                if ring.last is not None and t <= ring.last:
+                    continue
+
+                channels = car.get("Channels") or {}
+                row = {name: channels.get(channel)
+                       for name, channel in CHANNELS.items()}
+                row["t"] = t
+                ring.append(row)
+                appended += 1
+
+        for entry in values(position):
+            t = timestamp(entry["Timestamp"])
+
+            for driver, place in (entry.get("Entries") or {}).items():
+                ring = self.ring(self.position_rings, POSITION, driver)
+
+                if ring.last is not None and t <= ring.last:
+                    continue
+
+                ring.append({"t": t, "x": place.get("X"), "y": place.get("Y"),
+                             "z": place.get("Z")})
+                appended += 1
+
+        return appended
+
+    def car_data(self, driver, start: Optional[float] = None,
+                 end: Optional[float] = None) -> dict:
+        """
+        Returns the car data of a driver.
+
+        Parameters
+        ----------
+        driver: int or str
+            Racing number.
+
+        start: float, optional
+            First UNIX time. Defaults to the oldest sample.
+
+        end: float, optional
+            Last UNIX time. Defaults to the newest sample.
+
+        Returns
+        -------
+        dict
+            Arrays of t, rpm, speed, gear, throttle, brake and drs.
+
+        """
+        return self.window(self.car_data_rings, driver, start, end)
+
+    def position(self, driver, start: Optional[float] = None,
+                 end: Optional[float] = None) -> dict:
+        """
+        Returns the positions of a driver.
+
+        Parameters
+        ----------
+        driver: int or str
+            Racing number.
+
+        start: float, optional
+            First UNIX time. Defaults to the oldest sample.
+
+        end: float, optional
+            Last UNIX time. Defaults to the newest sample.
+
+        Returns
+        -------
+        dict
+            Arrays of t, x, y and z.
+
+        """
+        return self.window(self.position_rings, driver, start, end)
+
+    def window(self, rings: dict, driver, start, end) -> dict:
+        if str(driver) not in rings:
+            raise MultiViewerForF1Error(f"No telemetry for driver {driver}.")
+
+        return rings[str(driver)].window(start, end)
+
+    def to_arrow(self, kind: str = "car_data"):
+        """
+        Exports the samples of all drivers as an Arrow table.
+
+        Parameters
+        ----------
+        kind: str, optional
+            car_data or position. Defaults to car_data.
+
+        Returns
+        -------
+        pyarrow.Table
+            Table with a driver column followed by the columns of the kind.
+
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise MultiViewerForF1Error("pyarrow is required to export "
+                                        "telemetry - pip install "
+                                        "mvf1[telemetry]")
+
+        if kind not in ("car_data", "position"):
+            raise MultiViewerForF1Error(f"Unknown telemetry {kind} - can be "
+                                        f"car_data or position.")
+
+        rings = getattr(self, f"{kind}_rings")
+        columns = CAR_DATA if kind == "car_data" else POSITION
+        windows = [(driver, rings[driver].window())
+                   for driver in self.drivers if driver in rings]
+
+        drivers = numpy.repeat([driver for driver, _ in windows],
+                               [len(window["t"]) for _, window in windows])
+        table = {"driver": pyarrow.array(drivers.astype(str),
+                                         type=pyarrow.string())}
+
+        for name, dtype in columns.items():
+            arrays = [window[name] for _, window in windows]
+            table[name] = pyarrow.array(
+                numpy.concatenate(arrays) if arrays
+                else numpy.zeros(0, dtype=dtype)
+            )
+
+        return pyarrow.table(table)
+
+    def to_parquet(self, path: str, kind: str = "car_data"):
+        """
+        Writes the samples of all drivers to a Parquet file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file.
+
+        kind: str, optional
+            car_data or position. Defaults to car_data.
+
+        """
+        table = self.to_arrow(kind)
+
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(table, path)
@@ -0,0 +1,345 @@
+from typing import Optional
+
+
+TRACK_STATUS = {
+    "1": "GREEN",
+    "2": "YELLOW",
+    "4": "SC",
+    "5": "RED",
+    "6": "VSC",
+    "7": "VSC_ENDING",
+}
+
+# Topics of the F1 live timing state each summary reads.
+TOPICS = {
+    "standings": ("TimingData", "DriverList"),
+    "track_status": ("TrackStatus", "SessionStatus", "LapCount"),
+    "race_control_messages": ("RaceControlMessages",),
+    "weather": ("WeatherData",),
+    "tyre_stints": ("TimingAppData", "DriverList"),
+    "pit_stops": ("PitLaneTimeCollection", "TimingData", "DriverList"),
+}
+
+
+def response_state(response: dict) -> dict:
+    """
+    Returns the state in a live timing response.
+
+    Parameters
+    ----------
+    response: dict
+        MultiViewerForF1 API Response of a single live timing query.
+
+    Returns
+    -------
+    dict
+        Live timing state.
+
+    """
+    data = response.get("data") or {}
+
+    return next(iter(data.values()), None) or {}
+
+
+def f1_state(response: dict) -> dict:
+    """
+    Returns the F1 live timing state in a response.
+
+    Parameters
+    ----------
+    response: dict
+        MultiViewerForF1 API Response with f1LiveTimingState.
+
+    Returns
+    -------
+    dict
+        F1 live timing state.
+
+    """
+    return (response.get("data") or {}).get("f1LiveTimingState") or {}
+
+
+def track_time(clock: Optional[dict], at: float) -> Optional[int]:
+    """
+    Returns the track time at a wall time from a live timing clock.
+
+    Parameters
+    ----------
+    clock: dict
+        f1LiveTimingClock with paused, systemTime and trackTime in
+        milliseconds.
+
+    at: float
+        Wall time in seconds.
+
+    Returns
+    -------
+    int
+        Track time in milliseconds, or None without a clock.
+
+    """
+    if not clock or clock.get("trackTime") is None:
+        return None
+
+    if clock.get("paused"):
+        return int(clock["trackTime"])
+
+    return int(clock["trackTime"] + at * 1000 - clock["systemTime"])
+
+
+def values(collection) -> list:
+    """
+    Returns the items of a live timing collection.
+
+    Live timing sends collections either as lists or as dicts keyed by
+    index, depending on how the topic was built up.
+
+    Parameters
+    ----------
+    collection: list or dict
+        Live timing collection.
+
+    Returns
+    -------
+    list
+        Items in order.
+
+    """
+    if isinstance(collection, dict):
+        return [collection[key] for key in sorted(collection, key=_index)]
+
+    return list(collection or [])
+
+
+def _index(key):
+    try:
+        return int(key)
+    except (TypeError, ValueError):
+        return key
+
+
+def _value(field):
+    if isinstance(field, dict):
+        return field.get("Value")
+
+    return field
+
+
+def _tla(state: dict, number: str) -> Optional[str]:
+    return (state.get("DriverList") or {}).get(number, {}).get("Tla")
+
+
+def standings(state: dict) -> list:
+    """
+    Summarizes the running order.
+
+    Parameters
+    ----------
+    state: dict
+        F1 live timing state with TimingData and DriverList.
+
+    Returns
+    -------
+    list
+        One dict per driver in position order with position, number, tla,
+        team, gap to leader, interval, laps, last and best lap, pit stops and
+        pit/retired status.
+
+    """
+    drivers = state.get("DriverList") or {}
+    rows = []
+
+    for number, line in ((state.get("TimingData") or {}).get("Lines")
+                         or {}).items():
+        driver = drivers.get(number, {})
+
+        rows.append({
+            "position": _index(line.get("Position")),
+            "number": number,
+            "tla": driver.get("Tla"),
+            "team": driver.get("TeamName"),
+            "gap": line.get("GapToLeader"),
+            "interval": _value(line.get("IntervalToPositionAhead")),
+            "laps": line.get("NumberOfLaps"),
+            "last_lap": _value(line.get("LastLapTime")),
+            "best_lap": _value(line.get("BestLapTime")),
+            "pit_stops": line.get("NumberOfPitStops"),
+            "in_pit": bool(line.get("InPit")),
+            "retired": bool(line.get("Retired")),
+        })
+
+    return sorted(rows, key=lambda row: row["position"]
+                  if isinstance(row["position"], int) else len(rows) + 1)
+
+
+def track_status(state: dict) -> dict:
+    """
+    Summarizes the track status, session status and lap count.
+
+    Parameters
+    ----------
+    state: dict
+        F1 live timing state with TrackStatus, SessionStatus and LapCount.
+
+    Returns
+    -------
+    dict
+        Flag (GREEN, YELLOW, SC, VSC, VSC_ENDING or RED), raw status and
+        message, session status, current and total laps.
+
+    """
+    track = state.get("TrackStatus") or {}
+    laps = state.get("LapCount") or {}
+    status = track.get("Status")
+
+    return {
+        "flag": TRACK_STATUS.get(status, status),
+        "status": status,
+        "message": track.get("Message"),
+        "session": (state.get("SessionStatus") or {}).get("Status"),
+        "lap": laps.get("CurrentLap"),
+        "total_laps": laps.get("TotalLaps"),
+    }
+
+
+def race_control_messages(state: dict, limit: Optional[int] = 10) -> list:
+    """
+    Summarizes the latest race control messages.
+
+    Parameters
+    ----------
+    state: dict
+        F1 live timing state with RaceControlMessages.
+
+    limit: int, optional
+        Maximum number of messages, newest last. Defaults to 10.
+
+    Returns
+    -------
+    list
+        Messages with utc, lap, category, flag, scope and message.
+
+    """
+    messages = values((state.get("RaceControlMessages") or {})
+                      .get("Messages"))
+
+    if limit:
+        messages = messages[-limit:]
+
+    return [{key.lower(): message[key]
+             for key in ("Utc", "Lap", "Category", "Flag", "Scope",
+                         "Sector", "RacingNumber", "Message")
+             if key in message}
+            for message in messages]
+
+
+def weather(state: dict) -> dict:
+    """
+    Summarizes the current weather as numbers.
+
+    Parameters
+    ----------
+    state: dict
+        F1 live timing state with WeatherData.
+
+    Returns
+    -------
+    dict
+        Air and track temperature, humidity, pressure, wind speed and
+        direction, and whether it is raining.
+
+    """
+    data = state.get("WeatherData") or {}
+
+    def number(key):
+        try:
+            return float(data[key])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    return {
+        "air_temp": number("AirTemp"),
+        "track_temp": number("TrackTemp"),
+        "humidity": number("Humidity"),
+        "pressure": number("Pressure"),
+        "wind_speed": number("WindSpeed"),
+        "wind_direction": number("WindDirection"),
+        "rainfall": bool(number("Rainfall")),
+    }
+
+
+def tyre_stints(state: dict) -> list:
+    """
+    Summarizes the current tyre and stint history of each driver.
+
+    Parameters
+    ----------
+    state: dict
+        F1 live timing state with TimingAppData and DriverList.
+
+    Returns
+    -------
+    list
+        One dict per driver with number, tla, current compound, tyre age in
+        laps, whether the set was new and the compounds of every stint.
+
+    """
+    rows = []
+
+    for number, line in ((state.get("TimingAppData") or {}).get("Lines")
+                         or {}).items():
+        stints = values(line.get("Stints"))
+        current = stints[-1] if stints else {}
+
+        rows.append({
+            "number": number,
+            "tla": _tla(state, number),
+            "compound": current.get("Compound"),
+            "age": current.get("TotalLaps"),
+            "new": str(current.get("New")).lower() == "true",
+            "stints": [stint.get("Compound") for stint in stints],
+        })
+
+    return rows
+
+
+def pit_stops(state: dict) -> list:
+    """
+    Summarizes pit stops: the latest stop of each driver and who is in the
+    pit lane now.
+
+    Parameters
+    ----------
+    state: dict
+        F1 live timing state with PitLaneTimeCollection, TimingData and
+        DriverList.
+
+    Returns
+    -------
+    list
+        One dict per driver that has stopped or is in the pit lane with
+        number, tla, stops, in_pit, and the lap and duration of the latest
+        timed stop.
+
+    """
+    lines = (state.get("TimingData") or {}).get("Lines") or {}
+    times = (state.get("PitLaneTimeCollection") or {}).get("PitTimes") or {}
+    rows = []
+
+    for number in sorted(set(lines) | set(times), key=_index):
+        line = lines.get(number, {})
+        stop = times.get(number, {})
+
+        if not (line.get("NumberOfPitStops") or line.get("InPit") or stop):
+            continue
+
+        rows.append({
+            "number": number,
+            "tla": _tla(state, number),
+            "stops": line.get("NumberOfPitStops"),
+            "in_pit": bool(line.get("InPit")),
+            "lap": _index(stop.get("Lap")),
+            "duration": stop.get("Duration"),
+        })
+
+    return rows
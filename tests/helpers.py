@@ -0,0 +1,21 @@
+from mvf1.poller import Snapshot
+
+
+# Response field of each series, for building snapshots.
+FIELDS = {"clock": "f1LiveTimingClock",
+          "f1": "f1LiveTimingState",
+          "fiawec": "fiawecLiveTimingState"}
+
+
+def laps(lap, status="1", **topics):
+    return dict(topics,
+                LapCount={"CurrentLap": lap, "TotalLaps": 71},
+                TrackStatus={"Status": status})
+
+
+def timing_state(laps):
+    return {'data': {'f1LiveTimingState': {'LapCount': {'CurrentLap': laps}}}}
+
+
+def snapshot(series, data):
+    return Snapshot(series, 1, {"data": {FIELDS[series]: data}}, 0.0)
@@ -0,0 +1,158 @@
+import json
+import os
+import tempfile
+
+from unittest import TestCase
+
+from mvf1 import MultiViewerForF1Error
+from mvf1.archive import ArchiveReader
+from mvf1.archive import ArchiveWriter
+from mvf1.archive import apply_record
+from mvf1.archive import open_segment
+
+from tests.helpers import laps
+
+
+class TestArchiveWriter(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "race")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read(self, segment):
+        with open_segment(os.path.join(self.path, segment["file"]), "r",
+                          "gzip") as f:
+            return [json.loads(line) for line in f]
+
+    def test_keyframe_and_patches(self):
+        with ArchiveWriter(self.path, compression="gzip") as writer:
+            writer.write("f1", laps(1), t=100.0, track=5000)
+            writer.write("f1", laps(1), t=101.0, track=6000)
+            writer.write("f1", laps(2), t=102.0, track=7000)
+
+        with open(os.path.join(self.path, "index.json")) as f:
+            index = json.load(f)
+
+        self.assertEqual(index["series"], ["f1"])
+        self.assertEqual(len(index["segments"]), 1)
+
+        segment = index["segments"][0]
+        records = self.read(segment)
+
+        self.assertEqual(segment["records"], 2)
+        self.assertEqual(segment["track_start"], 5000)
+        self.assertEqual(segment["track_end"], 7000)
+        self.assertEqual(records[0]["state"], laps(1))
+        self.assertEqual(records[1]["patch"], {"LapCount": {"CurrentLap": 2}})
+
+    def test_segments_roll(self):
+        with ArchiveWriter(self.path, segment_seconds=10,
+                           compression="gzip") as writer:
+            writer.write("f1", laps(1), t=100.0)
+            writer.write("f1", laps(2), t=105.0)
+            writer.write("f1", laps(3), t=111.0)
+            writer.write("fiawec", {"Lap": 1}, t=112.0)
+
+            self.assertEqual([segment.get("bytes") is not None for segment
+                              in writer.index["segments"]], [True, False])
+
+        segments = writer.index["segments"]
+
+        self.assertEqual(len(segments), 2)
+        self.assertEqual(segments[1]["series"], ["f1", "fiawec"])
+        self.assertEqual(self.read(segments[1])[0]["state"], laps(3))
+
+    def test_crash_loses_only_the_tail(self):
+        writer = ArchiveWriter(self.path, compression="gzip",
+                               flush_seconds=5)
+
+        writer.write("f1", laps(1), t=100.0, track=1000)
+
+        self.assertEqual(len(ArchiveReader(self.path).segments), 1)
+
+        for lap in range(2, 6):
+            writer.write("f1", laps(lap), t=98.0 + lap * 2, track=lap * 1000)
+
+        # Read while the writer is left open, as after a crash: the record
+        # after the last flush is lost.
+        reader = ArchiveReader(self.path)
+
+        self.assertEqual(reader.segments[0]["track_end"], 4000)
+        self.assertEqual([record["t"] for record in reader.records()],
+                         [100.0, 102.0, 104.0, 106.0])
+
+        writer.close()
+
+    def test_existing_archive(self):
+        ArchiveWriter(self.path).close()
+
+        with self.assertRaises(MultiViewerForF1Error):
+            ArchiveWriter(self.path)
+
+    def test_unknown_compression(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            ArchiveWriter(self.path, compression="rar")
+
+
+class TestArchiveReader(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "race")
+
+        with ArchiveWriter(self.path, segment_seconds=10,
+                           compression="gzip") as writer:
+            writer.write("f1", laps(1), t=100.0, track=5000)
+            writer.write("f1", laps(2), t=105.0, track=10000)
+            writer.write("f1", laps(3, "4"), t=111.0, track=16000)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_records(self):
+        reader = ArchiveReader(self.path)
+        states = {}
+
+        for record in reader.records():
+            apply_record(states, record)
+
+        self.assertEqual((reader.start, reader.end), (100.0, 111.0))
+        self.assertEqual(states, {"f1": laps(3, "4")})
+        self.assertEqual(len(list(reader.records(1))), 1)
+
+    def test_missing_archive(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            ArchiveReader(self.directory.name)
+
+    def test_state_at(self):
+        reader = ArchiveReader(self.path)
+
+        self.assertEqual(reader.state_at(4999), {})
+        self.assertEqual(reader.state_at(5000), {"f1": laps(1)})
+        self.assertEqual(reader.state_at(12000), {"f1": laps(2)})
+        self.assertEqual(reader.state_at(10 ** 9), {"f1": laps(3, "4")})
+        self.assertEqual(reader.state_at(12000, series=["fiawec"]), {})
+
+    def test_state_at_earlier_keyframe(self):
+        path = os.path.join(self.directory.name, "wec")
+
+        with ArchiveWriter(path, segment_seconds=10,
+                           compression="gzip") as writer:
+            writer.write("fiawec", {"Lap": 1}, t=100.0, track=5000)
+            writer.write("f1", laps(1), t=111.0, track=16000)
+            writer.write("f1", laps(2), t=112.0, track=17000)
+            writer.write("fiawec", {"Lap": 2}, t=113.0, track=18000)
+
+        reader = ArchiveReader(path)
+
+        self.assertEqual(reader.state_at(17500), {"f1": laps(2),
+                                                  "fiawec": {"Lap": 1}})
+        self.assertEqual(reader.state_at(18000)["fiawec"], {"Lap": 2})
+
+    def test_state_at_reads_lazily(self):
+        reader = ArchiveReader(self.path)
+        records = reader.segment_records(reader.segments[0])
+
+        self.assertEqual(next(records)["state"], laps(1))
+        records.close()
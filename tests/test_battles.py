@@ -0,0 +1,110 @@
+import copy
+import json
+
+from unittest import TestCase
+from unittest import skipUnless
+
+from mvf1.poller import Snapshot
+
+try:
+    import numpy
+    from mvf1.battles import BattleDetector
+    from mvf1.battles import BattleEvent
+except ImportError:
+    numpy = None
+
+
+f = open('tests/timing_state.json')
+mock_timing_state = json.load(f)
+f.close()
+
+state = mock_timing_state['data']['f1LiveTimingState']
+
+
+def intervals(**values):
+    new = copy.deepcopy(state)
+
+    for number, interval in values.items():
+        new["TimingData"]["Lines"][number.lstrip("_")][
+            "IntervalToPositionAhead"]["Value"] = interval
+
+    return new
+
+
+@skipUnless(numpy, "numpy is not installed")
+class TestBattleDetector(TestCase):
+    def setUp(self):
+        self.detector = BattleDetector(threshold=1.0, release=1.5)
+        self.events = []
+        self.detector.add_listener(self.events.append)
+
+    def test_start(self):
+        events = self.detector.ingest(state, at=1.0)
+
+        self.assertEqual(events, [BattleEvent("start", "11", "1", 0.812,
+                                              1.0)])
+        self.assertEqual(self.events, events)
+        self.assertEqual(self.detector.battles, [("11", "1", 0.812)])
+
+    def test_hysteresis(self):
+        self.detector.ingest(state)
+
+        self.assertEqual(self.detector.ingest(intervals(_1="+1.300")), [])
+        self.assertEqual(self.detector.ingest(intervals(_1="+1.600")),
+                         [BattleEvent("end", "11", "1", 1.6, 0)])
+        self.assertEqual(self.detector.ingest(intervals(_1="+1.200")), [])
+        self.assertEqual(self.detector.battles, [])
+
+    def test_pit_ends_battle(self):
+        self.detector.ingest(state)
+        new = copy.deepcopy(state)
+        new["TimingData"]["Lines"]["1"]["InPit"] = True
+
+        self.assertEqual([event.kind for event in self.detector.ingest(new)],
+                         ["end"])
+
+    def test_car_in_pit_ahead(self):
+        self.detector.ingest(state)
+
+        events = self.detector.ingest(intervals(_44="+0.500"))
+
+        self.assertEqual(events, [])
+
+    def test_overtake_switches_battle(self):
+        self.detector.ingest(state)
+        new = copy.deepcopy(state)
+        lines = new["TimingData"]["Lines"]
+        lines["1"]["Position"], lines["11"]["Position"] = "1", "2"
+        lines["11"]["IntervalToPositionAhead"]["Value"] = "+0.400"
+
+        events = self.detector.ingest(new)
+
+        self.assertEqual(events, [BattleEvent("end", "11", "1", None, 0),
+                                  BattleEvent("start", "1", "11", 0.4, 0)])
+
+    def test_unchanged_state(self):
+        self.detector.ingest(state)
+
+        self.assertEqual(self.detector.ingest(copy.deepcopy(state)), [])
+
+    def test_apply(self):
+        self.detector.apply(state)
+        events = self.detector.apply({"TimingData": {"Lines": {"1": {
+            "IntervalToPositionAhead": {"Value": "+2.000"}
+        }}}})
+
+        self.assertEqual([event.kind for event in events], ["end"])
+
+    def test_grows(self):
+        detector = BattleDetector()
+
+        for number in range(40):
+            detector.slot(str(number))
+
+        self.assertGreaterEqual(len(detector.positions), 40)
+
+    def test_update(self):
+        self.detector.update(Snapshot("f1", 1, mock_timing_state, 0.0),
+                             None)
+
+        self.assertEqual(len(self.events), 1)
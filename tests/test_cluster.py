@@ -0,0 +1,215 @@
+import socket
+import time
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from mvf1 import MultiViewerForF1Error
+from mvf1.cluster import MultiViewerCluster
+from mvf1.cluster import estimate_offset
+from mvf1.cluster import host_uri
+from mvf1.replay import ReplayServer
+from mvf1.replay import SimulatedPlayers
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class SkewedClock(object):
+    """
+    Timing source of a host whose clock runs `skew` seconds ahead. Like the
+    app's, its systemTime is the anchor of trackTime, not the current time.
+    """
+
+    def __init__(self, skew: float):
+        self.skew = skew
+        self.anchor = self.time()
+
+    def time(self) -> float:
+        return time.time() + self.skew
+
+    def state(self, series):
+        return None
+
+    def live_timing_clock(self) -> dict:
+        return {"paused": False, "systemTime": int(self.anchor * 1000),
+                "trackTime": 0, "liveTimingStartTime": 0}
+
+
+class TestHostUri(TestCase):
+    def test_host_uri(self):
+        self.assertEqual(host_uri("wall-2"),
+                         "http://wall-2:10101/api/graphql")
+        self.assertEqual(host_uri("10.0.0.12:8080"),
+                         "http://10.0.0.12:8080/api/graphql")
+        self.assertEqual(host_uri("https://wall/api/graphql"),
+                         "https://wall/api/graphql")
+
+
+class TestMultiViewerCluster(TestCase):
+    def setUp(self):
+        self.servers = [ReplayServer(create_lag=0, port=0) for _ in range(2)]
+
+        for server, titles in zip(self.servers, (("INTERNATIONAL", "VER"),
+                                                 ("LEC",))):
+            server.start()
+
+            for title in titles:
+                server.players.create({"contentId": 1,
+                                       "streamTitle": title})
+
+        self.cluster = MultiViewerCluster(
+            {"left": self.servers[0].url, "right": self.servers[1].url},
+            timeout=1.0,
+        )
+
+    def tearDown(self):
+        self.cluster.close()
+
+        for server in self.servers:
+            server.stop()
+
+    def test_players(self):
+        players = self.cluster.players()
+
+        self.assertEqual([(host, player.title) for host, player in players],
+                         [("left", "INTERNATIONAL"), ("left", "VER"),
+                          ("right", "LEC")])
+
+    def test_players_data(self):
+        self.assertEqual(self.cluster.players_data(["streamData.title"]), [
+            {"id": "1", "streamData": {"title": "INTERNATIONAL"},
+             "host": "left"},
+            {"id": "2", "streamData": {"title": "VER"}, "host": "left"},
+            {"id": "1", "streamData": {"title": "LEC"}, "host": "right"},
+        ])
+
+    def test_batch(self):
+        results = self.cluster.batch(
+            lambda batch, client: [batch.player_set_volume(player.id, 10)
+                                   for player in client.players]
+        )
+
+        self.assertEqual([len(results[host].value) for host in results],
+                         [2, 1])
+        self.assertEqual({player["state"]["volume"] for player
+                          in self.cluster.players_data(["state.volume"])},
+                         {10})
+
+    def test_concurrent(self):
+        started = time.monotonic()
+        results = self.cluster.map(lambda client: time.sleep(0.3))
+
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertLess(time.monotonic() - started, 0.55)
+
+    def test_timeout(self):
+        slow = self.cluster.clients["right"]
+        results = self.cluster.map(
+            lambda client: time.sleep(0.5 if client is slow else 0),
+            timeout=0.2,
+        )
+
+        self.assertTrue(results["left"].ok)
+        self.assertIsInstance(results["right"].error, TimeoutError)
+
+    def test_failed_host(self):
+        cluster = MultiViewerCluster([self.servers[0].url,
+                                      f"127.0.0.1:{closed_port()}"])
+
+        with cluster:
+            results = cluster.call("players_data", ["id"])
+            players = cluster.players()
+
+        self.assertEqual([result.ok for result in results.values()],
+                         [True, False])
+        self.assertEqual(len(players), 2)
+
+
+class TestCrossHostSync(TestCase):
+    def setUp(self):
+        self.servers = []
+
+        for skew, players in ((0.0, (("INTERNATIONAL", 60), ("VER", 61))),
+                              (5.0, (("LEC", 58), ("HAM", 60)))):
+            clock = SkewedClock(skew)
+            server = ReplayServer(clock, SimulatedPlayers(create_lag=0,
+                                                          clock=clock.time),
+                                  port=0)
+            server.start()
+            self.servers.append(server)
+
+            for title, position in players:
+                id = server.players.create({"contentId": 1,
+                                            "streamTitle": title})
+                server.players.get(id).seek(position)
+
+        self.cluster = MultiViewerCluster(
+            {"left": self.servers[0].url, "right": self.servers[1].url}
+        )
+
+    def tearDown(self):
+        self.cluster.close()
+
+        for server in self.servers:
+            server.stop()
+
+    def test_estimate_clocks(self):
+        results = self.cluster.estimate_clocks(samples=4)
+
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertAlmostEqual(self.cluster.offsets["left"].offset, 0.0,
+                               delta=0.05)
+        self.assertAlmostEqual(self.cluster.offsets["right"].offset, 5.0,
+                               delta=0.05)
+
+    def test_no_players(self):
+        for id in ("1", "2"):
+            self.servers[0].players.delete(id)
+
+        with self.assertRaises(MultiViewerForF1Error):
+            estimate_offset(self.cluster.clients["left"])
+
+    def test_stale_states(self):
+        sampled = time.time()
+
+        for player in self.servers[0].players.players.values():
+            player.clock = lambda: sampled
+
+        with self.assertRaises(MultiViewerForF1Error):
+            estimate_offset(self.cluster.clients["left"], samples=3)
+
+    def test_drifts(self):
+        drifts = self.cluster.drifts()
+
+        self.assertAlmostEqual(drifts["left"]["2"], 1.0, delta=0.05)
+        self.assertAlmostEqual(drifts["right"]["1"], -2.0, delta=0.05)
+        self.assertAlmostEqual(drifts["right"]["2"], 0.0, delta=0.05)
+
+    def test_drifts_skip_loading_players(self):
+        loading = self.servers[1].players.get("1")
+        data = loading.data
+
+        def unloaded():
+            return dict(data(), state=None)
+
+        self.cluster.estimate_clocks(samples=2)
+
+        with patch.object(loading, "data", unloaded):
+            drifts = self.cluster.drifts()
+
+        self.assertEqual(set(drifts["right"]), {"2"})
+        self.assertAlmostEqual(drifts["right"]["2"], 0.0, delta=0.05)
+
+    def test_sync(self):
+        results = self.cluster.sync()
+
+        self.assertEqual([len(result.value) for result in results.values()],
+                         [1, 1])
+
+        for players in self.cluster.drifts().values():
+            for seconds in players.values():
+                self.assertLess(abs(seconds), 0.04)
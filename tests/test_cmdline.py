@@ -1,4 +1,6 @@
 import json
+import os
+import tempfile
 
 from unittest import TestCase
 from unittest.mock import patch
@@ -8,6 +10,7 @@ from mvf1.cmdline import cli
 
 from urllib.error import URLError
 from mvf1 import MultiViewerForF1Error
+from mvf1.archive import ArchiveWriter
 
 
 f = open('tests/players.json')
@@ -633,6 +636,56 @@ class TestMultiViewerForF1CommandLineInterfacePlayer(TestCase):
             self.assertIn("error", response.output.lower())
 
 
+class TestMultiViewerForF1CommandLineInterfaceRun(TestCase):
+    def setUp(self):
+        self.runner = CliRunner()
+        self.directory = tempfile.TemporaryDirectory()
+        self.plan = os.path.join(self.directory.name, "plan.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_plan(self, steps):
+        with open(self.plan, "w") as f:
+            json.dump(steps, f)
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_run(self, mock_urlopen):
+        configure_mock_response(mock_urlopen,
+                                [mock_players,
+                                 {'data': {'m0': True, 'm1': 50.0}}])
+        self.write_plan([{"action": "mute", "title": "VET"},
+                         {"action": "volume", "title": "INTERNATIONAL",
+                          "volume": 50}])
+
+        response = self.runner.invoke(cli, ["run", self.plan])
+
+        self.assertEqual(response.exit_code, 0)
+        self.assertEqual(mock_urlopen.call_count, 2)
+        self.assertEqual(response.output.count("round trip"), 1)
+        self.assertIn("2 steps in 1 requests", response.output)
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_run_dry_run(self, mock_urlopen):
+        self.write_plan([{"action": "mute", "id": 3},
+                         {"action": "wait", "seconds": 1},
+                         {"action": "mute", "id": 4}])
+
+        response = self.runner.invoke(cli, ["run", self.plan, "--dry-run"])
+
+        self.assertEqual(response.exit_code, 0)
+        self.assertIn("Batch 3", response.output)
+        mock_urlopen.assert_not_called()
+
+    def test_run_invalid_plan(self):
+        self.write_plan([{"action": "explode"}])
+
+        response = self.runner.invoke(cli, ["run", self.plan])
+
+        self.assertEqual(response.exit_code, 2)
+        self.assertIn("Invalid plan", response.output)
+
+
 class TestMultiViewerForF1CommandLineInterfaceMCP(TestCase):
     def setUp(self):
         self.runner = CliRunner()
@@ -659,3 +712,94 @@ class TestMultiViewerForF1CommandLineInterfaceMCP(TestCase):
         self.assertEqual(response.exit_code, 0)
         self.assertIn("--url", response.output)
         self.assertIn("URL for MultiViewer for F1 GraphQL API endpoint", response.output)
+
+    @patch('mvf1.mcp.create_mcp_server')
+    def test_mcp_http_transport(self, mock_create):
+        response = self.runner.invoke(cli, ["mcp", "--transport", "http",
+                                            "--port", "9000",
+                                            "--rate-limit", "5"])
+
+        self.assertEqual(response.exit_code, 0)
+        self.assertEqual(mock_create.call_args[1]["rate_limit"], 5.0)
+        mock_create.return_value.run.assert_called_once_with(
+            transport="http", host="127.0.0.1", port=9000
+        )
+
+    @patch('mvf1.mcp.create_mcp_server')
+    def test_mcp_stdio_transport(self, mock_create):
+        response = self.runner.invoke(cli, ["mcp"])
+
+        self.assertEqual(response.exit_code, 0)
+        mock_create.return_value.run.assert_called_once_with()
+
+
+class TestMultiViewerForF1CommandLineInterfaceRecord(TestCase):
+    def setUp(self):
+        self.runner = CliRunner()
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive = os.path.join(self.directory.name, "race")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_record(self, mock_urlopen):
+        mock_urlopen.return_value = {
+            'data': {'f1LiveTimingState': {'LapCount': {'CurrentLap': 1}}}
+        }
+
+        response = self.runner.invoke(cli, ["record", self.archive,
+                                            "--interval", "0.01",
+                                            "--duration", "0.1",
+                                            "--compression", "gzip"])
+
+        self.assertEqual(response.exit_code, 0)
+        self.assertIn("Done.", response.output)
+        self.assertTrue(os.path.exists(os.path.join(self.archive,
+                                                    "index.json")))
+
+    def test_record_existing_archive(self):
+        os.makedirs(self.archive)
+
+        with open(os.path.join(self.archive, "index.json"), "w") as f:
+            f.write("{}")
+
+        response = self.runner.invoke(cli, ["record", self.archive])
+
+        self.assertEqual(response.exit_code, 2)
+        self.assertIn("already holds an archive", response.output)
+
+
+class TestMultiViewerForF1CommandLineInterfaceReplay(TestCase):
+    def setUp(self):
+        self.runner = CliRunner()
+
+    @patch('mvf1.replay.ReplayServer.serve_forever')
+    def test_replay(self, mock_serve):
+        with tempfile.TemporaryDirectory() as directory:
+            ArchiveWriter(directory, compression="gzip").close()
+
+            response = self.runner.invoke(cli, ["replay", directory,
+                                                "--port", "0",
+                                                "--speed", "10"])
+
+        self.assertEqual(response.exit_code, 0)
+        self.assertIn("at 10.0x on http://127.0.0.1:", response.output)
+        mock_serve.assert_called_once()
+
+    def test_replay_not_an_archive(self):
+        with tempfile.TemporaryDirectory() as directory:
+            response = self.runner.invoke(cli, ["replay", directory])
+
+        self.assertEqual(response.exit_code, 2)
+        self.assertIn("No archive found", response.output)
+
+    @patch('mvf1.mock.MockServer.serve_forever')
+    def test_mock(self, mock_serve):
+        response = self.runner.invoke(cli, ["mock", "--port", "0",
+                                            "--laps", "10",
+                                            "--error-rate", "0.1"])
+
+        self.assertEqual(response.exit_code, 0)
+        self.assertIn("10 lap race of 20 drivers at 1.0x", response.output)
+        mock_serve.assert_called_once()
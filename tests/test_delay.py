@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+from mvf1 import MultiViewerForF1
+from mvf1.delay import DelayBuffer
+from mvf1.delay import DelayedTiming
+from mvf1.replay import ReplayServer
+
+from tests.helpers import laps
+from tests.helpers import snapshot
+
+
+class TestDelayBuffer(TestCase):
+    def setUp(self):
+        self.buffer = DelayBuffer(window=10)
+
+        for second in range(5):
+            self.buffer.push(second * 1000, laps(second))
+
+    def test_state_at(self):
+        self.assertIsNone(self.buffer.state_at(-1))
+        self.assertEqual(self.buffer.state_at(0), laps(0))
+        self.assertEqual(self.buffer.state_at(2500), laps(2))
+        self.assertEqual(self.buffer.state_at(10 ** 6), laps(4))
+
+    def test_shares_unchanged_topics(self):
+        self.assertIs(self.buffer.state_at(0)["TrackStatus"],
+                      self.buffer.state_at(4000)["TrackStatus"])
+
+    def test_skips_unchanged_states(self):
+        self.buffer.push(5000, laps(4))
+
+        self.assertEqual(len(self.buffer), 5)
+
+    def test_window(self):
+        for second in range(5, 40):
+            self.buffer.push(second * 1000, laps(second))
+
+        self.assertEqual(self.buffer.oldest, 29000)
+        self.assertIsNone(self.buffer.state_at(28999))
+        self.assertEqual(self.buffer.state_at(29500), laps(29))
+        self.assertLessEqual(len(self.buffer.tracks), 2 * len(self.buffer))
+
+
+class TestDelayedTiming(TestCase):
+    def test_delay(self):
+        timing = DelayedTiming(remote=MultiViewerForF1(), delay=30)
+        clock = {"paused": True, "systemTime": 0, "trackTime": 100000,
+                 "liveTimingStartTime": 0}
+
+        for second in (60, 70, 100):
+            clock = dict(clock, trackTime=second * 1000)
+            timing.update(snapshot("clock", clock), None)
+            timing.update(snapshot("f1", laps(second)), None)
+
+        self.assertEqual(timing.position(), 70000)
+        self.assertEqual(timing.state(), laps(70))
+
+    def test_player_position(self):
+        with ReplayServer(create_lag=0, port=0) as server:
+            remote = MultiViewerForF1(server.url)
+            id = remote.player_create(1, stream_title="INTERNATIONAL")[
+                "data"]["playerCreate"]
+            remote.player_set_paused(id, True)
+            remote.player_seek_to(id, absolute=65)
+
+            timing = DelayedTiming(remote, player=id)
+
+            self.assertIsNone(timing.state())
+
+            clock = {"paused": True, "systemTime": 0,
+                     "liveTimingStartTime": 1000000}
+
+            for second in (1060, 1065, 1100):
+                clock = dict(clock, trackTime=second * 1000)
+                timing.update(snapshot("clock", clock), None)
+                timing.update(snapshot("f1", laps(second)), None)
+
+            self.assertEqual(timing.position(), 1065000)
+            self.assertEqual(timing.state(), laps(1065))
+
+    def test_requires_player_or_delay(self):
+        with self.assertRaises(ValueError):
+            DelayedTiming(MultiViewerForF1())
@@ -0,0 +1,106 @@
+from unittest import TestCase
+
+from mvf1.delta import APPEND
+from mvf1.delta import DELETED
+from mvf1.delta import DeltaLog
+from mvf1.delta import apply
+from mvf1.delta import diff
+
+
+OLD = {
+    "LapCount": {"CurrentLap": 34, "TotalLaps": 71},
+    "TrackStatus": {"Status": "1", "Message": "AllClear"},
+    "RaceControlMessages": {"Messages": [{"Message": "GREEN LIGHT"}]},
+    "TeamRadio": {"Captures": []},
+}
+
+NEW = {
+    "LapCount": {"CurrentLap": 35, "TotalLaps": 71},
+    "TrackStatus": {"Status": "4"},
+    "RaceControlMessages": {"Messages": [{"Message": "GREEN LIGHT"},
+                                         {"Message": "SAFETY CAR"}]},
+}
+
+
+class TestDiff(TestCase):
+    def test_diff(self):
+        self.assertEqual(diff(OLD, NEW), {
+            "LapCount": {"CurrentLap": 35},
+            "TrackStatus": {"Status": "4", DELETED: ["Message"]},
+            "RaceControlMessages": {
+                "Messages": {APPEND: [{"Message": "SAFETY CAR"}]}
+            },
+            DELETED: ["TeamRadio"],
+        })
+
+    def test_diff_equal(self):
+        self.assertEqual(diff(OLD, dict(OLD)), {})
+
+    def test_diff_replaced_list(self):
+        self.assertEqual(diff({"a": [1, 2]}, {"a": [2]}), {"a": [2]})
+
+    def test_apply(self):
+        self.assertEqual(apply(OLD, diff(OLD, NEW)), NEW)
+        self.assertEqual(apply(NEW, diff(NEW, OLD)), OLD)
+
+    def test_apply_shares_unchanged(self):
+        state = {"a": {"b": 1}, "c": {"d": 2}}
+        patched = apply(state, {"a": {"b": 2}})
+
+        self.assertEqual(state["a"], {"b": 1})
+        self.assertIs(patched["c"], state["c"])
+
+
+class TestDeltaLog(TestCase):
+    def setUp(self):
+        self.log = DeltaLog(maxlen=2)
+
+    def test_since_without_cursor(self):
+        self.log.append(OLD)
+        changes = self.log.since(topics=["LapCount"])
+
+        self.assertTrue(changes["reset"])
+        self.assertEqual(changes["state"], {"LapCount": OLD["LapCount"]})
+        self.assertEqual(changes["cursor"], self.log.cursor)
+
+    def test_since_cursor(self):
+        self.log.append(OLD)
+        cursor = self.log.cursor
+
+        self.assertIsNone(self.log.append(dict(OLD)))
+        self.log.append(NEW)
+        changes = self.log.since(cursor, topics=["LapCount", "TeamRadio"])
+
+        self.assertFalse(changes["reset"])
+        self.assertEqual(changes["changes"], [{
+            "version": 2,
+            "changes": {"LapCount": {"CurrentLap": 35},
+                        DELETED: ["TeamRadio"]}
+        }])
+        self.assertEqual(self.log.since(self.log.cursor)["changes"], [])
+
+    def test_since_filters_topics(self):
+        self.log.append(OLD)
+        cursor = self.log.cursor
+        self.log.append(dict(OLD, WeatherData={"AirTemp": "25"}))
+
+        self.assertEqual(self.log.since(cursor, ["LapCount"])["changes"], [])
+
+    def test_since_expired_cursor(self):
+        self.log.append(OLD)
+        cursor = self.log.cursor
+        self.log.append(NEW)
+        self.log.append(OLD)
+        self.log.append(NEW)
+
+        changes = self.log.since(cursor)
+
+        self.assertTrue(changes["reset"])
+        self.assertEqual(changes["state"], NEW)
+
+    def test_since_other_epoch(self):
+        self.log.append(OLD)
+        other = DeltaLog()
+
+        self.assertTrue(self.log.since(other.cursor)["reset"])
+        self.assertTrue(self.log.since("garbage")["reset"])
@@ -0,0 +1,148 @@
+import time
+
+from unittest import TestCase
+
+from mvf1 import MultiViewerForF1
+from mvf1 import MultiViewerForF1Error
+from mvf1.battles import BattleEvent
+from mvf1.director import Director
+from mvf1.director import Shot
+from mvf1.events import RaceEvent
+from mvf1.replay import ReplayServer
+
+
+def event(kind, number, tla=None, at=None):
+    return RaceEvent(kind, number, tla, at=time.time() if at is None else at)
+
+
+class TestDirector(TestCase):
+    def setUp(self):
+        self.server = ReplayServer(create_lag=0, port=0)
+        self.server.start()
+        self.remote = MultiViewerForF1(self.server.url)
+
+        self.remote.player_create(1, driver_number=16, x=0, y=0,
+                                  width=1280, height=720)
+        self.remote.player_create(1, stream_title="INTERNATIONAL", x=1280,
+                                  y=0, width=640, height=360)
+        self.remote.player_create(1, driver_number=1, x=1280, y=360,
+                                  width=640, height=360)
+
+        self.director = Director(self.remote, player="1", commentary="2",
+                                 dwell=5, max_switches=2, window=60)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def bounds(self, id):
+        player = self.remote.player(id)
+
+        return (player.x, player.y, player.width, player.height)
+
+    def test_swaps_open_onboard(self):
+        self.director.handle(event("pit_in", "1", "VER"))
+
+        self.assertEqual(self.director.player, "3")
+        self.assertEqual(self.bounds("3"), (0, 0, 1280, 720))
+        self.assertEqual(self.bounds("1"), (1280, 360, 640, 360))
+        self.assertEqual(self.remote.player("1").state["volume"], 0)
+        self.assertEqual(self.bounds("2"), (1280, 0, 640, 360))
+        self.assertNotEqual(self.remote.player("2").state["volume"], 0)
+
+        cut = self.director.cuts[-1]
+
+        self.assertGreaterEqual(cut["screen_latency"],
+                                cut["decision_latency"])
+        self.assertEqual(self.director.metrics()["cuts"], 1)
+
+    def test_creates_onboard(self):
+        self.director.handle(event("team_radio", "44", "HAM"))
+
+        self.assertEqual(self.director.player, "4")
+        self.assertEqual(self.remote.player("4").title, "HAM")
+        self.assertEqual(self.bounds("4"), (0, 0, 1280, 720))
+        self.assertNotIn("1", [player.id for player in self.remote.players])
+        self.assertEqual(self.remote.player("2").state["volume"], 20)
+
+    def test_requires_director_player(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            Director(self.remote, commentary="2")
+
+        with self.assertRaises(MultiViewerForF1Error):
+            Director(self.remote, player="2", commentary="2")
+
+    def test_never_cuts_commentary(self):
+        director = Director(self.remote, player="2")
+
+        with self.assertRaises(MultiViewerForF1Error):
+            director.cut(Shot("team_radio", "44", "HAM", 1, time.time()))
+
+        self.assertEqual(len(self.remote.players), 3)
+
+    def test_created_player_not_visible_yet(self):
+        self.server.players.create_lag = 60
+        self.director.dwell = 0
+        self.director.handle(event("team_radio", "44", "HAM"))
+
+        self.assertEqual(self.director.player, "4")
+        self.assertEqual(self.director.shot.number, "44")
+
+        self.director.handle(event("pit_in", "1", "VER"))
+
+        self.assertEqual(self.director.shot.number, "44")
+        self.assertEqual(len(self.director.switches), 1)
+
+        self.server.players.players["4"].ready = 0
+        self.director.handle(event("pit_in", "1", "VER"))
+
+        self.assertEqual(self.director.shot.number, "1")
+        self.assertEqual(self.director.player, "3")
+
+    def test_onboard_already_on_screen(self):
+        self.director.handle(event("pit_in", "1", "VER"))
+        results = self.director.cut(Shot("pit_in", "1", "VER", 1, time.time()))
+
+        self.assertEqual(results, [])
+        self.assertEqual(self.director.player, "3")
+        self.assertEqual(self.bounds("3"), (0, 0, 1280, 720))
+        self.assertEqual(self.remote.player("3").state["volume"],
+                         self.director.volume)
+
+    def test_dwell(self):
+        now = time.time()
+        self.director.handle(event("pit_in", "1", at=now))
+        self.director.handle(event("position_change", "44", at=now))
+
+        self.assertEqual(self.director.shot.number, "1")
+        self.assertIsNone(self.director.decide(now + 1))
+        self.assertEqual(self.director.decide(now + 6).number, "44")
+
+    def test_rate_limit(self):
+        self.director.dwell = 0
+        self.director.ttl = 120
+
+        for number in ("1", "44", "16"):
+            self.director.handle(event("position_change", number))
+
+        self.assertEqual(len(self.director.switches), 2)
+        self.assertEqual(self.director.shot.number, "44")
+        self.assertEqual(self.director.decide(time.time() + 61).number, "16")
+
+    def test_battle_outranks_and_ends(self):
+        now = time.time()
+        self.director.handle(event("position_change", "44", at=now))
+        self.director.handle(BattleEvent("start", "11", "1", 0.5, now))
+
+        self.assertEqual(self.director.decide(now + 6).kind, "battle")
+
+        self.director.handle(BattleEvent("end", "11", "1", 1.6, now))
+
+        self.assertNotIn("1", self.director.shots)
+        self.assertEqual(self.director.shot.number, "44")
+        self.assertIsNone(self.director.decide(now + 6))
+
+    def test_ignores_unranked_events(self):
+        self.director.handle(event("fastest_lap", "1"))
+        self.director.handle(RaceEvent("flag", at=time.time()))
+
+        self.assertIsNone(self.director.shot)
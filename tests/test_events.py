@@ -0,0 +1,124 @@
+import copy
+import json
+
+from unittest import TestCase
+
+from mvf1.events import EventDetector
+from mvf1.events import FASTEST_LAP
+from mvf1.events import RaceEvent
+from mvf1.poller import Snapshot
+
+
+f = open('tests/timing_state.json')
+mock_timing_state = json.load(f)
+f.close()
+
+state = mock_timing_state['data']['f1LiveTimingState']
+
+
+class TestEventDetector(TestCase):
+    def setUp(self):
+        self.detector = EventDetector()
+        self.events = []
+        self.detector.add_listener(self.events.append)
+        self.detector.ingest(state)
+        self.state = copy.deepcopy(state)
+        self.lines = self.state["TimingData"]["Lines"]
+
+    def test_baseline(self):
+        self.assertEqual(self.events, [])
+        self.assertAlmostEqual(self.detector.fastest, 80.812)
+
+    def test_pit(self):
+        self.lines["44"]["InPit"] = False
+        self.lines["11"]["InPit"] = True
+
+        self.assertEqual(self.detector.ingest(self.state), [
+            RaceEvent("pit_in", "11", data={"stops": 1}),
+            RaceEvent("pit_out", "44", data={"stops": 2}),
+        ])
+        self.assertEqual(self.events[1].tla, "HAM")
+        self.assertEqual(self.events[1].lap, 33)
+
+    def test_position_change(self):
+        self.lines["1"]["Position"], self.lines["11"]["Position"] = "1", "2"
+
+        self.assertEqual(self.detector.ingest(self.state), [
+            RaceEvent("position_change", "11",
+                      data={"previous": 1, "position": 2}),
+            RaceEvent("position_change", "1",
+                      data={"previous": 2, "position": 1}),
+        ])
+
+    def test_flag(self):
+        self.state["TrackStatus"] = {"Status": "4", "Message": "SCDeployed"}
+
+        self.assertEqual(self.detector.ingest(self.state), [
+            RaceEvent("flag", data={"flag": "SC", "status": "4",
+                                    "previous": "GREEN"}),
+        ])
+
+    def test_fastest_lap(self):
+        self.lines["44"]["BestLapTime"] = {"Value": "1:20.500", "Lap": 34}
+        self.lines["11"]["BestLapTime"] = {"Value": "1:20.900", "Lap": 34}
+
+        events = self.detector.ingest(self.state)
+
+        self.assertEqual([event.kind for event in events], [FASTEST_LAP])
+        self.assertEqual(events[0].data["time"], "1:20.500")
+
+    def test_retirement(self):
+        self.lines["44"]["Retired"] = True
+
+        self.assertEqual(self.detector.ingest(self.state)[0],
+                         RaceEvent("retirement", "44",
+                                   data={"position": 3}))
+
+    def test_penalty_and_incident(self):
+        messages = self.state["RaceControlMessages"]["Messages"]
+        messages.append({"Lap": 34, "Category": "Other",
+                         "Message": "5 SECOND TIME PENALTY FOR CAR 44 (HAM)"
+                                    " - CAUSING A COLLISION"})
+        messages.append({"Lap": 34, "Category": "Other",
+                         "Message": "TURN 1 INCIDENT INVOLVING CARS 1 (VER) "
+                                    "AND 11 (PER) NOTED"})
+        messages.append({"Lap": 34, "Category": "Other",
+                         "Message": "DRS ENABLED"})
+
+        events = self.detector.ingest(self.state)
+
+        self.assertEqual([(event.kind, event.tla) for event in events],
+                         [("penalty", "HAM"), ("incident", "VER")])
+        self.assertEqual(self.detector.ingest(self.state), [])
+
+    def test_team_radio(self):
+        self.state["TeamRadio"] = {"Captures": [
+            {"Utc": "2023-10-29T20:41:30", "RacingNumber": "1",
+             "Path": "TeamRadio/MAXVER01_1_20231029_154130.mp3"},
+        ]}
+
+        events = self.detector.ingest(self.state)
+
+        self.assertEqual([(event.kind, event.tla) for event in events],
+                         [("team_radio", "VER")])
+        self.assertEqual(self.detector.ingest(self.state), [])
+
+    def test_listener_kind(self):
+        pits = []
+        self.detector.add_listener(pits.append, kind="pit_in")
+        self.lines["11"]["InPit"] = True
+        self.state["TrackStatus"] = {"Status": "2"}
+
+        self.detector.ingest(self.state)
+
+        self.assertEqual([event.kind for event in pits], ["pit_in"])
+        self.assertEqual(len(self.events), 2)
+
+        with self.assertRaises(ValueError):
+            self.detector.add_listener(pits.append, kind="lunch")
+
+    def test_update(self):
+        detector = EventDetector()
+        detector.update(Snapshot("f1", 1, mock_timing_state, 0.0), None)
+
+        self.assertEqual(detector.status, "1")
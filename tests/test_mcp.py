@@ -1,14 +1,22 @@
+import asyncio
 import json
+import time
 import pytest
 from unittest.mock import patch
 
 from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
+from fastmcp.utilities.tests import run_server_async
+from mvf1.mcp import create_mcp_server
 from mvf1.mcp import mcp
 
 
 with open('tests/players.json') as f:
     mock_players = json.load(f)
 
+with open('tests/timing_state.json') as f:
+    mock_timing_state = json.load(f)
+
 
 def configure_mock_response(mock_urlopen, payload):
     if isinstance(payload, Exception):
@@ -315,3 +323,331 @@ async def test_player_get_content_id_no_players(mock_urlopen):
         response = await client.call_tool("player_get_content_id")
         mock_urlopen.assert_called_once()
         assert 'No players' in str(response)
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_tools_overlap(mock_urlopen):
+    def slow_response(*args, **kwargs):
+        time.sleep(0.2)
+        return {'data': {'version': '1.12.6'}}
+
+    mock_urlopen.side_effect = slow_response
+    server = create_mcp_server()
+
+    async with Client(server) as client:
+        start = time.monotonic()
+        await asyncio.gather(client.call_tool("version"),
+                             client.call_tool("system_info"),
+                             client.call_tool("f1_live_timing_clock"))
+        elapsed = time.monotonic() - start
+
+    assert mock_urlopen.call_count == 3
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_tool_limits(mock_urlopen):
+    def slow_response(*args, **kwargs):
+        time.sleep(0.2)
+        return {'data': {'version': '1.12.6'}}
+
+    mock_urlopen.side_effect = slow_response
+    server = create_mcp_server(tool_limits={"version": 1})
+
+    async with Client(server) as client:
+        start = time.monotonic()
+        await asyncio.gather(client.call_tool("version"),
+                             client.call_tool("version"))
+        elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.4
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_f1_live_timing_state_from_poller(mock_urlopen):
+    mock_urlopen.return_value = {'data': {'f1LiveTimingState':
+                                          {'LapCount': {'CurrentLap': 3}}}}
+    server = create_mcp_server(poll_interval=60)
+
+    async with Client(server) as client:
+        deadline = time.monotonic() + 2
+
+        response = await client.call_tool("f1_live_timing_state")
+
+        # The first call may beat the first poll to the snapshot.
+        while ("snapshot" not in str(response)
+               and time.monotonic() < deadline):
+            await asyncio.sleep(0.01)
+            response = await client.call_tool("f1_live_timing_state")
+
+        calls = mock_urlopen.call_count
+        response = await client.call_tool("f1_live_timing_state")
+
+    assert mock_urlopen.call_count == calls
+    assert all("fiawec" not in str(call[0][0])
+               for call in mock_urlopen.call_args_list)
+    assert "CurrentLap" in str(response)
+    assert "snapshot" in str(response)
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_f1_standings(mock_urlopen):
+    async with Client(mcp) as client:
+        configure_mock_response(mock_urlopen, mock_timing_state)
+        response = await client.call_tool("f1_standings")
+        mock_urlopen.assert_called_once()
+        query = str(mock_urlopen.call_args[0][0])
+        assert "TimingData" in query
+        assert "CarData" not in query
+        assert "PER" in str(response)
+        assert "Lines" not in str(response)
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_f1_track_status(mock_urlopen):
+    async with Client(mcp) as client:
+        configure_mock_response(mock_urlopen, mock_timing_state)
+        response = await client.call_tool("f1_track_status")
+        assert "GREEN" in str(response)
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_f1_race_control_messages(mock_urlopen):
+    async with Client(mcp) as client:
+        configure_mock_response(mock_urlopen, mock_timing_state)
+        response = await client.call_tool("f1_race_control_messages",
+                                          {"limit": 1})
+        assert "TRACK LIMITS" in str(response)
+        assert "GREEN LIGHT" not in str(response)
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_f1_weather_tyres_and_pit_stops(mock_urlopen):
+    async with Client(mcp) as client:
+        configure_mock_response(mock_urlopen, mock_timing_state)
+        weather = await client.call_tool("f1_weather")
+        tyres = await client.call_tool("f1_tyre_stints")
+        pit_stops = await client.call_tool("f1_pit_stops")
+        assert "43.1" in str(weather)
+        assert "HARD" in str(tyres)
+        assert "21.874" in str(pit_stops)
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_timing_changes_since(mock_urlopen):
+    server = create_mcp_server()
+
+    async with Client(server) as client:
+        configure_mock_response(mock_urlopen, mock_timing_state)
+        first = (await client.call_tool("timing_changes_since",
+                                        {"topics": ["LapCount"]})).data
+        assert first["reset"] is True
+        assert first["state"] == {"LapCount": {"CurrentLap": 34,
+                                               "TotalLaps": 71}}
+
+        state = json.loads(json.dumps(mock_timing_state))
+        state["data"]["f1LiveTimingState"]["LapCount"]["CurrentLap"] = 35
+        configure_mock_response(mock_urlopen, state)
+        second = (await client.call_tool("timing_changes_since",
+                                         {"cursor": first["cursor"],
+                                          "topics": ["LapCount",
+                                                     "WeatherData"]})).data
+        assert second["reset"] is False
+        assert second["cursor"] != first["cursor"]
+        assert second["changes"][0]["changes"] == {
+            "LapCount": {"CurrentLap": 35}
+        }
+
+        third = (await client.call_tool("timing_changes_since",
+                                        {"cursor": second["cursor"]})).data
+        assert third["changes"] == []
+        assert third["cursor"] == second["cursor"]
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_server_metrics(mock_urlopen):
+    server = create_mcp_server()
+
+    async with Client(server) as client:
+        configure_mock_response(mock_urlopen, {'data': {'version': {}}})
+        await client.call_tool("version")
+        await client.call_tool("version")
+        metrics = (await client.call_tool("server_metrics")).data
+
+    assert metrics["sessions"] == 1
+    assert metrics["tool_calls"] == 3
+    assert metrics["per_session"]["local"]["errors"] == 0
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_rate_limit(mock_urlopen):
+    server = create_mcp_server(rate_limit=0.01, burst=2)
+
+    async with Client(server) as client:
+        configure_mock_response(mock_urlopen, {'data': {'version': {}}})
+        await client.call_tool("version")
+        await client.call_tool("version")
+
+        with pytest.raises(Exception, match="Rate limit exceeded"):
+            await client.call_tool("version")
+
+    assert mock_urlopen.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_http_transport_concurrent_clients(mock_urlopen):
+    configure_mock_response(mock_urlopen, {'data': {'version': {}}})
+    server = create_mcp_server()
+
+    async with run_server_async(server) as url:
+        async with Client(StreamableHttpTransport(url)) as first, \
+                Client(StreamableHttpTransport(url)) as second:
+            await asyncio.gather(*(client.call_tool("version")
+                                   for client in (first, second) * 3))
+            metrics = (await first.call_tool("server_metrics")).data
+
+    assert mock_urlopen.call_count == 6
+    assert metrics["tool_calls"] == 7
+    assert metrics["rate_limited"] == 0
+
+
+def track_status(status):
+    return {'data': {'f1LiveTimingState': {'TrackStatus': {'Status': status},
+                                           'LapCount': {'CurrentLap': 1}}}}
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_live_timing_resources(mock_urlopen):
+    server = create_mcp_server()
+
+    async with Client(server) as client:
+        configure_mock_response(mock_urlopen, mock_timing_state)
+        resources = await client.list_resources()
+        contents = await client.read_resource(
+            "mvf1://f1/live-timing/RaceControlMessages"
+        )
+
+    assert {str(resource.uri) for resource in resources} == {
+        "mvf1://f1/live-timing/TrackStatus",
+        "mvf1://f1/live-timing/RaceControlMessages",
+        "mvf1://f1/live-timing/TimingData",
+        "mvf1://f1/live-timing/SessionStatus",
+    }
+    assert "TRACK LIMITS" in contents[0].text
+    assert "RaceControlMessages" in str(mock_urlopen.call_args[0][0])
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_live_timing_resource_subscription(mock_urlopen):
+    listen = pytest.importorskip("mcp.client.subscriptions").listen
+    mock_urlopen.return_value = track_status("1")
+    server = create_mcp_server(poll_interval=0.01)
+
+    async with Client(server) as client:
+        async with listen(client.session, resource_subscriptions=[
+            "mvf1://f1/live-timing/TrackStatus",
+            "mvf1://f1/live-timing/SessionStatus",
+        ]) as subscription:
+            mock_urlopen.return_value = track_status("4")
+
+            async def updated():
+                async for event in subscription:
+                    assert event.uri == "mvf1://f1/live-timing/TrackStatus"
+                    contents = await client.read_resource(event.uri)
+
+                    if json.loads(contents[0].text) == {"Status": "4"}:
+                        return True
+
+            assert await asyncio.wait_for(updated(), 2)
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_subscription_starts_poller(mock_urlopen):
+    listen = pytest.importorskip("mcp.client.subscriptions").listen
+    mock_urlopen.return_value = track_status("1")
+    server = create_mcp_server()
+
+    async with Client(server) as client:
+        await asyncio.sleep(0.05)
+        assert mock_urlopen.call_count == 0
+
+        async with listen(client.session, resource_subscriptions=[
+            "mvf1://f1/live-timing/TrackStatus"
+        ]):
+            deadline = time.monotonic() + 2
+
+            while not mock_urlopen.called and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+
+    assert mock_urlopen.called
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_players_apply(mock_urlopen):
+    mock_urlopen.side_effect = [
+        mock_players,
+        {'data': {'m0': True, 'm1': 30.0, 'm2': True}},
+    ]
+
+    async with Client(mcp) as client:
+        response = await client.call_tool("players_apply", {"actions": [
+            {"action": "set-bounds", "id": 3, "x": 0, "y": 0,
+             "width": 384, "height": 216},
+            {"action": "volume", "title": "VET", "volume": 30},
+            {"action": "mute", "id": 3, "muted": True},
+        ]})
+
+    report = json.loads(response.content[0].text)
+
+    assert mock_urlopen.call_count == 2
+    assert [entry["batch"] for entry in report] == [1, 1, 1]
+    assert [entry["error"] for entry in report] == [None, None, None]
+    assert report[1]["id"] == "4"
+    assert report[1]["result"] == 30.0
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_players_apply_invalid_action(mock_urlopen):
+    async with Client(mcp) as client:
+        with pytest.raises(Exception, match="unknown action"):
+            await client.call_tool("players_apply",
+                                   {"actions": [{"action": "explode",
+                                                 "id": 3}]})
+
+    mock_urlopen.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+async def test_players_fields(mock_urlopen):
+    async with Client(mcp) as client:
+        configure_mock_response(mock_urlopen, mock_players)
+        response = await client.call_tool("players",
+                                          {"fields": ["bounds",
+                                                      "state.paused",
+                                                      "streamData.title"]})
+        mock_urlopen.assert_called_once()
+
+    players = json.loads(response.content[0].text)
+
+    assert players[0]["id"] == "3"
+    assert players[0]["bounds"]["x"] == 60
+    assert players[1]["streamData"]["title"] == "VET"
+    assert "paused" in str(mock_urlopen.call_args[0][0])
+    assert "muted" not in str(mock_urlopen.call_args[0][0])
@@ -0,0 +1,156 @@
+import time
+
+from unittest import TestCase
+
+from mvf1 import MultiViewerForF1
+from mvf1 import MultiViewerForF1Error
+from mvf1.mock import MockServer
+from mvf1.mock import SyntheticTiming
+from mvf1.mock import format_lap
+from mvf1.model import RaceModel
+from mvf1.poller import LiveTimingPoller
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSyntheticTiming(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.timing = SyntheticTiming(laps=10, lap_time=90.0,
+                                      clock=self.clock)
+
+    def test_format_lap(self):
+        self.assertEqual(format_lap(81.101), "1:21.101")
+        self.assertEqual(format_lap(27.0), "27.000")
+
+    def test_race(self):
+        self.clock.now += 300
+        model = RaceModel()
+        model.ingest(self.timing.state("f1"))
+
+        self.assertEqual(len(model.lines), 20)
+        self.assertEqual([line.position for line in model.order],
+                         list(range(1, 21)))
+        self.assertEqual(model.leader.tla, "VER")
+        self.assertEqual(model.leader.gap, "LAP 4")
+        self.assertEqual(model.leader.laps, 3)
+        self.assertGreater(model.order[-1].gap_seconds, 0)
+
+    def test_deterministic(self):
+        other = SyntheticTiming(laps=10, lap_time=90.0, clock=self.clock)
+
+        self.assertEqual(self.timing.f1_state(600.0), other.f1_state(600.0))
+        self.assertIsNone(self.timing.state("fiawec"))
+
+    def test_clock_and_finish(self):
+        self.clock.now += 60
+        clock = self.timing.live_timing_clock()
+
+        self.assertFalse(clock["paused"])
+        self.assertEqual(clock["trackTime"] - clock["liveTimingStartTime"],
+                         60000)
+
+        self.clock.now += 10 ** 4
+        state = self.timing.state("f1")
+
+        self.assertTrue(self.timing.live_timing_clock()["paused"])
+        self.assertEqual(state["SessionStatus"]["Status"], "Finished")
+        self.assertEqual(state["LapCount"]["CurrentLap"], 10)
+
+    def test_extra_drivers(self):
+        timing = SyntheticTiming(drivers=30, clock=self.clock)
+
+        self.assertEqual(len(timing.f1_state(0.0)["TimingData"]["Lines"]),
+                         30)
+
+
+class TestMockServer(TestCase):
+    def test_mutations(self):
+        with MockServer() as server:
+            remote = MultiViewerForF1(server.url)
+            id = remote.player_create(1, stream_title="INTERNATIONAL")[
+                "data"]["playerCreate"]
+            other = remote.player_create(1, driver_tla="VER")[
+                "data"]["playerCreate"]
+
+            remote.player_set_bounds(id, x=10, width=640)
+            remote.player_set_volume(id, 40)
+            remote.player_set_paused(id, True)
+            remote.player_set_muted(id, True)
+            remote.player_set_fullscreen(id, True)
+            remote.player_set_always_on_top(id, True)
+            remote.player_set_speedometer_visibility(other, False)
+            remote.player_set_driver_header_mode(other, "NONE")
+            remote.player_seek_to(id, absolute=120)
+            remote.player_sync(id)
+
+            player = remote.player(id)
+
+            self.assertEqual((player.x, player.width), (10, 640))
+            self.assertEqual(player.state["volume"], 40)
+            self.assertTrue(player.state["paused"])
+            self.assertTrue(player.state["muted"])
+            self.assertTrue(player.fullscreen)
+            self.assertTrue(player.always_on_top)
+            self.assertEqual(player.state["currentTime"], 120)
+            self.assertEqual(remote.player(other).driver_data["tla"], "VER")
+            self.assertGreaterEqual(
+                remote.player(other).state["currentTime"], 120
+            )
+
+            remote.player_delete(other)
+
+            self.assertEqual([player.id for player in remote.players], [id])
+
+    def test_timing(self):
+        with MockServer() as server:
+            poller = LiveTimingPoller(MultiViewerForF1(server.url),
+                                      series=("f1", "clock"))
+            changed = poller.poll_once()
+
+        self.assertEqual([snapshot.series for snapshot in changed],
+                         ["f1", "clock"])
+        self.assertEqual(server.requests, 2)
+
+    def test_latency(self):
+        with MockServer(latency=0.1) as server:
+            started = time.monotonic()
+            MultiViewerForF1(server.url).version
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+
+    def test_error_injection(self):
+        with MockServer(error_rate=1.0) as server:
+            with self.assertRaises(MultiViewerForF1Error):
+                MultiViewerForF1(server.url).players
+
+        self.assertEqual(server.errors, 1)
+
+    def test_http_error_injection(self):
+        with MockServer(http_error_rate=1.0) as server:
+            with self.assertRaises(MultiViewerForF1Error):
+                MultiViewerForF1(server.url).players
+
+    def test_seeded_error_rate(self):
+        outcomes = []
+
+        for _ in range(2):
+            with MockServer(error_rate=0.5, seed=7) as server:
+                remote = MultiViewerForF1(server.url)
+
+                for _ in range(10):
+                    try:
+                        remote.version
+                        outcomes.append(True)
+                    except MultiViewerForF1Error:
+                        outcomes.append(False)
+
+        self.assertEqual(outcomes[:10], outcomes[10:])
+        self.assertIn(True, outcomes)
+        self.assertIn(False, outcomes)
@@ -0,0 +1,102 @@
+import copy
+import json
+
+from unittest import TestCase
+
+from mvf1.model import RaceModel
+from mvf1.model import gap_seconds
+from mvf1.model import lap_seconds
+from mvf1.poller import Snapshot
+
+
+f = open('tests/timing_state.json')
+mock_timing_state = json.load(f)
+f.close()
+
+state = mock_timing_state['data']['f1LiveTimingState']
+
+
+class TestParsing(TestCase):
+    def test_lap_seconds(self):
+        self.assertAlmostEqual(lap_seconds("1:21.456"), 81.456)
+        self.assertAlmostEqual(lap_seconds("26.101"), 26.101)
+        self.assertIsNone(lap_seconds(""))
+        self.assertIsNone(lap_seconds("DNF"))
+
+    def test_gap_seconds(self):
+        self.assertAlmostEqual(gap_seconds("+0.812"), 0.812)
+        self.assertEqual(gap_seconds("LAP 34"), 0.0)
+        self.assertIsNone(gap_seconds("1 L"))
+
+
+class TestRaceModel(TestCase):
+    def setUp(self):
+        self.model = RaceModel()
+        self.model.ingest(state)
+
+    def test_ingest(self):
+        self.assertEqual([line.tla for line in self.model],
+                         ["PER", "VER", "HAM", "LEC"])
+
+        ver = self.model["VER"]
+
+        self.assertIs(self.model.driver(1), ver)
+        self.assertEqual(ver.position, 2)
+        self.assertAlmostEqual(ver.interval_seconds, 0.812)
+        self.assertTrue(ver.catching)
+        self.assertAlmostEqual(ver.best_lap.seconds, 80.812)
+        self.assertEqual(ver.best_lap.lap, 30)
+        self.assertTrue(ver.sectors[2].overall_fastest)
+        self.assertEqual(ver.sectors[0].segments, [2051, 2049])
+        self.assertTrue(self.model["HAM"].in_pit)
+        self.assertTrue(self.model["LEC"].retired)
+        self.assertIsNone(self.model["LEC"].gap_seconds)
+        self.assertIs(self.model.fastest_lap, ver)
+
+    def test_ingest_incremental(self):
+        new = copy.deepcopy(state)
+        lines = new["TimingData"]["Lines"]
+        lines["1"].update(Position="1", GapToLeader="LAP 35")
+        lines["11"].update(Position="2", GapToLeader="+0.3")
+        lines["1"]["Sectors"][0]["Segments"].append({"Status": 2049})
+
+        patch = self.model.ingest(new)
+
+        self.assertEqual(set(patch["TimingData"]["Lines"]), {"1", "11"})
+        self.assertEqual(self.model.leader.tla, "VER")
+        self.assertAlmostEqual(self.model["PER"].gap_seconds, 0.3)
+        self.assertEqual(self.model["VER"].sectors[0].segments,
+                         [2051, 2049, 2049])
+        self.assertEqual(self.model.ingest(new), {})
+
+    def test_apply_index_keyed_patch(self):
+        self.model.apply({"TimingData": {"Lines": {"44": {
+            "InPit": False, "PitOut": True, "NumberOfPitStops": 3,
+            "Sectors": {"2": {"Value": "27.400"}},
+        }}}})
+
+        ham = self.model["HAM"]
+
+        self.assertTrue(ham.pit_out)
+        self.assertEqual(ham.pit_stops, 3)
+        self.assertAlmostEqual(ham.sectors[2].seconds, 27.4)
+
+    def test_driver_removed(self):
+        new = copy.deepcopy(state)
+        del new["TimingData"]["Lines"]["16"]
+        self.model.ingest(new)
+
+        self.assertIsNone(self.model.driver("16"))
+        self.assertEqual(len(self.model), 3)
+
+    def test_unknown_driver(self):
+        self.assertIsNone(self.model.driver("ALO"))
+
+        with self.assertRaises(KeyError):
+            self.model["ALO"]
+
+    def test_update(self):
+        model = RaceModel()
+        model.update(Snapshot("f1", 1, mock_timing_state, 0.0), None)
+
+        self.assertEqual(model.leader.tla, "PER")
@@ -1,4 +1,6 @@
 import json
+import sys
+import threading
 from copy import deepcopy
 
 from unittest import TestCase
@@ -6,6 +8,9 @@ from unittest.mock import patch
 
 from mvf1 import MultiViewerForF1
 from mvf1 import MultiViewerForF1Error
+from mvf1 import Player
+from mvf1 import PlayerIndex
+from mvf1.replay import ReplayServer
 
 from mvf1.mvf1_schema import mvf1_schema as schema
 
@@ -94,6 +99,23 @@ class TestMultiViewerForF1(TestCase):
 
         self.assertIn("liveTimingState", str(response))
 
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_f1_live_timing_topics(self, mock_urlopen):
+        configure_mock_response(mock_urlopen,
+                                {'data': {'f1LiveTimingState':
+                                          {'TrackStatus': None}}})
+
+        self.remote.f1_live_timing_topics(["TrackStatus"])
+
+        query = str(mock_urlopen.call_args[0][0])
+
+        self.assertIn("TrackStatus", query)
+        self.assertNotIn("CarData", query)
+
+    def test_f1_live_timing_topics_unknown(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            self.remote.f1_live_timing_topics(["Gossip"])
+
     @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
     def test_players(self, mock_urlopen):
         configure_mock_response(mock_urlopen,
@@ -106,6 +128,29 @@ class TestMultiViewerForF1(TestCase):
         self.assertEqual(len(response), 2)
         self.assertEqual(response[0].title, "INTERNATIONAL")
 
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_players_data(self, mock_urlopen):
+        configure_mock_response(mock_urlopen,
+                                mock_players)
+
+        response = self.remote.players_data(["bounds", "state.volume",
+                                             "driverData.tla"])
+        query = str(mock_urlopen.call_args[0][0])
+
+        self.assertEqual(response[0]["bounds"]["width"], 720)
+        self.assertIn("width", query)
+        self.assertIn("volume", query)
+        self.assertIn("tla", query)
+        self.assertNotIn("paused", query)
+        self.assertNotIn("streamData", query)
+
+    def test_players_data_unknown_field(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            self.remote.players_data(["colour"])
+
+        with self.assertRaises(MultiViewerForF1Error):
+            self.remote.players_data(["state.colour"])
+
     @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
     def test_system_info(self, mock_urlopen):
         configure_mock_response(mock_urlopen,
@@ -261,6 +306,183 @@ class TestMultiViewerForF1(TestCase):
             self.remote.player_set_driver_header_mode("wat?")
 
 
+class TestPlayerIndex(TestCase):
+    def setUp(self):
+        self.remote = MultiViewerForF1()
+        self.index = PlayerIndex()
+        self.index.replace([Player(player_data, remote=self.remote)
+                            for player_data in mock_players['data']['players']])
+
+    def test_find(self):
+        self.assertEqual(self.index.find(title="INTERNATIONAL").id, "3")
+        self.assertEqual(self.index.find(driver_tla="VET").id, "4")
+        self.assertEqual(self.index.find(driver_number=5).id, "4")
+        self.assertEqual(self.index.find(type="OBC").id, "4")
+        self.assertEqual(len(self.index.find_all(content_id=1000001067)), 2)
+        self.assertEqual(self.index.find(session_key="5442",
+                                         type="ADDITIONAL").id, "3")
+        self.assertIsNone(self.index.find(title="NOPE"))
+
+    def test_replace_is_atomic(self):
+        players = list(self.index)
+        stopped = threading.Event()
+        interval = sys.getswitchinterval()
+        # Switch threads often so lookups land in the middle of replaces.
+        sys.setswitchinterval(1e-6)
+
+        def replace():
+            while not stopped.is_set():
+                self.index.replace(players)
+
+        thread = threading.Thread(target=replace)
+        thread.start()
+
+        try:
+            missing = sum(self.index.find(title="INTERNATIONAL") is None
+                          for _ in range(5000))
+        finally:
+            stopped.set()
+            thread.join()
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(missing, 0)
+
+    def test_find_unknown_key(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            self.index.find(colour="red")
+
+    def test_apply(self):
+        self.index.apply("player_set_volume", 4, 30.0)
+        self.index.apply("player_set_bounds", 4, {"x": 0, "y": 0,
+                                                  "width": 640,
+                                                  "height": 360})
+        self.index.apply("player_set_fullscreen", "4", True)
+
+        player = self.index.get(4)
+
+        self.assertEqual(player.state["volume"], 30.0)
+        self.assertEqual(player.width, 640)
+        self.assertTrue(player.fullscreen)
+
+    def test_apply_delete(self):
+        self.index.apply("player_delete", 3, True)
+
+        self.assertNotIn(3, self.index)
+        self.assertIsNone(self.index.find(title="INTERNATIONAL"))
+
+    def test_apply_create_marks_stale(self):
+        self.index.apply("player_create", None, "9")
+
+        self.assertIsNone(self.index.age)
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_remote_lookup_within_ttl(self, mock_urlopen):
+        configure_mock_response(mock_urlopen, mock_players)
+
+        remote = MultiViewerForF1(cache_ttl=60)
+
+        self.assertEqual(remote.find_player(title="VET").id, "4")
+        self.assertEqual(remote.find_player(driver_tla="VET").id, "4")
+
+        mock_urlopen.assert_called_once()
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_remote_lookup_default_ttl(self, mock_urlopen):
+        configure_mock_response(mock_urlopen, mock_players)
+
+        remote = MultiViewerForF1()
+        remote.find_player(title="VET")
+        remote.find_player(driver_tla="VET")
+
+        mock_urlopen.assert_called_once()
+
+        remote = MultiViewerForF1(cache_ttl=0)
+        remote.find_player(title="VET")
+        remote.find_player(driver_tla="VET")
+
+        self.assertEqual(mock_urlopen.call_count, 3)
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_remote_mutation_updates_index(self, mock_urlopen):
+        mock_urlopen.side_effect = [
+            mock_players,
+            {'data': {'playerDelete': True}},
+        ]
+
+        remote = MultiViewerForF1(cache_ttl=60)
+        remote.find_player(title="VET").delete()
+
+        self.assertIsNone(remote.find_player(title="VET"))
+        self.assertEqual(mock_urlopen.call_count, 2)
+
+
+class TestMutationBatch(TestCase):
+    def setUp(self):
+        self.remote = MultiViewerForF1()
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_execute(self, mock_urlopen):
+        configure_mock_response(mock_urlopen,
+                                {'data': {'m0': True, 'm1': 20.0,
+                                          'm2': {'x': 0, 'y': 0,
+                                                 'width': 640,
+                                                 'height': 480}}})
+
+        batch = self.remote.batch()
+        batch.player_set_muted(3, muted=True)
+        batch.player_set_volume(4, volume=20)
+        batch.player_set_bounds(4, x=0, y=0, width=640, height=480)
+
+        results = batch.execute()
+
+        mock_urlopen.assert_called_once()
+        self.assertIn('m1: playerSetVolume(id: "4"',
+                      str(mock_urlopen.call_args[0][0]))
+        self.assertEqual([result["result"] for result in results][:2],
+                         [True, 20.0])
+        self.assertEqual(results[2]["mutation"], "player_set_bounds")
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_execute_empty(self, mock_urlopen):
+        self.assertEqual(self.remote.batch().execute(), [])
+        mock_urlopen.assert_not_called()
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_execute_request_error(self, mock_urlopen):
+        configure_mock_response(mock_urlopen,
+                                {'errors': [{'message': 'Whoopsie'}]})
+
+        batch = self.remote.batch()
+        batch.player_sync(3)
+
+        with self.assertRaises(MultiViewerForF1Error):
+            batch.execute()
+
+    def test_execute_fails_midway(self):
+        server = ReplayServer(create_lag=0, port=0)
+        server.start()
+        self.addCleanup(server.stop)
+        remote = MultiViewerForF1(server.url)
+        id = server.players.create({"contentId": 1, "streamTitle": "VER"})
+        remote.player_index()
+
+        batch = remote.batch()
+        batch.player_set_volume(id, 10)
+        batch.player_set_volume(99, 20)
+        batch.player_set_volume(id, 30)
+
+        results = batch.execute()
+
+        self.assertEqual([result["applied"] for result in results],
+                         [True, False, False])
+        self.assertEqual([result["error"] for result in results][:2],
+                         [None, "Player 99 not found"])
+        self.assertIn("Not applied", results[2]["error"])
+        self.assertIsNone(results[0]["result"])
+        self.assertIsNone(remote.index.age)
+        self.assertEqual(remote.player_index().get(id).state["volume"], 10)
+
+
 class TestPlayer(TestCase):
     @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
     def setUp(self, mock_urlopen):
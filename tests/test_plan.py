@@ -0,0 +1,164 @@
+import json
+import os
+import tempfile
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from mvf1 import MultiViewerForF1
+from mvf1 import MultiViewerForF1Error
+from mvf1.plan import Plan
+from mvf1.plan import PlanRunner
+
+
+f = open('tests/players.json')
+mock_players = json.load(f)
+f.close()
+
+
+class TestPlan(TestCase):
+    def test_from_data_list(self):
+        plan = Plan.from_data([{"action": "volume", "title": "VET",
+                                "volume": 20}])
+
+        self.assertEqual(len(plan.steps), 1)
+        self.assertEqual(plan.steps[0].mutation, "player_set_volume")
+        self.assertEqual(plan.settle, 0.8)
+
+    def test_from_data_mapping(self):
+        plan = Plan.from_data({"settle": 1.5,
+                               "steps": [{"action": "sync", "id": 3}]})
+
+        self.assertEqual(plan.settle, 1.5)
+        self.assertEqual(plan.steps[0].id, 3)
+
+    def test_unknown_action(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            Plan.from_data([{"action": "explode", "id": 3}])
+
+    def test_unknown_parameter(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            Plan.from_data([{"action": "volume", "id": 3, "loudness": 11}])
+
+    def test_missing_target(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            Plan.from_data([{"action": "mute"}])
+
+    def test_load_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "plan.json")
+
+            with open(path, "w") as f:
+                json.dump([{"action": "mute", "title": "VET"}], f)
+
+            plan = Plan.load(path)
+
+        self.assertEqual(plan.steps[0].title, "VET")
+
+    def test_load_yaml(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "plan.yaml")
+
+            with open(path, "w") as f:
+                f.write("steps:\n"
+                        "  - action: pause\n"
+                        "    title: INTERNATIONAL\n")
+
+            plan = Plan.load(path)
+
+        self.assertEqual(plan.steps[0].action, "pause")
+
+
+class TestPlanRunner(TestCase):
+    def setUp(self):
+        self.sleeps = []
+        self.runner = PlanRunner(MultiViewerForF1(), sleep=self.sleeps.append)
+
+    def test_compile_independent_steps_share_batch(self):
+        plan = Plan.from_data([
+            {"action": "volume", "title": "INTERNATIONAL", "volume": 80},
+            {"action": "mute", "title": "VET", "muted": True},
+            {"action": "set-bounds", "id": 4, "x": 0, "y": 0},
+        ])
+
+        batches = self.runner.compile(plan)
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0].steps), 3)
+
+    def test_compile_splits_on_created_player(self):
+        plan = Plan.from_data([
+            {"action": "create", "content_id": 1, "stream_title": "DATA"},
+            {"action": "mute", "title": "VET"},
+            {"action": "volume", "title": "DATA", "volume": 10},
+        ])
+
+        batches = self.runner.compile(plan)
+
+        self.assertEqual(len(batches), 2)
+        self.assertTrue(batches[1].settle)
+
+    def test_compile_splits_on_wait(self):
+        plan = Plan.from_data([
+            {"action": "mute", "id": 3},
+            {"action": "wait", "seconds": 2},
+            {"action": "mute", "id": 4},
+        ])
+
+        batches = self.runner.compile(plan)
+
+        self.assertEqual(len(batches), 3)
+        self.assertEqual(batches[1].wait, 2.0)
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_run(self, mock_urlopen):
+        mock_urlopen.side_effect = [
+            mock_players,
+            {'data': {'m0': '9', 'm1': True}},
+            {'data': {'m0': 10.0}},
+        ]
+
+        plan = Plan.from_data([
+            {"action": "create", "stream_title": "DATA"},
+            {"action": "mute", "title": "VET"},
+            {"action": "volume", "title": "DATA", "volume": 10},
+        ])
+
+        report = self.runner.run(plan)
+
+        self.assertEqual(mock_urlopen.call_count, 3)
+        self.assertEqual(report[0]["id"], "9")
+        self.assertEqual(report[1]["id"], "4")
+        self.assertEqual(report[2]["id"], "9")
+        self.assertEqual(report[2]["batch"], 2)
+        self.assertIsNone(report[2]["error"])
+        self.assertEqual(len(self.sleeps), 1)
+
+        create = mock_urlopen.call_args_list[1][0][0]
+        self.assertIn('contentId: "1000001067"', str(create))
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_run_unknown_title(self, mock_urlopen):
+        mock_urlopen.return_value = mock_players
+
+        plan = Plan.from_data([{"action": "mute", "title": "NOPE"}])
+
+        with self.assertRaises(MultiViewerForF1Error):
+            self.runner.run(plan)
+
+        mock_urlopen.assert_called_once()
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_run_reports_step_errors(self, mock_urlopen):
+        mock_urlopen.return_value = {
+            'data': None,
+            'errors': [{'message': 'Player not found', 'path': ['m0']}]
+        }
+
+        plan = Plan.from_data([{"action": "mute", "id": 12},
+                               {"action": "mute", "id": 13}])
+
+        report = self.runner.run(plan)
+
+        self.assertEqual(report[0]["error"], "Player not found")
+        self.assertIn("Not applied", report[1]["error"])
@@ -0,0 +1,92 @@
+import time
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from mvf1 import MultiViewerForF1
+from mvf1.poller import LiveTimingPoller
+
+from tests.helpers import timing_state
+
+
+class TestLiveTimingPoller(TestCase):
+    def setUp(self):
+        self.poller = LiveTimingPoller(MultiViewerForF1(), interval=0.01)
+
+    def test_unknown_series(self):
+        with self.assertRaises(ValueError):
+            LiveTimingPoller(MultiViewerForF1(), series=("motogp",))
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_add_series(self, mock_urlopen):
+        mock_urlopen.return_value = timing_state(1)
+
+        self.poller.add_series("fiawec")
+        self.poller.add_series("fiawec")
+        self.poller.poll_once()
+
+        self.assertEqual(self.poller.series, ("f1", "fiawec"))
+        self.assertIn("fiawec", str(mock_urlopen.call_args[0][0]))
+
+        with self.assertRaises(ValueError):
+            self.poller.add_series("motogp")
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_poll_once_versions(self, mock_urlopen):
+        mock_urlopen.side_effect = [timing_state(1), timing_state(1),
+                                    timing_state(2)]
+
+        self.assertEqual(len(self.poller.poll_once()), 1)
+        self.assertEqual(self.poller.poll_once(), [])
+        self.assertEqual(len(self.poller.poll_once()), 1)
+
+        snapshot = self.poller.snapshot("f1")
+
+        self.assertEqual(snapshot.version, 2)
+        self.assertEqual(snapshot.response, timing_state(2))
+        self.assertLess(snapshot.age, 1)
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_listeners(self, mock_urlopen):
+        mock_urlopen.side_effect = [timing_state(1), timing_state(2)]
+        changes = []
+
+        self.poller.add_listener(
+            lambda snapshot, previous: changes.append((snapshot, previous))
+        )
+        self.poller.poll_once()
+        self.poller.poll_once()
+
+        self.assertIsNone(changes[0][1])
+        self.assertEqual(changes[1][1].version, 1)
+        self.assertEqual(changes[1][0].version, 2)
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_start_stop(self, mock_urlopen):
+        mock_urlopen.return_value = timing_state(1)
+
+        self.poller.start()
+        self.poller.start()
+
+        deadline = time.monotonic() + 2
+
+        while self.poller.snapshot() is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.poller.stop()
+        self.assertTrue(self.poller.running)
+
+        self.poller.stop(timeout=1)
+        self.assertFalse(self.poller.running)
+        self.assertEqual(self.poller.snapshot().version, 1)
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_failed_poll_keeps_snapshot(self, mock_urlopen):
+        mock_urlopen.side_effect = [timing_state(1), Exception("Whoopsie")]
+
+        self.poller.poll_once()
+
+        with self.assertRaises(Exception):
+            self.poller.poll_once()
+
+        self.assertEqual(self.poller.snapshot().version, 1)
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from mvf1 import MultiViewerForF1
+from mvf1.archive import open_segment
+from mvf1.recorder import Recorder
+
+from tests.helpers import timing_state
+
+
+CLOCK = {'data': {'f1LiveTimingClock': {'paused': False,
+                                        'systemTime': 1000000,
+                                        'trackTime': 5000,
+                                        'liveTimingStartTime': 0}}}
+
+
+class TestRecorder(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "race")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_record(self, mock_urlopen):
+        mock_urlopen.side_effect = [CLOCK, timing_state(1),
+                                    CLOCK, timing_state(2)]
+
+        recorder = Recorder(self.path, remote=MultiViewerForF1(),
+                            compression="gzip")
+        recorder.poller.poll_once()
+        recorder.poller.poll_once()
+
+        self.assertEqual(recorder.queue.qsize(), 2)
+
+        recorder.queue.put(None)
+        recorder.run()
+        recorder.writer.close()
+
+        segment = recorder.writer.index["segments"][0]
+
+        with open_segment(os.path.join(self.path, segment["file"]), "r",
+                          "gzip") as f:
+            records = [json.loads(line) for line in f]
+
+        self.assertEqual(recorder.records, 2)
+        self.assertEqual(records[0]["state"],
+                         {'LapCount': {'CurrentLap': 1}})
+        self.assertEqual(records[1]["patch"], {'LapCount': {'CurrentLap': 2}})
+        self.assertIsNotNone(records[0]["track"])
+
+    @patch('sgqlc.endpoint.http.HTTPEndpoint.__call__')
+    def test_dropped_when_behind(self, mock_urlopen):
+        mock_urlopen.side_effect = [CLOCK, timing_state(1),
+                                    CLOCK, timing_state(2)]
+
+        recorder = Recorder(self.path, remote=MultiViewerForF1(),
+                            compression="gzip", queue_size=1)
+        recorder.poller.poll_once()
+        recorder.poller.poll_once()
+
+        self.assertEqual(recorder.records, 1)
+        self.assertEqual(recorder.dropped, 1)
+
+        recorder.writer.close()
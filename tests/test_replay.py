@@ -0,0 +1,192 @@
+import os
+import tempfile
+import time
+
+from functools import partial
+from unittest import TestCase
+
+from mvf1 import MultiViewerForF1
+from mvf1 import MultiViewerForF1Error
+from mvf1.archive import ArchiveReader
+from mvf1.archive import ArchiveWriter
+from mvf1.replay import ArchivePlayback
+from mvf1.replay import ReplayServer
+from mvf1.replay import SimulatedPlayers
+
+from tests.helpers import laps
+
+
+DRIVERS = {"1": {"RacingNumber": "1", "Tla": "VER", "FirstName": "Max",
+                 "LastName": "Verstappen", "TeamName": "Red Bull Racing"}}
+
+driver_laps = partial(laps, DriverList=DRIVERS)
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestArchivePlayback(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "race")
+
+        with ArchiveWriter(self.path, compression="gzip") as writer:
+            writer.write("f1", driver_laps(1), t=100.0, track=5000)
+            writer.write("f1", driver_laps(2), t=110.0, track=15000)
+            writer.write("f1", driver_laps(3, "4"), t=120.0, track=25000)
+
+        self.clock = Clock()
+        self.playback = ArchivePlayback(ArchiveReader(self.path), speed=2,
+                                        clock=self.clock)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_state(self):
+        self.assertEqual(self.playback.state("f1"), driver_laps(1))
+
+        self.clock.now += 5
+        self.assertEqual(self.playback.state("f1"), driver_laps(2))
+
+        self.clock.now += 100
+        self.assertEqual(self.playback.state("f1"), driver_laps(3, "4"))
+        self.assertIsNone(self.playback.state("fiawec"))
+
+    def test_live_timing_clock(self):
+        self.clock.now += 2.5
+        clock = self.playback.live_timing_clock()
+
+        self.assertEqual(clock, {"paused": False,
+                                 "systemTime": 1002500,
+                                 "trackTime": 10000,
+                                 "liveTimingStartTime": 5000})
+
+        self.clock.now += 100
+        self.assertTrue(self.playback.live_timing_clock()["paused"])
+        self.assertEqual(self.playback.live_timing_clock()["trackTime"],
+                         25000)
+
+    def test_speed(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            ArchivePlayback(ArchiveReader(self.path), speed=0)
+
+
+class TestReplayServer(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "race")
+
+        with ArchiveWriter(self.path, compression="gzip") as writer:
+            writer.write("f1", driver_laps(1), t=100.0, track=5000)
+            writer.write("f1", driver_laps(2), t=160.0, track=65000)
+
+        self.server = ReplayServer(
+            ArchivePlayback(ArchiveReader(self.path)),
+            create_lag=0.1,
+            port=0
+        )
+        self.server.start()
+        self.remote = MultiViewerForF1(self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+        self.directory.cleanup()
+
+    def create(self, **kwargs):
+        id = self.remote.player_create(1, **kwargs)["data"]["playerCreate"]
+        time.sleep(0.15)
+
+        return self.remote.player(id)
+
+    def test_live_timing(self):
+        state = self.remote.f1_live_timing_topics(["LapCount"])
+
+        self.assertEqual(
+            state["data"]["f1LiveTimingState"]["LapCount"]["CurrentLap"], 1
+        )
+        self.assertEqual(
+            self.remote.f1_live_timing_clock["data"]["f1LiveTimingClock"][
+                "liveTimingStartTime"
+            ],
+            5000
+        )
+
+    def test_player_create_lag(self):
+        id = self.remote.player_create(1, driver_tla="VER")["data"][
+            "playerCreate"
+        ]
+
+        self.assertEqual(self.remote.players, [])
+
+        with self.assertRaises(MultiViewerForF1Error):
+            self.remote.player(id)
+
+        time.sleep(0.15)
+        player = self.remote.player(id)
+
+        self.assertEqual(player.type, "OBC")
+        self.assertEqual(player.title, "VER")
+        self.assertEqual(player.driver_data["lastName"], "Verstappen")
+
+    def test_player_mutations(self):
+        player = self.create(stream_title="INTERNATIONAL", width=640,
+                             height=360)
+
+        self.assertEqual(player.type, "ADDITIONAL")
+        self.assertEqual((player.width, player.height), (640, 360))
+
+        player.set_volume(30)
+        player.pause(True)
+        player.seek(absolute=120)
+        player.set_bounds(x=10)
+        player.mute()
+
+        player = self.remote.player(player.id)
+
+        self.assertEqual(player.state["volume"], 30)
+        self.assertTrue(player.state["paused"])
+        self.assertTrue(player.state["muted"])
+        self.assertEqual(player.state["currentTime"], 120)
+        self.assertEqual((player.x, player.width), (10, 640))
+
+    def test_player_sync_and_delete(self):
+        first = self.create(stream_title="INTERNATIONAL")
+        second = self.create(driver_number=1)
+
+        first.pause(True)
+        first.seek(absolute=300)
+        second.pause(True)
+        first.sync()
+
+        self.assertEqual(
+            self.remote.player(second.id).state["currentTime"], 300
+        )
+
+        second.delete()
+
+        self.assertEqual([player.id for player in self.remote.players],
+                         [first.id])
+
+    def test_unknown_path(self):
+        remote = MultiViewerForF1(self.server.url.replace("graphql", "x"))
+
+        with self.assertRaises(Exception):
+            remote.version
+
+
+class TestSimulatedPlayers(TestCase):
+    def test_driver_data_without_timing(self):
+        players = SimulatedPlayers(create_lag=0)
+        id = players.create({"contentId": "1", "driverTla": "HAM"})
+
+        self.assertEqual(players.get(id).data()["driverData"]["tla"], "HAM")
+        self.assertEqual(players.get(id).data()["streamData"]["title"], "HAM")
+
+    def test_missing_player(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            SimulatedPlayers().get("7")
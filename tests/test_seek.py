@@ -0,0 +1,132 @@
+import os
+import tempfile
+
+from unittest import TestCase
+
+from mvf1 import MultiViewerForF1
+from mvf1 import MultiViewerForF1Error
+from mvf1.archive import ArchiveReader
+from mvf1.archive import ArchiveWriter
+from mvf1.events import RaceEvent
+from mvf1.replay import ReplayServer
+from mvf1.seek import SeekIndex
+
+from tests.helpers import snapshot
+
+
+def race(lap, status="1", messages=(), laps=None):
+    return {"LapCount": {"CurrentLap": lap, "TotalLaps": 57},
+            "TrackStatus": {"Status": status},
+            "TimingData": {"Lines": {"1": {"NumberOfLaps": lap - 1
+                                           if laps is None else laps}}},
+            "RaceControlMessages": {"Messages": list(messages)}}
+
+
+RED = {"Category": "Flag", "Flag": "RED", "Lap": 3,
+       "Message": "RED FLAG"}
+PENALTY = {"Category": "Other", "Lap": 4,
+           "Message": "5 SECOND TIME PENALTY FOR CAR 1 (VER)"}
+
+
+class TestSeekIndex(TestCase):
+    def setUp(self):
+        self.index = SeekIndex(offset=1000000)
+        self.index.ingest(race(1), 1000000)
+        self.index.ingest(race(1), 1030000)
+        self.index.ingest(race(2), 1090000)
+        self.index.ingest(race(3, "5", [RED]), 1180000)
+        self.index.ingest(race(4, "1", [RED, PENALTY]), 1270000)
+
+    def test_laps(self):
+        self.assertEqual(self.index.lap_track(1), 1000000)
+        self.assertEqual(self.index.lap_track(3), 1180000)
+        self.assertEqual(self.index.lap_track(3, driver=1), 1180000)
+        self.assertEqual(self.index.position(self.index.lap_track(2)), 90.0)
+
+        with self.assertRaises(MultiViewerForF1Error):
+            self.index.lap_track(10)
+
+    def test_events(self):
+        self.assertEqual([event["flag"] for event in self.index.events],
+                         ["GREEN", "RED", "RED", "GREEN", None])
+        self.assertEqual(self.index.event_track("RED"), 1180000)
+        self.assertEqual(self.index.event_track("GREEN", -1), 1270000)
+        self.assertEqual(self.index.event_track("time penalty"), 1270000)
+        self.assertEqual(self.index.event_track(RaceEvent(
+            "flag", data={"flag": "RED"})), 1180000)
+        self.assertEqual(len(self.index.events_between(1100000, 1200000)), 2)
+
+        with self.assertRaises(MultiViewerForF1Error):
+            self.index.event_track("SAFETY CAR DEPLOYED")
+
+    def test_position_lead(self):
+        self.assertEqual(self.index.position(1180000, lead=5), 175.0)
+        self.assertEqual(self.index.position(1000000, lead=5), 0.0)
+
+    def test_update(self):
+        index = SeekIndex()
+        clock = {"paused": True, "systemTime": 0, "trackTime": 1060000,
+                 "liveTimingStartTime": 1000000}
+
+        index.update(snapshot("clock", clock), None)
+        index.update(snapshot("f1", race(2)), None)
+
+        self.assertEqual(index.offset, 1000000)
+        self.assertEqual(index.position(index.lap_track(2)), 60.0)
+
+    def test_from_archive(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "race")
+
+            with ArchiveWriter(path, segment_seconds=10) as writer:
+                writer.write("f1", race(1), t=100.0, track=5000)
+                writer.write("f1", race(2), t=105.0, track=10000)
+                writer.write("f1", race(3, "5", [RED]), t=111.0, track=16000)
+
+            index = SeekIndex.from_archive(ArchiveReader(path))
+
+        self.assertEqual(index.offset, 5000)
+        self.assertEqual(index.laps, {1: 5000, 2: 10000, 3: 16000})
+        self.assertEqual(index.position(index.event_track("RED")), 11.0)
+
+
+class TestSeekPlayers(TestCase):
+    def setUp(self):
+        self.server = ReplayServer(create_lag=0, port=0)
+        self.server.start()
+        self.remote = MultiViewerForF1(self.server.url)
+
+        for title in ("INTERNATIONAL", "VER", "LEC"):
+            id = self.remote.player_create(1, stream_title=title)[
+                "data"]["playerCreate"]
+            self.remote.player_set_paused(id, True)
+
+        self.index = SeekIndex(offset=1000000)
+        self.index.ingest(race(1), 1000000)
+        self.index.ingest(race(2), 1090000)
+        self.index.ingest(race(3, "5", [RED]), 1180000)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def current_times(self):
+        return [player.state["currentTime"]
+                for player in self.remote.players]
+
+    def test_requires_index(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            self.remote.seek_all_to_lap(2)
+
+    def test_seek_all_to_event(self):
+        self.remote.seek_index = self.index
+        results = self.remote.seek_all_to_event("RED", lead=10)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(self.current_times(), [170.0] * 3)
+
+    def test_seek_to_lap(self):
+        self.remote.seek_index = self.index
+        self.remote.seek_all_to_lap(2)
+        self.remote.player("2").seek_to_lap(3)
+
+        self.assertEqual(self.current_times(), [90.0, 180.0, 90.0])
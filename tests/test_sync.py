@@ -0,0 +1,120 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from mvf1 import MultiViewerForF1
+from mvf1 import MultiViewerForF1Error
+from mvf1.replay import ReplayServer
+from mvf1.sync import SyncSupervisor
+from mvf1.sync import drift
+from mvf1.sync import find_reference
+
+
+def player(ts, current_time, paused=False):
+    return {"state": {"ts": ts, "currentTime": current_time,
+                      "paused": paused}}
+
+
+class TestDrift(TestCase):
+    def test_extrapolates_to_common_time(self):
+        self.assertEqual(drift(player(101.0, 51.0), player(100.0, 50.0)), 0.0)
+        self.assertEqual(drift(player(100.0, 52.5), player(100.0, 50.0)), 2.5)
+
+    def test_paused(self):
+        self.assertEqual(drift(player(101.0, 50.0, True),
+                               player(100.0, 50.0)), -1.0)
+
+
+class TestFindReference(TestCase):
+    def test_skips_loading_players(self):
+        loading = {"id": "1", "state": None,
+                   "streamData": {"title": "INTERNATIONAL"}}
+        ready = dict(player(100.0, 50.0), id="2",
+                     streamData={"title": "F1 LIVE"})
+
+        self.assertIs(find_reference([loading, ready]), ready)
+        self.assertIsNone(find_reference([loading, ready], "1"))
+
+
+class TestSyncSupervisor(TestCase):
+    def setUp(self):
+        self.server = ReplayServer(create_lag=0, port=0)
+        self.server.start()
+        self.remote = MultiViewerForF1(self.server.url)
+
+        for title, position in (("INTERNATIONAL", 60), ("VER", 63),
+                                ("LEC", 60.2)):
+            id = self.remote.player_create(1, stream_title=title)[
+                "data"]["playerCreate"]
+            self.remote.player_set_paused(id, True)
+            self.remote.player_seek_to(id, absolute=position)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def current_times(self):
+        return [round(data["state"]["currentTime"], 3) for data
+                in self.remote.players_data(["state.currentTime"])]
+
+    def test_corrects_after_samples(self):
+        supervisor = SyncSupervisor(self.remote, threshold=0.5, samples=2)
+
+        self.assertEqual(supervisor.check(0.0), [])
+        self.assertEqual(self.current_times(), [60.0, 63.0, 60.2])
+
+        results = supervisor.check(1.0)
+
+        self.assertEqual([result["id"] for result in results], ["2"])
+        self.assertEqual(self.current_times(), [60.0, 60.0, 60.2])
+
+        statistics = supervisor.statistics()
+
+        self.assertEqual(statistics["checks"], 2)
+        self.assertEqual(statistics["players"]["2"]["corrections"], 1)
+        self.assertAlmostEqual(statistics["players"]["2"]["max"], 3.0)
+        self.assertAlmostEqual(statistics["players"]["3"]["drift"], 0.2)
+
+    def test_cooldown(self):
+        supervisor = SyncSupervisor(self.remote, samples=1, cooldown=10)
+        supervisor.check(0.0)
+        self.remote.player_seek_to("2", absolute=65)
+
+        self.assertEqual(supervisor.check(5.0), [])
+        self.assertEqual(len(supervisor.check(10.0)), 1)
+        self.assertEqual(supervisor.corrections, {"2": 2})
+
+    def test_reference(self):
+        supervisor = SyncSupervisor(self.remote, reference="2", samples=1)
+        supervisor.check(0.0)
+
+        self.assertEqual(self.current_times(), [63.0, 63.0, 63.0])
+
+    def test_missing_reference(self):
+        supervisor = SyncSupervisor(self.remote, reference="9")
+
+        with self.assertRaises(MultiViewerForF1Error):
+            supervisor.check()
+
+    def test_loading_player(self):
+        loading = self.server.players.get("2")
+        data = loading.data
+
+        def unloaded():
+            return dict(data(), state=dict(data()["state"],
+                                           currentTime=None))
+
+        supervisor = SyncSupervisor(self.remote, samples=1)
+
+        with patch.object(loading, "data", unloaded):
+            self.assertEqual(supervisor.check(0.0), [])
+
+        self.assertEqual(set(supervisor.drifts), {"3"})
+        self.assertEqual([result["id"] for result in supervisor.check(1.0)],
+                         ["2"])
+
+    def test_forgets_closed_players(self):
+        supervisor = SyncSupervisor(self.remote)
+        supervisor.check(0.0)
+        self.remote.player_delete("3")
+        supervisor.check(1.0)
+
+        self.assertEqual(set(supervisor.statistics()["players"]), {"2"})
@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+
+from unittest import TestCase
+from unittest import skipUnless
+
+from mvf1 import MultiViewerForF1Error
+from mvf1.poller import Snapshot
+
+try:
+    import numpy
+    from mvf1.telemetry import TelemetryStore
+    from mvf1.telemetry import ColumnRing
+    from mvf1.telemetry import timestamp
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+f = open('tests/timing_state.json')
+timing_state = json.load(f)
+f.close()
+
+state = timing_state["data"]["f1LiveTimingState"]
+
+
+@skipUnless(numpy, "numpy is not installed")
+class TestColumnRing(TestCase):
+    def setUp(self):
+        self.ring = ColumnRing({"t": "f8", "v": "u2"}, capacity=3)
+
+    def test_wraps(self):
+        for t in range(5):
+            self.ring.append({"t": t, "v": t * 10})
+
+        self.assertEqual(len(self.ring), 3)
+        self.assertEqual(self.ring.last, 4.0)
+        self.assertEqual(self.ring.column("v").tolist(), [20, 30, 40])
+
+    def test_window(self):
+        for t in range(3):
+            self.ring.append({"t": t, "v": t * 10})
+
+        window = self.ring.window(start=1, end=1.5)
+
+        self.assertEqual(window["t"].tolist(), [1.0])
+        self.assertEqual(window["v"].tolist(), [10])
+
+
+@skipUnless(numpy, "numpy is not installed")
+class TestTelemetryStore(TestCase):
+    def setUp(self):
+        self.store = TelemetryStore(capacity=100)
+
+    def test_timestamp(self):
+        self.assertAlmostEqual(timestamp("1970-01-01T00:00:01.1234567Z"),
+                               1.1234567)
+
+    def test_ingest(self):
+        self.assertEqual(self.store.ingest(state), 6)
+        self.assertEqual(self.store.drivers, ["1", "11"])
+
+        car_data = self.store.car_data(11)
+
+        self.assertEqual(car_data["speed"].tolist(), [298, 250])
+        self.assertEqual(car_data["brake"].tolist(), [0, 100])
+        self.assertEqual(car_data["rpm"].dtype, numpy.uint16)
+        self.assertEqual(self.store.position("1")["x"].tolist(), [1200])
+
+    def test_ingest_skips_seen_samples(self):
+        self.store.ingest(state)
+
+        self.assertEqual(self.store.ingest(state), 0)
+        self.assertEqual(len(self.store.car_data("1")["t"]), 2)
+
+    def test_car_data_window(self):
+        self.store.ingest(state)
+        start = timestamp("2023-10-29T20:41:10.200Z")
+
+        self.assertEqual(self.store.car_data("1", start=start)["speed"]
+                         .tolist(), [305])
+
+    def test_unknown_driver(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            self.store.car_data(44)
+
+    def test_update(self):
+        self.store.update(Snapshot("f1", 1, timing_state, 0.0), None)
+        self.store.update(Snapshot("fiawec", 1, timing_state, 0.0), None)
+
+        self.assertEqual(len(self.store.car_data("1")["t"]), 2)
+
+    @skipUnless(pyarrow, "pyarrow is not installed")
+    def test_to_parquet(self):
+        import pyarrow.parquet
+
+        self.store.ingest(state)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "car_data.parquet")
+            self.store.to_parquet(path)
+            table = pyarrow.parquet.read_table(path)
+
+        self.assertEqual(table.num_rows, 4)
+        self.assertEqual(table.column("driver").to_pylist(),
+                         ["1", "1", "11", "11"])
+        self.assertEqual(self.store.to_arrow("position").num_rows, 2)
+
+    def test_to_arrow_unknown_kind(self):
+        with self.assertRaises(MultiViewerForF1Error):
+            self.store.to_arrow("laps")
@@ -0,0 +1,98 @@
+import json
+
+from unittest import TestCase
+
+from mvf1 import timing
+
+
+f = open('tests/timing_state.json')
+mock_timing_state = json.load(f)
+f.close()
+
+state = mock_timing_state['data']['f1LiveTimingState']
+
+
+class TestTiming(TestCase):
+    def test_values(self):
+        self.assertEqual(timing.values({"1": "b", "0": "a", "10": "c"}),
+                         ["a", "b", "c"])
+        self.assertEqual(timing.values(["a"]), ["a"])
+        self.assertEqual(timing.values(None), [])
+
+    def test_standings(self):
+        rows = timing.standings(state)
+
+        self.assertEqual([row["tla"] for row in rows],
+                         ["PER", "VER", "HAM", "LEC"])
+        self.assertEqual(rows[1]["interval"], "+0.812")
+        self.assertEqual(rows[1]["best_lap"], "1:20.812")
+        self.assertTrue(rows[2]["in_pit"])
+        self.assertTrue(rows[3]["retired"])
+
+    def test_track_status(self):
+        status = timing.track_status(state)
+
+        self.assertEqual(status["flag"], "GREEN")
+        self.assertEqual(status["lap"], 34)
+        self.assertEqual(status["session"], "Started")
+
+    def test_race_control_messages(self):
+        messages = timing.race_control_messages(state, limit=2)
+
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[0]["flag"], "YELLOW")
+        self.assertNotIn("flag", messages[1])
+
+    def test_weather(self):
+        weather = timing.weather(state)
+
+        self.assertEqual(weather["track_temp"], 43.1)
+        self.assertFalse(weather["rainfall"])
+
+    def test_tyre_stints(self):
+        stints = {row["tla"]: row for row in timing.tyre_stints(state)}
+
+        self.assertEqual(stints["VER"]["compound"], "HARD")
+        self.assertFalse(stints["VER"]["new"])
+        self.assertEqual(stints["HAM"]["stints"], ["SOFT", "MEDIUM"])
+
+    def test_pit_stops(self):
+        stops = {row["tla"]: row for row in timing.pit_stops(state)}
+
+        self.assertEqual(stops["HAM"]["lap"], 33)
+        self.assertEqual(stops["HAM"]["duration"], "21.874")
+        self.assertTrue(stops["HAM"]["in_pit"])
+        self.assertEqual(stops["PER"]["stops"], 1)
+
+    def test_empty_state(self):
+        self.assertEqual(timing.standings({}), [])
+        self.assertIsNone(timing.track_status({})["flag"])
+        self.assertEqual(timing.pit_stops({}), [])
+
+
+class TestResponses(TestCase):
+    def test_response_state(self):
+        self.assertEqual(timing.response_state(mock_timing_state), state)
+        self.assertEqual(timing.response_state({'data': None}), {})
+
+    def test_f1_state(self):
+        self.assertEqual(timing.f1_state(mock_timing_state), state)
+        self.assertEqual(timing.f1_state({'data': {'f1LiveTimingClock': {}}}),
+                         {})
+
+
+class TestTrackTime(TestCase):
+    def setUp(self):
+        self.clock = {'paused': False, 'systemTime': 1000000,
+                      'trackTime': 5000, 'liveTimingStartTime': 0}
+
+    def test_running(self):
+        self.assertEqual(timing.track_time(self.clock, 1002.5), 7500)
+
+    def test_paused(self):
+        self.clock['paused'] = True
+
+        self.assertEqual(timing.track_time(self.clock, 1002.5), 5000)
+
+    def test_no_clock(self):
+        self.assertIsNone(timing.track_time(None, 1002.5))